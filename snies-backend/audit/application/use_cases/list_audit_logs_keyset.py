@@ -0,0 +1,49 @@
+from datetime import datetime
+
+from audit.domain.ports.audit_query_repository import AuditLogPosition, AuditQueryRepository
+
+COUNT_MODES = ("estimated", "exact", "none")
+
+
+class ListAuditLogsKeysetUseCase:
+    """
+    Cursor listing of audit logs: cost does not grow with the page depth.
+    count_mode: "estimated" (planner stats on big results), "exact" or "none".
+    """
+
+    def __init__(self, audit_query_repository: AuditQueryRepository):
+        self.audit_query_repository = audit_query_repository
+
+    def execute(
+        self,
+        page_size: int,
+        after: AuditLogPosition | None = None,
+        count_mode: str = "estimated",
+        action: str | None = None,
+        module: str | None = None,
+        user_email: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> dict:
+        filters = dict(
+            action=action,
+            module=module,
+            user_email=user_email,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        results, next_position = self.audit_query_repository.list_after(
+            page_size=page_size, after=after, **filters
+        )
+
+        count, estimated = None, False
+        if count_mode != "none":
+            count, estimated = self.audit_query_repository.count(
+                estimate=count_mode == "estimated", **filters
+            )
+        return {
+            "results": results,
+            "next": next_position,
+            "count": count,
+            "count_estimated": estimated,
+        }
@@ -3,6 +3,19 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime
 
+# Position of the last row of a keyset page: (created_at, id)
+AuditLogPosition = tuple[datetime, int]
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 200
+
+
+def clamp_page_size(page_size: int) -> int:
+    """Page size actually served by the listings (the one to report back to clients)."""
+    if page_size < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(page_size, MAX_PAGE_SIZE)
+
 
 class AuditQueryRepository(ABC):
     @abstractmethod
@@ -19,3 +32,32 @@ class AuditQueryRepository(ABC):
         """Returns (total_count, results_page). Each result is a dict ready for JSON."""
         raise NotImplementedError
 
+    @abstractmethod
+    def list_after(
+        self,
+        page_size: int,
+        after: AuditLogPosition | None = None,
+        action: str | None = None,
+        module: str | None = None,
+        user_email: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> tuple[list[dict], AuditLogPosition | None]:
+        """
+        Keyset page ordered by (created_at, id) desc, starting after `after`.
+        Returns (results_page, position of the last row or None when there are no more rows).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(
+        self,
+        action: str | None = None,
+        module: str | None = None,
+        user_email: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        estimate: bool = False,
+    ) -> tuple[int, bool]:
+        """Returns (count, is_estimate). With estimate=True the backend may use planner stats."""
+        raise NotImplementedError
@@ -10,3 +10,7 @@ class AuditRepository(ABC):
     def create(self, log: AuditLog) -> AuditLog:
         raise NotImplementedError
 
+
+    @abstractmethod
+    def bulk_create(self, logs: list[AuditLog]) -> int:
+        raise NotImplementedError
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import replace
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+
+from audit.domain.entities.audit_log import AuditLog
+from audit.domain.ports.audit_repository import AuditRepository
+from audit.infraestructure.persistence.django.audit_repository import DjangoAuditRepository
+
+logger = logging.getLogger(__name__)
+
+
+class AuditLogWriter:
+    """
+    In-process audit sink: bounded queue + background flusher thread.
+    - Entries are written with bulk_create when batch_size is reached or every flush_interval.
+    - If the queue is full the entry is written synchronously (nothing is dropped).
+    - Pending entries are drained at interpreter shutdown (atexit).
+    """
+
+    def __init__(
+        self,
+        repository: AuditRepository,
+        max_queue_size: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+    ):
+        self.repository = repository
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.05, float(flush_interval))
+        self._queue: queue.Queue[AuditLog] = queue.Queue(maxsize=max(1, int(max_queue_size)))
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def enqueue(self, log: AuditLog) -> None:
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(log)
+        except queue.Full:
+            self.repository.create(log)
+
+    def _ensure_started(self) -> None:
+        # Re-create the thread after a fork (gunicorn workers)
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+            self._stop.clear()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while not self._stop.is_set():
+                batch = self._collect()
+                if batch:
+                    self._flush(batch)
+        finally:
+            connection.close()
+
+    def _collect(self) -> list[AuditLog]:
+        batch: list[AuditLog] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self._stop.is_set():
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list[AuditLog]) -> None:
+        close_old_connections()
+        try:
+            self.repository.bulk_create(batch)
+        except Exception:
+            logger.exception("Audit batch write failed (%s entries)", len(batch))
+
+    def drain(self) -> None:
+        """Stop the flusher and write everything still queued (called at shutdown)."""
+        self._stop.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout=self.flush_interval + 5)
+
+        pending: list[AuditLog] = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        for start in range(0, len(pending), self.batch_size):
+            self._flush(pending[start : start + self.batch_size])
+
+
+class AsyncAuditRepository(AuditRepository):
+    """AuditRepository that hands entries to the process-wide AuditLogWriter."""
+
+    def __init__(self, writer: AuditLogWriter):
+        self.writer = writer
+
+    def create(self, log: AuditLog) -> AuditLog:
+        # Stamp the request time now; the row is inserted later by the flusher
+        if log.created_at is None:
+            log = replace(log, created_at=timezone.now())
+        self.writer.enqueue(log)
+        return log
+
+    def bulk_create(self, logs: list[AuditLog]) -> int:
+        for log in logs:
+            self.create(log)
+        return len(logs)
+
+
+_writer: AuditLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AuditLogWriter(
+                    repository=DjangoAuditRepository(),
+                    max_queue_size=getattr(settings, "AUDIT_ASYNC_QUEUE_SIZE", 1000),
+                    batch_size=getattr(settings, "AUDIT_ASYNC_BATCH_SIZE", 100),
+                    flush_interval=getattr(settings, "AUDIT_ASYNC_FLUSH_INTERVAL", 1.0),
+                )
+                atexit.register(_writer.drain)
+    return _writer
+
+
+def get_audit_repository() -> AuditRepository:
+    """Repository used by AuditedAPIView: async sink unless AUDIT_ASYNC_ENABLED is off."""
+    if getattr(settings, "AUDIT_ASYNC_ENABLED", True):
+        return AsyncAuditRepository(get_audit_writer())
+    return DjangoAuditRepository()
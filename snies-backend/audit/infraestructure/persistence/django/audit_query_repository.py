@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import json
 from datetime import datetime
 
-from audit.domain.ports.audit_query_repository import AuditQueryRepository
+from django.db import connection
+from django.db.models import Q
+
+from audit.domain.ports.audit_query_repository import (
+    AuditLogPosition,
+    AuditQueryRepository,
+    clamp_page_size,
+)
 from audit.infraestructure.persistence.django.models import AuditLogModel
 
+# Below this planner estimate an exact COUNT(*) is cheap enough to run
+EXACT_COUNT_THRESHOLD = 10000
+
 
 class DjangoAuditQueryRepository(AuditQueryRepository):
     def list_paginated(
@@ -19,13 +30,61 @@ class DjangoAuditQueryRepository(AuditQueryRepository):
     ) -> tuple[int, list[dict]]:
         if page < 1:
             page = 1
-        if page_size < 1:
-            page_size = 20
-        if page_size > 200:
-            page_size = 200
+        page_size = clamp_page_size(page_size)
+
+        # Same order as the keyset listing: on the partitioned table (created_at) lets
+        # PostgreSQL read the newest partitions first and prune by from/to
+        qs = self._filtered(action, module, user_email, date_from, date_to).order_by(
+            "-created_at", "-id"
+        )
+
+        total = qs.count()
+        offset = (page - 1) * page_size
+        items = qs[offset : offset + page_size]
+        return total, [self._to_dict(m) for m in items]
 
-        qs = AuditLogModel.objects.all().order_by("-id")
+    def list_after(
+        self,
+        page_size: int,
+        after: AuditLogPosition | None = None,
+        action: str | None = None,
+        module: str | None = None,
+        user_email: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+    ) -> tuple[list[dict], AuditLogPosition | None]:
+        page_size = clamp_page_size(page_size)
 
+        qs = self._filtered(action, module, user_email, date_from, date_to)
+        if after is not None:
+            created_at, last_id = after
+            qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id))
+
+        # One extra row tells whether there is a next page without counting
+        items = list(qs.order_by("-created_at", "-id")[: page_size + 1])
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        position = (items[-1].created_at, items[-1].id) if has_more else None
+        return [self._to_dict(m) for m in items], position
+
+    def count(
+        self,
+        action: str | None = None,
+        module: str | None = None,
+        user_email: str | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        estimate: bool = False,
+    ) -> tuple[int, bool]:
+        qs = self._filtered(action, module, user_email, date_from, date_to)
+        if estimate and connection.vendor == "postgresql":
+            estimated = self._planner_estimate(qs)
+            if estimated is not None and estimated >= EXACT_COUNT_THRESHOLD:
+                return estimated, True
+        return qs.count(), False
+
+    def _filtered(self, action, module, user_email, date_from, date_to):
+        qs = AuditLogModel.objects.all()
         if action:
             qs = qs.filter(action=action)
         if module:
@@ -36,31 +95,38 @@ class DjangoAuditQueryRepository(AuditQueryRepository):
             qs = qs.filter(created_at__gte=date_from)
         if date_to:
             qs = qs.filter(created_at__lte=date_to)
+        return qs
 
-        total = qs.count()
-        offset = (page - 1) * page_size
-        items = qs[offset : offset + page_size]
-
-        results = [
-            {
-                "id": m.id,
-                "created_at": m.created_at.isoformat() if m.created_at else None,
-                "action": m.action,
-                "method": m.method,
-                "path": m.path,
-                "status_code": m.status_code,
-                "user_id": m.user_id,
-                "user_email": m.user_email,
-                "user_role": m.user_role,
-                "ip": m.ip,
-                "user_agent": m.user_agent,
-                "view_name": m.view_name,
-                "module": m.module,
-                "resource_id": m.resource_id,
-                "request_data": m.request_data,
-                "response_data": m.response_data,
-            }
-            for m in items
-        ]
-        return total, results
+    def _planner_estimate(self, qs) -> int | None:
+        """Row estimate from EXPLAIN (table statistics), no scan of audit_logs."""
+        sql, params = qs.values("id").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            row = cursor.fetchone()
+        if not row:
+            return None
+        plan = row[0] if not isinstance(row[0], str) else json.loads(row[0])
+        try:
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
 
+    def _to_dict(self, m: AuditLogModel) -> dict:
+        return {
+            "id": m.id,
+            "created_at": m.created_at.isoformat() if m.created_at else None,
+            "action": m.action,
+            "method": m.method,
+            "path": m.path,
+            "status_code": m.status_code,
+            "user_id": m.user_id,
+            "user_email": m.user_email,
+            "user_role": m.user_role,
+            "ip": m.ip,
+            "user_agent": m.user_agent,
+            "view_name": m.view_name,
+            "module": m.module,
+            "resource_id": m.resource_id,
+            "request_data": m.request_data,
+            "response_data": m.response_data,
+        }
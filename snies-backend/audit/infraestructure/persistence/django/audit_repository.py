@@ -5,7 +5,19 @@ from audit.infraestructure.persistence.django.models import AuditLogModel
 
 class DjangoAuditRepository(AuditRepository):
     def create(self, log: AuditLog) -> AuditLog:
-        m = AuditLogModel.objects.create(
+        m = AuditLogModel.objects.create(**self._to_fields(log))
+        return self._to_domain(m)
+
+    def bulk_create(self, logs: list[AuditLog]) -> int:
+        if not logs:
+            return 0
+        created = AuditLogModel.objects.bulk_create(
+            [AuditLogModel(**self._to_fields(log)) for log in logs]
+        )
+        return len(created)
+
+    def _to_fields(self, log: AuditLog) -> dict:
+        fields = dict(
             action=log.action,
             method=log.method,
             path=log.path,
@@ -21,6 +33,11 @@ class DjangoAuditRepository(AuditRepository):
             request_data=log.request_data,
             response_data=log.response_data,
         )
+        if log.created_at is not None:
+            fields["created_at"] = log.created_at
+        return fields
+
+    def _to_domain(self, m: AuditLogModel) -> AuditLog:
         return AuditLog(
             id=m.id,
             created_at=m.created_at,
@@ -1,9 +1,13 @@
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
+from django.utils import timezone
 
 
 class AuditLogModel(models.Model):
     id = models.BigAutoField(primary_key=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # default (not auto_now_add) so queued entries keep the request timestamp
+    created_at = models.DateTimeField(default=timezone.now)
 
     action = models.CharField(max_length=20)
     method = models.CharField(max_length=10)
@@ -30,5 +34,12 @@ class AuditLogModel(models.Model):
             models.Index(fields=["user_id"]),
             models.Index(fields=["module"]),
             models.Index(fields=["action"]),
+            # keyset listing: ORDER BY created_at DESC, id DESC, alone or with a filter
+            models.Index(fields=["created_at", "id"], name="audit_logs_created_id_idx"),
+            models.Index(fields=["module", "created_at"], name="audit_logs_module_created_idx"),
+            # user_email is filtered with iexact -> UPPER(user_email)
+            models.Index(
+                Upper("user_email"), F("created_at"), name="audit_logs_email_created_idx"
+            ),
         ]
 
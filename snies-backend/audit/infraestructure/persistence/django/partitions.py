@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import re
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from pathlib import Path
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from audit.infraestructure.persistence.django.models import AuditLogModel
+
+logger = logging.getLogger(__name__)
+
+TABLE = AuditLogModel._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+_PARTITION_RE = re.compile(rf"^{TABLE}_(\d{{4}})_(\d{{2}})$")
+_ARCHIVE_CHUNK = 2000
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    name: str
+    start: date  # first day of the month (inclusive)
+    end: date  # first day of the next month (exclusive)
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_partition(value: date) -> MonthPartition:
+    start = month_start(value)
+    return MonthPartition(name=f"{TABLE}_{start:%Y_%m}", start=start, end=add_months(start, 1))
+
+
+def _bound(value: date) -> datetime:
+    return timezone.make_aware(datetime.combine(value, time.min), timezone.get_current_timezone())
+
+
+def is_partitioned() -> bool:
+    """True cuando audit_logs es una tabla particionada (solo PostgreSQL)."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return bool(row and row[0] == "p")
+
+
+def list_partitions() -> list[MonthPartition]:
+    """Particiones mensuales adjuntas a audit_logs, ordenadas por mes."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    partitions = []
+    for name in names:
+        match = _PARTITION_RE.match(name)
+        if match:
+            partitions.append(month_partition(date(int(match[1]), int(match[2]), 1)))
+    return sorted(partitions, key=lambda p: p.start)
+
+
+def create_partition(partition: MonthPartition) -> bool:
+    """
+    Crea la particion del mes si no existe. Las filas que hubieran caido en la particion
+    default para ese rango se mueven antes de adjuntarla. Devuelve True si la creo.
+    """
+    qn = connection.ops.quote_name
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("SELECT to_regclass(%s)", [partition.name])
+        if cursor.fetchone()[0] is not None:
+            return False
+        start, end = _bound(partition.start), _bound(partition.end)
+        cursor.execute(f"CREATE TABLE {qn(partition.name)} (LIKE {qn(TABLE)} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {qn(DEFAULT_PARTITION)}
+                WHERE created_at >= %s AND created_at < %s
+                RETURNING *
+            )
+            INSERT INTO {qn(partition.name)} SELECT * FROM moved
+            """,
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {qn(TABLE)} ATTACH PARTITION {qn(partition.name)} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    return True
+
+
+def ensure_partitions(months_ahead: int, today: date | None = None) -> list[str]:
+    """Crea las particiones del mes actual y de los `months_ahead` meses siguientes."""
+    current = month_start(today or timezone.localdate())
+    created = []
+    for offset in range(max(0, months_ahead) + 1):
+        partition = month_partition(add_months(current, offset))
+        if create_partition(partition):
+            created.append(partition.name)
+    return created
+
+
+def expired_partitions(retention_months: int, today: date | None = None) -> list[MonthPartition]:
+    """Particiones cuyo mes completo quedo fuera de la ventana de retencion."""
+    cutoff = add_months(month_start(today or timezone.localdate()), -retention_months)
+    return [p for p in list_partitions() if p.end <= cutoff]
+
+
+def archive_rows(sql: str, params: list, path: Path) -> int:
+    """Escribe las filas del SELECT en `path` como JSONL comprimido (gzip). Devuelve filas."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".part")
+    written = 0
+    # Cursor con nombre (server-side) para no cargar la particion completa en memoria
+    with transaction.atomic(), connection.chunked_cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = None
+        with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+            while True:
+                rows = cursor.fetchmany(_ARCHIVE_CHUNK)
+                if not rows:
+                    break
+                if columns is None:
+                    columns = [col[0] for col in cursor.description]
+                for row in rows:
+                    fh.write(json.dumps(dict(zip(columns, row)), default=str))
+                    fh.write("\n")
+                    written += 1
+    tmp.replace(path)
+    return written
+
+
+def detach_and_archive(partition: MonthPartition, archive_dir: Path | None) -> int:
+    """
+    Exporta la particion a <archive_dir>/<nombre>.jsonl.gz y despues la separa de audit_logs
+    y la elimina. Sin archive_dir solo se elimina. Si el archivo falla no se toca la tabla.
+    """
+    qn = connection.ops.quote_name
+    rows = 0
+    if archive_dir is not None:
+        rows = archive_rows(
+            f"SELECT * FROM {qn(partition.name)} ORDER BY created_at, id",
+            [],
+            archive_dir / f"{partition.name}.jsonl.gz",
+        )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {qn(TABLE)} DETACH PARTITION {qn(partition.name)}")
+        cursor.execute(f"DROP TABLE {qn(partition.name)}")
+    logger.info("Audit partition %s archived (%s rows) and dropped", partition.name, rows)
+    return rows
+
+
+def purge_unpartitioned(retention_months: int, archive_dir: Path | None, today=None) -> int:
+    """
+    Retencion para bases sin particiones (sqlite/desarrollo): archiva y borra las filas
+    anteriores al corte, mes por mes.
+    """
+    cutoff = add_months(month_start(today or timezone.localdate()), -retention_months)
+    oldest = AuditLogModel.objects.order_by("created_at").values_list("created_at", flat=True)
+    first = oldest.first()
+    if first is None:
+        return 0
+
+    total = 0
+    month = month_start(timezone.localtime(first).date())
+    while month < cutoff:
+        partition = month_partition(month)
+        qs = AuditLogModel.objects.filter(
+            created_at__gte=_bound(partition.start), created_at__lt=_bound(partition.end)
+        )
+        if archive_dir is not None and qs.exists():
+            sql, params = qs.order_by("created_at", "id").query.sql_with_params()
+            archive_rows(sql, list(params), archive_dir / f"{partition.name}.jsonl.gz")
+        total += qs.delete()[0]
+        month = partition.end
+    return total
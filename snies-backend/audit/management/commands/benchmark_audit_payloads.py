@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import timeit
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from audit.presentation.payload_sanitizer import SENSITIVE_KEYS, sanitize_payload
+
+
+# Previous AuditedAPIView path (_sanitize + _jsonable), kept here only for comparison.
+def _legacy_sanitize(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            if str(k).lower() in SENSITIVE_KEYS:
+                out[k] = "***"
+            else:
+                out[k] = _legacy_sanitize(v)
+        return out
+    if isinstance(obj, list):
+        return [_legacy_sanitize(x) for x in obj]
+    return obj
+
+
+def _legacy_jsonable(obj: Any) -> Any:
+    try:
+        json.dumps(obj)
+        return obj
+    except Exception:
+        return json.loads(json.dumps(obj, default=str))
+
+
+def _payloads(rows: int) -> dict[str, Any]:
+    row = {
+        "id": 1,
+        "year": "2025",
+        "semester": 1,
+        "activity_name": "Jornada de actualizacion en software",
+        "start_date": date(2025, 2, 3),
+        "end_date": date(2025, 2, 7),
+        "value": Decimal("1250000.50"),
+        "created_at": datetime(2025, 2, 1, 12, 30, tzinfo=timezone.utc),
+        "beneficiary_breakdowns": [
+            {"population": "students", "campus": "CUCUTA", "program": "Sistemas", "count": 12},
+            {"population": "graduates", "campus": "OCANA", "program": "Sistemas", "count": 3},
+        ],
+    }
+    return {
+        "small_plain": {"name": "Curso", "code": "C001", "is_active": True, "hours": 40},
+        "small_with_secret": {"email": "a@b.co", "password": "secret", "token": "abc"},
+        "decimal_dates": dict(row),
+        f"bulk_{rows}_rows": {"created": rows, "results": [dict(row, id=i) for i in range(rows)]},
+    }
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark: sanitize_payload vs previous _sanitize + _jsonable audit path."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+        parser.add_argument("--number", type=int, default=0, help="Iterations (0 = auto)")
+        parser.add_argument("--max-bytes", type=int, default=65536)
+
+    def handle(self, *args, **options):
+        max_bytes = options["max_bytes"]
+        for name, payload in _payloads(options["rows"]).items():
+            legacy = lambda p=payload: _legacy_jsonable(_legacy_sanitize(p))  # noqa: E731
+            single = lambda p=payload: sanitize_payload(p)  # noqa: E731
+            capped = lambda p=payload: sanitize_payload(p, max_bytes)  # noqa: E731
+
+            number = options["number"] or self._auto_number(legacy)
+            results = {
+                "legacy": min(timeit.repeat(legacy, number=number, repeat=3)) / number,
+                "single_pass": min(timeit.repeat(single, number=number, repeat=3)) / number,
+                f"capped_{max_bytes}": min(timeit.repeat(capped, number=number, repeat=3)) / number,
+            }
+            size = len(json.dumps(sanitize_payload(payload, max_bytes)))
+            self.stdout.write(f"{name} (stored ~{size} bytes with cap)")
+            for label, seconds in results.items():
+                speedup = results["legacy"] / seconds if seconds else 0
+                self.stdout.write(f"  {label:<18} {seconds * 1e6:12.1f} us/call  x{speedup:.2f}")
+
+    def _auto_number(self, fn) -> int:
+        seconds = timeit.timeit(fn, number=1) or 1e-6
+        return max(1, min(10000, int(0.2 / seconds)))
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from audit.infraestructure.persistence.django.partitions import (
+    detach_and_archive,
+    ensure_partitions,
+    expired_partitions,
+    is_partitioned,
+    purge_unpartitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Crea por adelantado las particiones mensuales de audit_logs y archiva (JSONL gzip) "
+        "y elimina las que superan la ventana de retencion."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=getattr(settings, "AUDIT_PARTITION_MONTHS_AHEAD", 3),
+            help="Meses futuros a crear ademas del actual.",
+        )
+        parser.add_argument(
+            "--retention-months",
+            type=int,
+            default=getattr(settings, "AUDIT_RETENTION_MONTHS", 12),
+            help="Meses completos que se conservan en la base (0 = no eliminar).",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=str(getattr(settings, "AUDIT_ARCHIVE_DIR", "")),
+            help="Directorio de los archivos .jsonl.gz.",
+        )
+        parser.add_argument(
+            "--no-archive",
+            action="store_true",
+            help="Elimina las particiones vencidas sin generar archivo.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Solo muestra lo que se haria.")
+
+    def handle(self, *args, **options):
+        retention = options["retention_months"]
+        archive_dir = None
+        if not options["no_archive"]:
+            if not options["archive_dir"]:
+                raise CommandError("Defina AUDIT_ARCHIVE_DIR o use --archive-dir / --no-archive")
+            archive_dir = Path(options["archive_dir"])
+
+        if not is_partitioned():
+            self._purge_unpartitioned(retention, archive_dir, options["dry_run"])
+            return
+
+        if options["dry_run"]:
+            self.stdout.write(f"Se asegurarian {options['months_ahead'] + 1} particion(es)")
+        else:
+            for name in ensure_partitions(options["months_ahead"]):
+                self.stdout.write(f"Creada {name}")
+
+        if retention <= 0:
+            return
+        for partition in expired_partitions(retention):
+            if options["dry_run"]:
+                self.stdout.write(f"Vencida {partition.name}")
+                continue
+            try:
+                rows = detach_and_archive(partition, archive_dir)
+            except Exception as exc:
+                raise CommandError(f"No se pudo archivar {partition.name}: {exc}") from exc
+            self.stdout.write(f"Archivada y eliminada {partition.name} ({rows} filas)")
+        self.stdout.write(self.style.SUCCESS("Particiones de auditoria al dia"))
+
+    def _purge_unpartitioned(self, retention: int, archive_dir: Path | None, dry_run: bool):
+        self.stdout.write("audit_logs no esta particionada (solo PostgreSQL); se aplica retencion")
+        if retention <= 0 or dry_run:
+            return
+        deleted = purge_unpartitioned(retention, archive_dir)
+        self.stdout.write(self.style.SUCCESS(f"{deleted} registro(s) archivados y eliminados"))
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:26
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("audit", "0002_audit_log_created_at_default"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="auditlogmodel",
+            index=models.Index(fields=["created_at", "id"], name="audit_logs_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogmodel",
+            index=models.Index(
+                fields=["module", "created_at"], name="audit_logs_module_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlogmodel",
+            index=models.Index(
+                django.db.models.functions.text.Upper("user_email"),
+                models.F("created_at"),
+                name="audit_logs_email_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,87 @@
+from datetime import date
+
+from django.db import migrations
+
+TABLE = "audit_logs"
+LEGACY = "audit_logs_unpartitioned"
+SEQUENCE = "audit_logs_id_seq"
+
+
+def _months(cursor):
+    """Meses con datos + mes actual y los 3 siguientes."""
+    cursor.execute(f"SELECT min(created_at) FROM {LEGACY}")
+    oldest = cursor.fetchone()[0]
+    today = date.today()
+    first = date(oldest.year, oldest.month, 1) if oldest else date(today.year, today.month, 1)
+    last_index = today.year * 12 + today.month - 1 + 3
+    index = first.year * 12 + first.month - 1
+    while index <= last_index:
+        yield date(index // 12, index % 12 + 1, 1), date((index + 1) // 12, (index + 1) % 12 + 1, 1)
+        index += 1
+
+
+def _recreate_indexes(apps, schema_editor):
+    model = apps.get_model("audit", "AuditLogModel")
+    for index in model._meta.indexes:
+        schema_editor.add_index(model, index)
+
+
+def partition_audit_logs(apps, schema_editor):
+    # Particionado declarativo: solo PostgreSQL (sqlite/otros quedan con la tabla simple)
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}")
+        cursor.execute(f"ALTER TABLE {LEGACY} RENAME CONSTRAINT {TABLE}_pkey TO {LEGACY}_pkey")
+        # PostgreSQL < 17 no admite columnas IDENTITY en tablas particionadas: id usa secuencia
+        cursor.execute(f"ALTER TABLE {LEGACY} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+        cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {SEQUENCE}")
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+        cursor.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        # La clave de particion debe formar parte de la PK
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, created_at)"
+        )
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        for start, end in list(_months(cursor)):
+            cursor.execute(
+                f"CREATE TABLE {TABLE}_{start:%Y_%m} PARTITION OF {TABLE} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [start.isoformat(), end.isoformat()],
+            )
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {LEGACY}")
+        cursor.execute(f"SELECT setval('{SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}")
+        cursor.execute(f"DROP TABLE {LEGACY}")
+    _recreate_indexes(apps, schema_editor)
+
+
+def unpartition_audit_logs(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}")
+        cursor.execute(f"ALTER TABLE {LEGACY} RENAME CONSTRAINT {TABLE}_pkey TO {LEGACY}_pkey")
+        cursor.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY NONE")
+        cursor.execute(f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS)")
+        cursor.execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id)")
+        cursor.execute(f"INSERT INTO {TABLE} SELECT * FROM {LEGACY}")
+        cursor.execute(f"ALTER SEQUENCE {SEQUENCE} OWNED BY {TABLE}.id")
+        cursor.execute(f"DROP TABLE {LEGACY} CASCADE")
+    _recreate_indexes(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+    # Copia toda la tabla: en bases grandes conviene ejecutarla en una ventana de mantenimiento
+    atomic = True
+
+    dependencies = [
+        ("audit", "0003_audit_logs_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_audit_logs, unpartition_audit_logs),
+    ]
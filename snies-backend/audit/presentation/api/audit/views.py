@@ -5,16 +5,36 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from audit.application.use_cases.list_audit_logs import ListAuditLogsUseCase
+from audit.application.use_cases.list_audit_logs_keyset import (
+    COUNT_MODES,
+    ListAuditLogsKeysetUseCase,
+)
+from audit.domain.ports.audit_query_repository import clamp_page_size
 from audit.infraestructure.persistence.django.audit_query_repository import (
     DjangoAuditQueryRepository,
 )
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import decode_cursor, encode_cursor
 from users.presentation.permissions import HasModulePermission
 
 
+def _parse_dt(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    v = value.strip()
+    if v.endswith("Z"):
+        v = v[:-1] + "+00:00"
+    return datetime.fromisoformat(v)
+
+
 class AuditLogListAPIView(AuditedAPIView):
     """
     GET /api/audit/logs/?page=1&page_size=50&action=create&module=wellbeing&user_email=a@b.com&from=2026-01-01T00:00:00Z&to=2026-01-31T23:59:59Z
+
+    Cursor mode (deep pages cost the same as the first one):
+    GET /api/audit/logs/?cursor=&page_size=50&count=estimated|exact|none&...filters
+      -> {"count", "count_estimated", "page_size", "next_cursor", "results"}
+    Pass next_cursor back as ?cursor= to get the following page (null = last page).
     """
 
     permission_classes = [IsAuthenticated, HasModulePermission]
@@ -25,19 +45,12 @@ class AuditLogListAPIView(AuditedAPIView):
     audit_enabled = False
 
     def get(self, request):
-        def _parse_dt(value: str | None) -> datetime | None:
-            if not value:
-                return None
-            v = value.strip()
-            if v.endswith("Z"):
-                v = v[:-1] + "+00:00"
-            return datetime.fromisoformat(v)
-
         try:
             page = int(request.query_params.get("page", "1"))
             page_size = int(request.query_params.get("page_size", "50"))
         except ValueError:
             return Response({"error": "Invalid pagination params"}, status=status.HTTP_400_BAD_REQUEST)
+        page_size = clamp_page_size(page_size)
 
         action = request.query_params.get("action")
         module = request.query_params.get("module")
@@ -48,6 +61,17 @@ class AuditLogListAPIView(AuditedAPIView):
         except ValueError:
             return Response({"error": "Invalid datetime params"}, status=status.HTTP_400_BAD_REQUEST)
 
+        if "cursor" in request.query_params:
+            return self._list_keyset(
+                request,
+                page_size=page_size,
+                action=action,
+                module=module,
+                user_email=user_email,
+                date_from=date_from,
+                date_to=date_to,
+            )
+
         use_case = ListAuditLogsUseCase(audit_query_repository=DjangoAuditQueryRepository())
         total, results = use_case.execute(
             page=page,
@@ -63,3 +87,25 @@ class AuditLogListAPIView(AuditedAPIView):
             status=status.HTTP_200_OK,
         )
 
+    def _list_keyset(self, request, page_size: int, **filters):
+        try:
+            after = decode_cursor(request.query_params.get("cursor", "").strip(), timestamped=True)
+        except ValueError:
+            return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        count_mode = request.query_params.get("count", "estimated")
+        if count_mode not in COUNT_MODES:
+            return Response({"error": "Invalid count param"}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = ListAuditLogsKeysetUseCase(audit_query_repository=DjangoAuditQueryRepository())
+        page = use_case.execute(page_size=page_size, after=after, count_mode=count_mode, **filters)
+        return Response(
+            {
+                "count": page["count"],
+                "count_estimated": page["count_estimated"],
+                "page_size": page_size,
+                "next_cursor": encode_cursor(page["next"]),
+                "results": page["results"],
+            },
+            status=status.HTTP_200_OK,
+        )
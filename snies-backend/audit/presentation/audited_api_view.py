@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 
+from django.conf import settings
 from rest_framework.views import APIView
 
 from audit.application.use_cases.create_audit_log import CreateAuditLogUseCase
 from audit.domain.entities.audit_log import AuditLog
-from audit.infraestructure.persistence.django.audit_repository import DjangoAuditRepository
+from audit.infraestructure.persistence.django.async_audit_repository import get_audit_repository
+from audit.presentation.payload_sanitizer import sanitize_payload
 from notifications.application.use_cases.create_notification import CreateNotificationUseCase
 from notifications.domain.entities.notification import Notification
 from notifications.infraestructure.persistence.django.notification_repository import (
@@ -15,32 +16,6 @@ from notifications.infraestructure.persistence.django.notification_repository im
 )
 
 
-SENSITIVE_KEYS = {"password", "access", "refresh", "token"}
-
-
-def _sanitize(obj: Any) -> Any:
-    if isinstance(obj, dict):
-        out = {}
-        for k, v in obj.items():
-            if str(k).lower() in SENSITIVE_KEYS:
-                out[k] = "***"
-            else:
-                out[k] = _sanitize(v)
-        return out
-    if isinstance(obj, list):
-        return [_sanitize(x) for x in obj]
-    return obj
-
-
-def _jsonable(obj: Any) -> Any:
-    # Ensure values are JSON-serializable (Decimal/date/etc.)
-    try:
-        json.dumps(obj)
-        return obj
-    except Exception:
-        return json.loads(json.dumps(obj, default=str))
-
-
 class AuditedAPIView(APIView):
     """
     Logs all mutating requests (POST/PUT/PATCH/DELETE) under /api/ after DRF auth
@@ -195,16 +170,17 @@ class AuditedAPIView(APIView):
             role = getattr(user, "role", None) if is_auth else None
             user_role = getattr(role, "name", None) if role else None
 
-            # request/response payloads (sanitized)
+            # request/response payloads (sanitized, JSON-ready, size-capped)
+            max_bytes = getattr(settings, "AUDIT_PAYLOAD_MAX_BYTES", None)
             request_data = None
             try:
-                request_data = _jsonable(_sanitize(getattr(request, "data", None)))
+                request_data = sanitize_payload(getattr(request, "data", None), max_bytes)
             except Exception:
                 request_data = None
 
             response_data = None
             try:
-                response_data = _jsonable(_sanitize(getattr(response, "data", None)))
+                response_data = sanitize_payload(getattr(response, "data", None), max_bytes)
             except Exception:
                 response_data = None
 
@@ -212,7 +188,7 @@ class AuditedAPIView(APIView):
             ua = request.META.get("HTTP_USER_AGENT")
             view_name = f"{self.__class__.__module__}.{self.__class__.__name__}"
 
-            use_case = CreateAuditLogUseCase(audit_repository=DjangoAuditRepository())
+            use_case = CreateAuditLogUseCase(audit_repository=get_audit_repository())
             use_case.execute(
                 AuditLog(
                     id=None,
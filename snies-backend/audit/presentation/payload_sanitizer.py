@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any
+
+SENSITIVE_KEYS = {"password", "access", "refresh", "token"}
+
+REDACTED = "***"
+TRUNCATED_KEY = "_truncated"
+TRUNCATED_MARKER = "...[truncated]"
+
+# Values json can store as-is; anything else (Decimal, date, UploadedFile, ...) becomes str()
+_PLAIN = {str, int, float, bool, type(None)}
+
+
+def sanitize_payload(obj: Any, max_bytes: int | None = None) -> Any:
+    """
+    Single walk over a request/response payload that:
+    - redacts SENSITIVE_KEYS (case-insensitive) with "***"
+    - returns JSON-ready values (Decimal/date/unknown objects -> str, tuples -> list),
+      same result as json.dumps(default=str) without encoding the payload
+    - with max_bytes, stops once the approximate encoded size is exceeded: the string being
+      written is cut with TRUNCATED_MARKER, remaining list items collapse into one marker and
+      remaining dict keys are dropped and counted under "_truncated"
+    """
+    if max_bytes and max_bytes > 0:
+        return _capped(obj, max_bytes)
+    return _clean(obj)
+
+
+def _clean(obj: Any) -> Any:
+    if type(obj) in _PLAIN:
+        return obj
+    if isinstance(obj, dict):
+        out = {}
+        for k, v in obj.items():
+            if type(k) is not str:
+                k = str(k)
+            if k.lower() in SENSITIVE_KEYS:
+                out[k] = REDACTED
+            elif type(v) in _PLAIN:
+                out[k] = v
+            else:
+                out[k] = _clean(v)
+        return out
+    if isinstance(obj, (list, tuple)):
+        return [v if type(v) in _PLAIN else _clean(v) for v in obj]
+    if isinstance(obj, (str, int, float)):
+        return obj
+    return str(obj)
+
+
+def _capped(obj: Any, max_bytes: int) -> Any:
+    remaining = max_bytes
+
+    def scalar(v: Any) -> Any:
+        nonlocal remaining
+        t = type(v)
+        if t is str:
+            remaining -= len(v) + 2
+            if remaining < 0:
+                return v[: max(0, len(v) + remaining)] + TRUNCATED_MARKER
+            return v
+        if t is int or t is float:
+            remaining -= 8
+            return v
+        remaining -= 5
+        return v
+
+    def walk(v: Any) -> Any:
+        nonlocal remaining
+        if type(v) in _PLAIN:
+            return scalar(v)
+        if isinstance(v, dict):
+            remaining -= 2
+            out = {}
+            items = list(v.items())
+            for index, (k, item) in enumerate(items):
+                if remaining < 0:
+                    out[TRUNCATED_KEY] = len(items) - index
+                    break
+                if type(k) is not str:
+                    k = str(k)
+                remaining -= len(k) + 4
+                if k.lower() in SENSITIVE_KEYS:
+                    remaining -= 5
+                    out[k] = REDACTED
+                elif type(item) in _PLAIN:
+                    out[k] = scalar(item)
+                else:
+                    out[k] = walk(item)
+            return out
+        if isinstance(v, (list, tuple)):
+            remaining -= 2
+            out_list = []
+            for index, item in enumerate(v):
+                if remaining < 0:
+                    out_list.append(f"{TRUNCATED_MARKER} {len(v) - index} items")
+                    break
+                remaining -= 1
+                out_list.append(scalar(item) if type(item) in _PLAIN else walk(item))
+            return out_list
+        if isinstance(v, (str, int, float)):
+            return scalar(v)
+        return scalar(str(v))
+
+    return walk(obj)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True)
+class PageQuery:
+    """
+    Filtros comunes de los listados por periodo (year/semester + códigos SNIES) y
+    paginación keyset en orden id ascendente.
+    """
+
+    year: str | None = None
+    semester: int | None = None
+    organization_unit_code: str | None = None
+    activity_code: str | None = None
+
+    limit: int = DEFAULT_PAGE_SIZE
+    # Filas con id mayor que after_id; None = primera página
+    after_id: int | None = None
+    with_count: bool = False
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    results: list[T] = field(default_factory=list)
+    # id de la última fila cuando hay más páginas (se pasa como after_id); None = última
+    next_after_id: int | None = None
+    count: int | None = None  # total con los mismos filtros (solo si with_count)
+
+
+class PaginatedRepository(ABC, Generic[T]):
+    @abstractmethod
+    def list_page(self, query: PageQuery) -> Page[T]:
+        """Página acotada a query.limit con los filtros de query aplicados en la base."""
+        raise NotImplementedError
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from django.db.models import QuerySet
+
+from common.domain.pagination import MAX_PAGE_SIZE, Page, PageQuery
+
+T = TypeVar("T")
+
+
+def filter_page_query(qs: QuerySet, query: PageQuery) -> QuerySet:
+    """Aplica los filtros de PageQuery; el modelo debe tener esos cuatro campos."""
+    if query.year:
+        qs = qs.filter(year=str(query.year))
+    if query.semester is not None:
+        qs = qs.filter(semester=int(query.semester))
+    if query.organization_unit_code:
+        qs = qs.filter(organization_unit_code=query.organization_unit_code)
+    if query.activity_code:
+        qs = qs.filter(activity_code=query.activity_code)
+    return qs
+
+
+def keyset_page(qs: QuerySet, query: PageQuery, to_domain: Callable[..., T]) -> Page[T]:
+    """Página en orden id ascendente a partir de query.after_id (sin OFFSET)."""
+    limit = min(max(query.limit, 1), MAX_PAGE_SIZE)
+    qs = filter_page_query(qs, query)
+
+    page = qs.order_by("id")
+    if query.after_id is not None:
+        page = page.filter(id__gt=query.after_id)
+    # Una fila de más indica si hay página siguiente sin contar
+    models = list(page[: limit + 1])
+    has_more = len(models) > limit
+    models = models[:limit]
+
+    return Page(
+        results=[to_domain(m) for m in models],
+        next_after_id=models[-1].id if has_more else None,
+        count=qs.count() if query.with_count else None,
+    )
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from typing import Any, Generic, TypeVar
+
+from django.db import connection
+from django.db.models import Model
+from django.db.models.deletion import Collector
+
+M = TypeVar("M", bound=Model)
+
+
+def _supports_returning() -> bool:
+    # UPDATE/DELETE ... RETURNING: PostgreSQL y SQLite >= 3.35 (mismo umbral que en INSERT)
+    return connection.vendor in ("postgresql", "sqlite") and bool(
+        connection.features.can_return_columns_from_insert
+    )
+
+
+class DjangoRepositoryBase(Generic[M]):
+    """
+    Escrituras por id en una sola sentencia en lugar de get() + save()/delete():
+    UPDATE ... RETURNING de solo las columnas indicadas y DELETE ... RETURNING.
+    Las subclases definen `model`. Como QuerySet.update(), no dispara señales de save.
+    """
+
+    model: type[M]
+
+    def _update_returning(
+        self, pk: Any, values: dict[str, Any], previous: tuple[str, ...] = ()
+    ) -> tuple[M | None, tuple | None]:
+        """
+        Actualiza las columnas de `values` (nombres de campo) de la fila `pk` y devuelve
+        (fila actualizada, valores anteriores de los campos `previous`), p. ej. el periodo
+        previo para los rollups. (None, None) si la fila no existe.
+        """
+        if not _supports_returning():
+            return self._update_orm(pk, values, previous)
+
+        meta = self.model._meta
+        qn = connection.ops.quote_name
+        table, pk_col = qn(meta.db_table), qn(meta.pk.column)
+        targets = [meta.get_field(name) for name in values]
+        sets = ", ".join(f"{qn(f.column)} = %s" for f in targets)
+        params = [f.get_db_prep_save(values[f.name], connection) for f in targets]
+        returned = list(meta.concrete_fields)
+        columns = ", ".join(f"{table}.{qn(f.column)}" for f in returned)
+        prev_fields = [meta.get_field(name) for name in previous]
+
+        if prev_fields and connection.vendor == "postgresql":
+            # Valores anteriores en la misma sentencia: la subconsulta bloquea la fila
+            prev_columns = ", ".join(qn(f.column) for f in prev_fields)
+            sql = (
+                f"UPDATE {table} SET {sets} "
+                f"FROM (SELECT {pk_col}, {prev_columns} FROM {table} "
+                f"WHERE {pk_col} = %s FOR UPDATE) AS prev "
+                f"WHERE {table}.{pk_col} = prev.{pk_col} "
+                f"RETURNING {columns}, " + ", ".join(f"prev.{qn(f.column)}" for f in prev_fields)
+            )
+            row = self._fetch_one(sql, params + [pk])
+            if row is None:
+                return None, None
+            return (
+                self._from_row(returned, row[: len(returned)]),
+                self._convert(prev_fields, row[len(returned) :]),
+            )
+
+        prev_values = None
+        if prev_fields:
+            # SQLite no admite tablas auxiliares en RETURNING: lectura previa (en proceso)
+            prev_values = self.model.objects.filter(pk=pk).values_list(*previous).first()
+            if prev_values is None:
+                return None, None
+        row = self._fetch_one(
+            f"UPDATE {table} SET {sets} WHERE {pk_col} = %s RETURNING {columns}", params + [pk]
+        )
+        if row is None:
+            return None, None
+        return self._from_row(returned, row), prev_values
+
+    def _delete_returning(self, pk: Any, returning: tuple[str, ...] = ()) -> tuple | None:
+        """
+        Elimina la fila `pk` y devuelve los valores que tenía en los campos `returning`
+        (tupla vacía si no se pidieron). None si la fila no existe.
+        Con borrados en cascada o señales de delete se usa el ORM (Collector).
+        """
+        qs = self.model.objects.filter(pk=pk)
+        if not _supports_returning() or not Collector(using=qs.db).can_fast_delete(qs):
+            row = qs.values_list("pk", *returning).first()
+            if row is None:
+                return None
+            qs.delete()
+            return tuple(row[1:])
+
+        meta = self.model._meta
+        qn = connection.ops.quote_name
+        fields = [meta.pk] + [meta.get_field(name) for name in returning]
+        columns = ", ".join(qn(f.column) for f in fields)
+        row = self._fetch_one(
+            f"DELETE FROM {qn(meta.db_table)} WHERE {qn(meta.pk.column)} = %s "
+            f"RETURNING {columns}",
+            [pk],
+        )
+        if row is None:
+            return None
+        return self._convert(fields, row)[1:]
+
+    def _update_orm(
+        self, pk: Any, values: dict[str, Any], previous: tuple[str, ...]
+    ) -> tuple[M | None, tuple | None]:
+        qs = self.model.objects.filter(pk=pk)
+        prev_values = qs.values_list(*previous).first() if previous else None
+        if previous and prev_values is None:
+            return None, None
+        if not qs.update(**values):
+            return None, None
+        return qs.first(), prev_values
+
+    def _fetch_one(self, sql: str, params: list) -> tuple | None:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchone()
+
+    def _convert(self, fields: list, row) -> tuple:
+        """Aplica los conversores del backend y del campo, como hace el ORM al leer."""
+        table = self.model._meta.db_table
+        values = []
+        for field, value in zip(fields, row):
+            col = field.get_col(table)
+            for converter in connection.ops.get_db_converters(col) + field.get_db_converters(
+                connection
+            ):
+                value = converter(value, col, connection)
+            values.append(value)
+        return tuple(values)
+
+    def _from_row(self, fields: list, row) -> M:
+        return self.model.from_db(
+            connection.alias, [f.attname for f in fields], self._convert(fields, row)
+        )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable
+
+from common.domain.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, PageQuery
+
+# Cualquiera de estos parámetros activa el listado paginado (ver wants_page)
+PAGE_QUERY_PARAMS = (
+    "cursor",
+    "limit",
+    "count",
+    "year",
+    "semester",
+    "organization_unit_code",
+    "activity_code",
+)
+
+
+def encode_cursor(key: int | tuple[datetime, int] | None) -> str | None:
+    """
+    Posición de la última fila vista -> cursor opaco. La clave es el id de la fila, o
+    (timestamp, id) en los listados ordenados por fecha con el id como desempate.
+    """
+    if key is None:
+        return None
+    if isinstance(key, tuple):
+        timestamp, last_id = key
+        values = [timestamp.isoformat(), last_id]
+    else:
+        values = [key]
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, timestamped: bool = False):
+    """
+    Cursor opaco -> id de la fila, o (timestamp, id) con timestamped=True.
+    Un cursor vacío es la primera página.
+    """
+    if not cursor:
+        return None
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if timestamped:
+            timestamp, last_id = values
+            return datetime.fromisoformat(timestamp), int(last_id)
+        (after_id,) = values
+        return int(after_id)
+    except (ValueError, TypeError, binascii.Error) as exc:
+        raise ValueError("Cursor inválido") from exc
+
+
+def _clean(value: str | None) -> str | None:
+    value = value.strip() if isinstance(value, str) else None
+    return value or None
+
+
+def wants_page(params) -> bool:
+    """True si la petición trae algún parámetro de paginación o de filtro."""
+    return any(name in params for name in PAGE_QUERY_PARAMS)
+
+
+def parse_page_query(params) -> PageQuery:
+    """
+    ?year=&semester=&organization_unit_code=&activity_code=&limit=&cursor=&count=exact|none
+    Lanza ValueError con un mensaje apto para una respuesta 400.
+    """
+    semester = _clean(params.get("semester"))
+    limit = _clean(params.get("limit"))
+    try:
+        semester = int(semester) if semester is not None else None
+    except ValueError as exc:
+        raise ValueError("semester debe ser un número entero") from exc
+    try:
+        limit = int(limit) if limit is not None else DEFAULT_PAGE_SIZE
+    except ValueError as exc:
+        raise ValueError("limit debe ser un número entero") from exc
+
+    count_mode = params.get("count", "exact")
+    if count_mode not in ("exact", "none"):
+        raise ValueError("count debe ser 'exact' o 'none'")
+
+    return PageQuery(
+        year=_clean(params.get("year")),
+        semester=semester,
+        organization_unit_code=_clean(params.get("organization_unit_code")),
+        activity_code=_clean(params.get("activity_code")),
+        limit=limit,
+        after_id=decode_cursor((params.get("cursor") or "").strip()),
+        with_count=count_mode == "exact",
+    )
+
+
+def page_payload(page: Page, query: PageQuery, to_dict: Callable[..., dict]) -> dict:
+    """{"count", "limit", "next_cursor", "results"}; next_cursor vuelve como ?cursor=."""
+    return {
+        "count": page.count,
+        "limit": min(max(query.limit, 1), MAX_PAGE_SIZE),
+        "next_cursor": encode_cursor(page.next_after_id),
+        "results": [to_dict(item) for item in page.results],
+    }
@@ -63,6 +63,7 @@ INSTALLED_APPS = [
     "wellbeing_beneficiaries",
     "wellbeing_human_resources",
     "software_activities",
+    "stats",
 ]
 
 MIDDLEWARE = [
@@ -153,6 +154,9 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+MEDIA_URL = "media/"
+MEDIA_ROOT = Path(os.getenv("MEDIA_ROOT", str(BASE_DIR.parent / "media")))
+
                                 
                                                                         
 
@@ -170,6 +174,56 @@ REST_FRAMEWORK = {
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "snies-default"),
+    }
+}
+
+STATS_DASHBOARD_CACHE_TIMEOUT = int(os.getenv("STATS_DASHBOARD_CACHE_TIMEOUT", "3600"))
+
+PERMISSION_CACHE_TTL = int(os.getenv("PERMISSION_CACHE_TTL", "300"))
+
+AUDIT_ASYNC_ENABLED = os.getenv("AUDIT_ASYNC_ENABLED", "True").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "y",
+    "on",
+}
+AUDIT_ASYNC_QUEUE_SIZE = int(os.getenv("AUDIT_ASYNC_QUEUE_SIZE", "1000"))
+AUDIT_ASYNC_BATCH_SIZE = int(os.getenv("AUDIT_ASYNC_BATCH_SIZE", "100"))
+AUDIT_ASYNC_FLUSH_INTERVAL = float(os.getenv("AUDIT_ASYNC_FLUSH_INTERVAL", "1.0"))
+AUDIT_PAYLOAD_MAX_BYTES = int(os.getenv("AUDIT_PAYLOAD_MAX_BYTES", "65536"))
+
+# Particiones mensuales de audit_logs (PostgreSQL) y retencion: ver manage_audit_partitions
+AUDIT_PARTITION_MONTHS_AHEAD = int(os.getenv("AUDIT_PARTITION_MONTHS_AHEAD", "3"))
+AUDIT_RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", "12"))
+AUDIT_ARCHIVE_DIR = Path(os.getenv("AUDIT_ARCHIVE_DIR", str(MEDIA_ROOT / "audit_archive")))
+
+# Worker de importaciones Excel (run_import_worker)
+IMPORT_WORKER_THREADS = int(os.getenv("IMPORT_WORKER_THREADS", "2"))
+IMPORT_WORKER_POLL_INTERVAL = float(os.getenv("IMPORT_WORKER_POLL_INTERVAL", "2"))
+IMPORT_WORKER_STALE_MINUTES = int(os.getenv("IMPORT_WORKER_STALE_MINUTES", "15"))
+
+# Exports Excel guardados (media/private/exports): con nginx delante, prefijo de la location
+# "internal" que apunta a MEDIA_ROOT para entregarlos vía X-Accel-Redirect.
+# Vacío = Django envía el archivo.
+EXPORT_X_ACCEL_REDIRECT_PREFIX = os.getenv("EXPORT_X_ACCEL_REDIRECT_PREFIX", "")
+
+# Stream SSE de notificaciones (/api/notifications/stream/)
+NOTIFICATIONS_STREAM_HEARTBEAT = float(os.getenv("NOTIFICATIONS_STREAM_HEARTBEAT", "25"))
+NOTIFICATIONS_STREAM_MAX_SECONDS = float(os.getenv("NOTIFICATIONS_STREAM_MAX_SECONDS", "300"))
+NOTIFICATIONS_STREAM_QUEUE_SIZE = int(os.getenv("NOTIFICATIONS_STREAM_QUEUE_SIZE", "100"))
+# Streams abiertos a la vez por proceso; al llegar al tope se responde 503 y el cliente
+# vuelve al polling de unread-count. 0 = este proceso no sirve streams (ver servicio stream)
+NOTIFICATIONS_STREAM_MAX_CONNECTIONS = int(os.getenv("NOTIFICATIONS_STREAM_MAX_CONNECTIONS", "50"))
+
+# Retención de notificaciones leídas (purge_notifications); sin directorio no se archivan
+NOTIFICATIONS_RETENTION_DAYS = int(os.getenv("NOTIFICATIONS_RETENTION_DAYS", "90"))
+NOTIFICATIONS_ARCHIVE_DIR = os.getenv("NOTIFICATIONS_ARCHIVE_DIR", "")
+
 AUTH_USER_MODEL = "users.UserModel"
 
 from datetime import timedelta
@@ -183,3 +237,26 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": False,
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
+
+# Opt-in: access tokens carry role + permission bitmasks and requests skip the user/role lookup
+JWT_EMBED_PERMISSIONS = os.getenv("JWT_EMBED_PERMISSIONS", "False").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "y",
+    "on",
+}
+if JWT_EMBED_PERMISSIONS:
+    SIMPLE_JWT.update(
+        {
+            "TOKEN_OBTAIN_SERIALIZER": (
+                "users.presentation.api.auth.serializers.PermissionClaimsTokenObtainPairSerializer"
+            ),
+            "TOKEN_REFRESH_SERIALIZER": (
+                "users.presentation.api.auth.serializers.PermissionClaimsTokenRefreshSerializer"
+            ),
+        }
+    )
+    REST_FRAMEWORK["DEFAULT_AUTHENTICATION_CLASSES"] = (
+        "users.presentation.authentication.PermissionClaimsJWTAuthentication",
+    )
@@ -1,6 +1,9 @@
 from continuing_education.domain.ports.continuing_education_repository import ContinuingEducationRepository
 from continuing_education.domain.entities.continuing_education import ContinuingEducation
 from continuing_education.infraestructure.persistence.django.models import ContinuingEducationModel
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
+
+ROLLUP_SOURCE = "continuing_education"
 
 class ContinuingEducationRepositoryDjango(ContinuingEducationRepository):
     def create(self, continuing_education: ContinuingEducation) -> ContinuingEducation:
@@ -11,6 +14,9 @@ class ContinuingEducationRepositoryDjango(ContinuingEducationRepository):
             id_course_id=continuing_education.id_course,
             value=continuing_education.value,
         )
+        schedule_refresh(
+            ROLLUP_SOURCE, (continuing_education_model.year, continuing_education_model.semester)
+        )
         return self._to_domain(continuing_education_model)
 
     def list(
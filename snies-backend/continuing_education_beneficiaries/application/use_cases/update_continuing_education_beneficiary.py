@@ -16,10 +16,6 @@ class UpdateContinuingEducationBeneficiaryUseCase:
     def execute(
         self, beneficiary_id: int, beneficiary: ContinuingEducationBeneficiary
     ) -> ContinuingEducationBeneficiary:
-        existing = self.repository.get_by_id(beneficiary_id)
-        if not existing:
-            raise ContinuingEducationBeneficiaryNotFoundException("Beneficiary not found")
-
         beneficiary_to_update = ContinuingEducationBeneficiary(
             id=beneficiary_id,
             year=beneficiary.year,
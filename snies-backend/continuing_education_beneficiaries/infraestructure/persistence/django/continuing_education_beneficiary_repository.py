@@ -1,3 +1,4 @@
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
 from continuing_education_beneficiaries.domain.entities.continuing_education_beneficiary import (
     ContinuingEducationBeneficiary,
 )
@@ -7,9 +8,17 @@ from continuing_education_beneficiaries.domain.ports.continuing_education_benefi
 from continuing_education_beneficiaries.infraestructure.persistence.django.models import (
     ContinuingEducationBeneficiaryModel,
 )
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
 
+ROLLUP_SOURCE = "continuing_education_beneficiaries"
+
+
+class ContinuingEducationBeneficiaryRepositoryDjango(
+    DjangoRepositoryBase[ContinuingEducationBeneficiaryModel],
+    ContinuingEducationBeneficiaryRepository,
+):
+    model = ContinuingEducationBeneficiaryModel
 
-class ContinuingEducationBeneficiaryRepositoryDjango(ContinuingEducationBeneficiaryRepository):
     def create(self, beneficiary: ContinuingEducationBeneficiary) -> ContinuingEducationBeneficiary:
         m = ContinuingEducationBeneficiaryModel.objects.create(
             year=beneficiary.year,
@@ -18,6 +27,7 @@ class ContinuingEducationBeneficiaryRepositoryDjango(ContinuingEducationBenefici
             beneficiary_type_extension_id=beneficiary.beneficiary_type_extension_id,
             beneficiaries_count=beneficiary.beneficiaries_count,
         )
+        schedule_refresh(ROLLUP_SOURCE, (m.year, m.semester))
         return self._to_domain(m)
 
     def list(
@@ -38,25 +48,28 @@ class ContinuingEducationBeneficiaryRepositoryDjango(ContinuingEducationBenefici
             return None
 
     def update(self, beneficiary: ContinuingEducationBeneficiary) -> ContinuingEducationBeneficiary | None:
-        try:
-            m = ContinuingEducationBeneficiaryModel.objects.get(id=beneficiary.id)
-            m.year = beneficiary.year
-            m.semester = beneficiary.semester
-            m.course_code = beneficiary.course_code
-            m.beneficiary_type_extension_id = beneficiary.beneficiary_type_extension_id
-            m.beneficiaries_count = beneficiary.beneficiaries_count
-            m.save()
-            return self._to_domain(m)
-        except ContinuingEducationBeneficiaryModel.DoesNotExist:
+        m, previous_period = self._update_returning(
+            beneficiary.id,
+            {
+                "year": beneficiary.year,
+                "semester": beneficiary.semester,
+                "course_code": beneficiary.course_code,
+                "beneficiary_type_extension_id": beneficiary.beneficiary_type_extension_id,
+                "beneficiaries_count": beneficiary.beneficiaries_count,
+            },
+            previous=("year", "semester"),
+        )
+        if m is None:
             return None
+        schedule_refresh(ROLLUP_SOURCE, previous_period, (m.year, m.semester))
+        return self._to_domain(m)
 
     def delete(self, beneficiary_id: int) -> bool:
-        try:
-            m = ContinuingEducationBeneficiaryModel.objects.get(id=beneficiary_id)
-            m.delete()
-            return True
-        except ContinuingEducationBeneficiaryModel.DoesNotExist:
+        period = self._delete_returning(beneficiary_id, ("year", "semester"))
+        if period is None:
             return False
+        schedule_refresh(ROLLUP_SOURCE, period)
+        return True
 
     def _to_domain(self, m: ContinuingEducationBeneficiaryModel) -> ContinuingEducationBeneficiary:
         return ContinuingEducationBeneficiary(
@@ -14,9 +14,6 @@ class UpdateContinuingEducationTeacherUseCase:
         self.repository = repository
 
     def execute(self, teacher_id: int, teacher: ContinuingEducationTeacher) -> ContinuingEducationTeacher:
-        existing = self.repository.get_by_id(teacher_id)
-        if not existing:
-            raise ContinuingEducationTeacherNotFoundException("Teacher not found")
         teacher_to_update = ContinuingEducationTeacher(
             id=teacher_id,
             year=teacher.year,
@@ -1,3 +1,4 @@
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
 from continuing_education_teachers.domain.entities.continuing_education_teacher import (
     ContinuingEducationTeacher,
 )
@@ -7,9 +8,16 @@ from continuing_education_teachers.domain.ports.continuing_education_teacher_rep
 from continuing_education_teachers.infraestructure.persistence.django.models import (
     ContinuingEducationTeacherModel,
 )
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
 
+ROLLUP_SOURCE = "continuing_education_teachers"
+
+
+class ContinuingEducationTeacherRepositoryDjango(
+    DjangoRepositoryBase[ContinuingEducationTeacherModel], ContinuingEducationTeacherRepository
+):
+    model = ContinuingEducationTeacherModel
 
-class ContinuingEducationTeacherRepositoryDjango(ContinuingEducationTeacherRepository):
     def create(self, teacher: ContinuingEducationTeacher) -> ContinuingEducationTeacher:
         m = ContinuingEducationTeacherModel.objects.create(
             year=teacher.year,
@@ -18,6 +26,7 @@ class ContinuingEducationTeacherRepositoryDjango(ContinuingEducationTeacherRepos
             document_type_id=teacher.document_type_id,
             document_number=teacher.document_number,
         )
+        schedule_refresh(ROLLUP_SOURCE, (m.year, m.semester))
         return self._to_domain(m)
 
     def list(self, year: str | None = None, semester: int | None = None) -> list[ContinuingEducationTeacher]:
@@ -36,25 +45,28 @@ class ContinuingEducationTeacherRepositoryDjango(ContinuingEducationTeacherRepos
             return None
 
     def update(self, teacher: ContinuingEducationTeacher) -> ContinuingEducationTeacher | None:
-        try:
-            m = ContinuingEducationTeacherModel.objects.get(id=teacher.id)
-            m.year = teacher.year
-            m.semester = teacher.semester
-            m.course_code = teacher.course_code
-            m.document_type_id = teacher.document_type_id
-            m.document_number = teacher.document_number
-            m.save()
-            return self._to_domain(m)
-        except ContinuingEducationTeacherModel.DoesNotExist:
+        m, previous_period = self._update_returning(
+            teacher.id,
+            {
+                "year": teacher.year,
+                "semester": teacher.semester,
+                "course_code": teacher.course_code,
+                "document_type_id": teacher.document_type_id,
+                "document_number": teacher.document_number,
+            },
+            previous=("year", "semester"),
+        )
+        if m is None:
             return None
+        schedule_refresh(ROLLUP_SOURCE, previous_period, (m.year, m.semester))
+        return self._to_domain(m)
 
     def delete(self, teacher_id: int) -> bool:
-        try:
-            m = ContinuingEducationTeacherModel.objects.get(id=teacher_id)
-            m.delete()
-            return True
-        except ContinuingEducationTeacherModel.DoesNotExist:
+        period = self._delete_returning(teacher_id, ("year", "semester"))
+        if period is None:
             return False
+        schedule_refresh(ROLLUP_SOURCE, period)
+        return True
 
     def _to_domain(self, m: ContinuingEducationTeacherModel) -> ContinuingEducationTeacher:
         return ContinuingEducationTeacher(
@@ -2,6 +2,7 @@ from courses.domain.ports.course_repository import CourseRepository
 from courses.domain.entities.course import Course
 from django.db import models
 from courses.infraestructure.persistence.django.models import CourseModel
+from stats.infraestructure.persistence.django.generations import bump_generation
 
 
 class CourseRepositoryDjango(CourseRepository):
@@ -13,6 +14,7 @@ class CourseRepositoryDjango(CourseRepository):
             is_extension=course.is_extension,
             is_active=course.is_active,
         )
+        bump_generation("courses")
         return self._to_domain(course_model)
 
     def get_by_id(self, id: int) -> Course | None:
@@ -3,7 +3,15 @@ set -e
 
 python /app/docker/wait_for_db.py
 
-python /app/config/manage.py migrate --noinput
+if [ "${RUN_MIGRATIONS:-1}" = "1" ]; then
+  python /app/config/manage.py migrate --noinput
+
+  python /app/config/manage.py refresh_stats_rollups
+
+  python /app/config/manage.py manage_audit_partitions --retention-months 0
+
+  python /app/config/manage.py reconcile_notification_counters
+fi
 
 if [ "${COLLECTSTATIC:-0}" = "1" ]; then
   python /app/config/manage.py collectstatic --noinput
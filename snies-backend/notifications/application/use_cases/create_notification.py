@@ -1,11 +1,48 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
 from notifications.domain.entities.notification import Notification
 from notifications.domain.ports.notification_repository import NotificationRepository
 
+# Same (user, module, action) within this window (sliding: every merge extends it)
+# ends up in a single notification
+DEFAULT_COALESCE_WINDOW = timedelta(minutes=10)
+
 
 class CreateNotificationUseCase:
-    def __init__(self, notification_repository: NotificationRepository):
+    def __init__(
+        self,
+        notification_repository: NotificationRepository,
+        coalesce_window: timedelta | None = DEFAULT_COALESCE_WINDOW,
+    ):
         self.notification_repository = notification_repository
+        self.coalesce_window = coalesce_window
 
     def execute(self, notification: Notification) -> Notification:
-        return self.notification_repository.create(notification)
+        return self.execute_many([notification])[0]
+
+    def execute_many(self, notifications: list[Notification]) -> list[Notification]:
+        if not notifications:
+            return []
+        if not self.coalesce_window:
+            return self.notification_repository.create_many(notifications)
+
+        # Duplicates inside the batch are merged here (the last one wins, counts add up);
+        # notifications without module/action are never coalesced
+        groups: dict[tuple, Notification] = {}
+        slots: list[tuple] = []
+        for i, n in enumerate(notifications):
+            key = (n.user_id, n.module, n.action) if n.module and n.action else ("single", i)
+            previous = groups.get(key)
+            if previous is not None:
+                n = replace(n, occurrences=previous.occurrences + n.occurrences)
+            groups[key] = n
+            slots.append(key)
 
+        keys = list(groups)
+        since = datetime.now(timezone.utc) - self.coalesce_window
+        stored = self.notification_repository.create_many(
+            [groups[k] for k in keys], coalesce_since=since
+        )
+        by_key = dict(zip(keys, stored))
+        return [by_key[k] for k in slots]
@@ -0,0 +1,26 @@
+from common.domain.pagination import Page
+from notifications.domain.entities.notification import Notification
+from notifications.domain.ports.notification_repository import NotificationRepository
+
+
+class ListNotificationsKeysetUseCase:
+    """Cursor listing: each page costs the same no matter how many notifications a user has."""
+
+    def __init__(self, notification_repository: NotificationRepository):
+        self.notification_repository = notification_repository
+
+    def execute(
+        self,
+        user_id: int,
+        limit: int,
+        before_id: int | None = None,
+        is_read: bool | None = None,
+        with_count: bool = False,
+    ) -> Page[Notification]:
+        return self.notification_repository.list_page(
+            user_id=user_id,
+            limit=limit,
+            before_id=before_id,
+            is_read=is_read,
+            with_count=with_count,
+        )
@@ -15,4 +15,7 @@ class Notification:
     action: str | None = None
     resource_id: str | None = None
     level: str | None = None  # info|warning|success|error
+    # Coalesced notifications: how many events were merged into this one and the latest
+    occurrences: int = 1
+    last_seen_at: datetime | None = None
 
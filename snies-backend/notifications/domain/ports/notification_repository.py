@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
+from common.domain.pagination import Page
 from notifications.domain.entities.notification import Notification
 
 
@@ -10,12 +12,36 @@ class NotificationRepository(ABC):
     def create(self, notification: Notification) -> Notification:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_many(
+        self, notifications: list[Notification], coalesce_since: datetime | None = None
+    ) -> list[Notification]:
+        """
+        Writes the notifications in one batch. With coalesce_since, each one is merged into
+        an unread notification of the same (user_id, module, action) last seen after that
+        instant instead: occurrences are added up and last_seen_at moves forward.
+        Returns the stored notification for each input, in order.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_paginated(
         self, user_id: int, page: int, page_size: int, is_read: bool | None = None
     ) -> tuple[int, list[Notification]]:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_page(
+        self,
+        user_id: int,
+        limit: int,
+        before_id: int | None = None,
+        is_read: bool | None = None,
+        with_count: bool = False,
+    ) -> Page[Notification]:
+        """Newest first, only notifications with id < before_id (keyset, no OFFSET)."""
+        raise NotImplementedError
+
     @abstractmethod
     def unread_count(self, user_id: int) -> int:
         raise NotImplementedError
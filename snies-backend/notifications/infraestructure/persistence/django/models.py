@@ -16,9 +16,36 @@ class NotificationModel(models.Model):
     resource_id = models.CharField(max_length=64, null=True, blank=True)
     level = models.CharField(max_length=16, null=True, blank=True)
 
+    # Coalescing: events merged into this row and when the latest one happened
+    occurrences = models.PositiveIntegerField(default=1)
+    last_seen_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         db_table = "notifications"
         indexes = [
             models.Index(fields=["user_id", "is_read", "created_at"]),
+            # Listing newest first (order by -id) with keyset cursors
+            models.Index(fields=["user_id", "id"], name="notifications_user_id_idx"),
+            # Unread list, coalescing lookups and mark-all-read only touch unread rows
+            models.Index(
+                fields=["user_id", "id"],
+                condition=models.Q(is_read=False),
+                name="notifications_unread_idx",
+            ),
         ]
 
+
+
+class NotificationCounterModel(models.Model):
+    """
+    Unread notifications per user, kept in step by DjangoNotificationRepository so the
+    badge is a primary key lookup. Rows are created on first use; drift is fixed with
+    reconcile_notification_counters.
+    """
+
+    user_id = models.IntegerField(primary_key=True)  # references users.UserModel.id
+    unread_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "notification_counters"
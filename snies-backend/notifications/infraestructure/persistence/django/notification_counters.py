@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from notifications.infraestructure.persistence.django.models import (
+    NotificationCounterModel,
+    NotificationModel,
+)
+
+
+def _count_unread(user_id: int) -> int:
+    return NotificationModel.objects.filter(user_id=user_id, is_read=False).count()
+
+
+def _seed(user_id: int) -> tuple[NotificationCounterModel, bool]:
+    """Creates the counter from a COUNT; created=False if another transaction created it."""
+    return NotificationCounterModel.objects.get_or_create(
+        user_id=user_id, defaults={"unread_count": _count_unread(user_id)}
+    )
+
+
+def adjust_unread(user_id: int, delta: int) -> None:
+    """
+    Applies delta to the user's counter. Must run in the same transaction as the change
+    to notifications, after it: a missing row is seeded with a COUNT that already
+    includes that change.
+    """
+    if not delta:
+        return
+    updated = NotificationCounterModel.objects.filter(user_id=user_id).update(
+        unread_count=F("unread_count") + delta, updated_at=timezone.now()
+    )
+    if not updated and not _seed(user_id)[1]:
+        NotificationCounterModel.objects.filter(user_id=user_id).update(
+            unread_count=F("unread_count") + delta, updated_at=timezone.now()
+        )
+
+
+def adjust_unread_many(deltas: dict[int, int]) -> None:
+    """adjust_unread for many users: one UPDATE per distinct delta for existing counters."""
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    existing = set(
+        NotificationCounterModel.objects.filter(user_id__in=deltas).values_list(
+            "user_id", flat=True
+        )
+    )
+    by_delta: dict[int, list[int]] = {}
+    for user_id in existing:
+        by_delta.setdefault(deltas[user_id], []).append(user_id)
+    for delta, user_ids in by_delta.items():
+        NotificationCounterModel.objects.filter(user_id__in=user_ids).update(
+            unread_count=F("unread_count") + delta, updated_at=timezone.now()
+        )
+    # First notification of these users: seeded one by one (once per user)
+    for user_id in deltas.keys() - existing:
+        adjust_unread(user_id, deltas[user_id])
+
+
+def get_unread(user_id: int) -> int:
+    count = (
+        NotificationCounterModel.objects.filter(user_id=user_id)
+        .values_list("unread_count", flat=True)
+        .first()
+    )
+    if count is None:
+        count = _seed(user_id)[0].unread_count
+    return max(0, count)
+
+
+def reconcile(user_ids: list[int] | None = None, dry_run: bool = False) -> list[tuple]:
+    """
+    Compares every counter with the real COUNT and fixes the ones that drifted.
+    Returns (user_id, stored, actual) for each drifted user (stored=None: no row).
+    """
+    actual_qs = NotificationModel.objects.filter(is_read=False)
+    stored_qs = NotificationCounterModel.objects.all()
+    if user_ids:
+        actual_qs = actual_qs.filter(user_id__in=user_ids)
+        stored_qs = stored_qs.filter(user_id__in=user_ids)
+    actual = dict(
+        actual_qs.order_by().values("user_id").annotate(n=Count("id")).values_list("user_id", "n")
+    )
+    stored = dict(stored_qs.values_list("user_id", "unread_count"))
+
+    drifted = [
+        (user_id, stored.get(user_id), actual.get(user_id, 0))
+        for user_id in sorted(set(actual) | set(stored))
+        if stored.get(user_id) != actual.get(user_id, 0)
+    ]
+    if dry_run:
+        return drifted
+
+    for user_id, _, _ in drifted:
+        with transaction.atomic():
+            # Recount under the row lock: writers that have not reached their counter
+            # update yet are not counted here and apply their delta afterwards
+            locked = (
+                NotificationCounterModel.objects.select_for_update()
+                .filter(user_id=user_id)
+                .exists()
+            )
+            if not locked:
+                _seed(user_id)
+                continue
+            NotificationCounterModel.objects.filter(user_id=user_id).update(
+                unread_count=_count_unread(user_id), updated_at=timezone.now()
+            )
+    return drifted
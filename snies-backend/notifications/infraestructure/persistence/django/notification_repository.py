@@ -1,23 +1,97 @@
 from datetime import datetime, timezone
 
+from django.db import transaction
+
+from common.domain.pagination import Page
 from notifications.domain.entities.notification import Notification
 from notifications.domain.ports.notification_repository import NotificationRepository
+from notifications.infraestructure.persistence.django import notification_counters
 from notifications.infraestructure.persistence.django.models import NotificationModel
+from notifications.infraestructure.realtime import publisher
 
 
 class DjangoNotificationRepository(NotificationRepository):
     def create(self, notification: Notification) -> Notification:
-        m = NotificationModel.objects.create(
-            user_id=notification.user_id,
-            title=notification.title,
-            message=notification.message,
-            module=notification.module,
-            action=notification.action,
-            resource_id=notification.resource_id,
-            level=notification.level,
-            is_read=False,
+        return self.create_many([notification])[0]
+
+    @transaction.atomic
+    def create_many(
+        self, notifications: list[Notification], coalesce_since: datetime | None = None
+    ) -> list[Notification]:
+        now = datetime.now(timezone.utc)
+        merged: dict[int, NotificationModel] = {}  # input position -> existing row
+        if coalesce_since is not None:
+            keyed = {
+                (n.user_id, n.module, n.action): i
+                for i, n in enumerate(notifications)
+                if n.module and n.action
+            }
+            if keyed:
+                candidates = (
+                    NotificationModel.objects.select_for_update()
+                    .filter(
+                        user_id__in={k[0] for k in keyed},
+                        module__in={k[1] for k in keyed},
+                        action__in={k[2] for k in keyed},
+                        is_read=False,
+                        last_seen_at__gte=coalesce_since,
+                    )
+                    .order_by("-last_seen_at")
+                )
+                for m in candidates:
+                    i = keyed.get((m.user_id, m.module, m.action))
+                    if i is not None and i not in merged:
+                        merged[i] = m
+
+        for i, m in merged.items():
+            n = notifications[i]
+            m.occurrences += n.occurrences
+            m.last_seen_at = now
+            m.title, m.message = n.title, n.message
+            m.resource_id, m.level = n.resource_id, n.level
+        if merged:
+            NotificationModel.objects.bulk_update(
+                list(merged.values()),
+                ["occurrences", "last_seen_at", "title", "message", "resource_id", "level"],
+            )
+
+        created = NotificationModel.objects.bulk_create(
+            [
+                NotificationModel(
+                    user_id=n.user_id,
+                    title=n.title,
+                    message=n.message,
+                    module=n.module,
+                    action=n.action,
+                    resource_id=n.resource_id,
+                    level=n.level,
+                    is_read=False,
+                    occurrences=n.occurrences,
+                    last_seen_at=now,
+                )
+                for i, n in enumerate(notifications)
+                if i not in merged
+            ]
         )
-        return self._to_domain(m)
+
+        per_user: dict[int, int] = {}
+        for m in created:
+            per_user[m.user_id] = per_user.get(m.user_id, 0) + 1
+        notification_counters.adjust_unread_many(per_user)
+
+        new_rows = iter(created)
+        result, events = [], []
+        for i in range(len(notifications)):
+            if i in merged:
+                n = self._to_domain(merged[i])
+                # Still the same unread notification: the counter does not change
+                events.append(publisher.created_event(n, unread_delta=0))
+            else:
+                n = self._to_domain(next(new_rows))
+                events.append(publisher.created_event(n))
+            result.append(n)
+        publisher.publish_notification_events(events)
+        return result
 
     def list_paginated(
         self, user_id: int, page: int, page_size: int, is_read: bool | None = None
@@ -33,28 +107,71 @@ class DjangoNotificationRepository(NotificationRepository):
         if is_read is not None:
             qs = qs.filter(is_read=bool(is_read))
 
-        total = qs.count()
+        total = self._count(user_id, qs, is_read)
         offset = (page - 1) * page_size
         items = qs[offset : offset + page_size]
         return total, [self._to_domain(m) for m in items]
 
+    def list_page(
+        self,
+        user_id: int,
+        limit: int,
+        before_id: int | None = None,
+        is_read: bool | None = None,
+        with_count: bool = False,
+    ) -> Page[Notification]:
+        limit = min(max(limit, 1), 200)
+        qs = NotificationModel.objects.filter(user_id=user_id)
+        if is_read is not None:
+            qs = qs.filter(is_read=bool(is_read))
+
+        page = qs.order_by("-id")
+        if before_id is not None:
+            page = page.filter(id__lt=before_id)
+        # One extra row tells whether there is a next page without counting
+        models = list(page[: limit + 1])
+        has_more = len(models) > limit
+        models = models[:limit]
+
+        return Page(
+            results=[self._to_domain(m) for m in models],
+            next_after_id=models[-1].id if has_more else None,
+            count=self._count(user_id, qs, is_read) if with_count else None,
+        )
+
+    def _count(self, user_id: int, qs, is_read: bool | None) -> int:
+        # Unread total comes from the per-user counter instead of a COUNT
+        if is_read is False:
+            return notification_counters.get_unread(user_id)
+        return qs.count()
+
     def unread_count(self, user_id: int) -> int:
-        return NotificationModel.objects.filter(user_id=user_id, is_read=False).count()
+        return notification_counters.get_unread(user_id)
 
+    @transaction.atomic
     def mark_read(self, user_id: int, notification_id: int) -> bool:
         now = datetime.now(timezone.utc)
         updated = (
             NotificationModel.objects.filter(id=notification_id, user_id=user_id, is_read=False)
             .update(is_read=True, read_at=now)
         )
+        if updated:
+            notification_counters.adjust_unread(user_id, -updated)
+            publisher.notification_read(user_id, notification_id)
         return updated > 0
 
+    @transaction.atomic
     def mark_all_read(self, user_id: int) -> int:
         now = datetime.now(timezone.utc)
-        return (
+        updated = (
             NotificationModel.objects.filter(user_id=user_id, is_read=False)
             .update(is_read=True, read_at=now)
         )
+        if updated:
+            # Subtract what was marked instead of resetting to 0: keeps concurrent creates
+            notification_counters.adjust_unread(user_id, -updated)
+            publisher.notifications_read_all(user_id)
+        return updated
 
     def _to_domain(self, m: NotificationModel) -> Notification:
         return Notification(
@@ -69,5 +186,7 @@ class DjangoNotificationRepository(NotificationRepository):
             action=m.action,
             resource_id=m.resource_id,
             level=m.level,
+            occurrences=m.occurrences,
+            last_seen_at=m.last_seen_at,
         )
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.db import transaction
+
+from notifications.infraestructure.persistence.django.models import NotificationModel
+
+
+def expired_read(cutoff: datetime):
+    """Read notifications created before cutoff (unread ones are never purged)."""
+    return NotificationModel.objects.filter(is_read=True, created_at__lt=cutoff)
+
+
+def purge_read(cutoff: datetime, batch_size: int = 1000, archive_path: Path | None = None) -> int:
+    """
+    Deletes the expired read notifications in batches of batch_size rows, each in its own
+    short transaction, walking the primary key. With archive_path every batch is appended
+    to it (JSONL gzip) before being deleted. Returns the number of deleted rows.
+    """
+    batch_size = max(1, batch_size)
+    qs = expired_read(cutoff).order_by("id")
+    total, last_id = 0, 0
+
+    fh, tmp = None, None
+    if archive_path is not None:
+        archive_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = archive_path.with_name(archive_path.name + ".part")
+        fh = gzip.open(tmp, "wt", encoding="utf-8")
+    try:
+        while True:
+            rows = list(qs.filter(id__gt=last_id).values()[:batch_size])
+            if not rows:
+                break
+            ids = [row["id"] for row in rows]
+            if fh is not None:
+                for row in rows:
+                    fh.write(json.dumps(row, default=str))
+                    fh.write("\n")
+                # Archived rows reach the disk before they leave the database
+                fh.flush()
+            with transaction.atomic():
+                total += NotificationModel.objects.filter(id__in=ids, is_read=True).delete()[0]
+            last_id = ids[-1]
+    finally:
+        if fh is not None:
+            fh.close()
+            # An interrupted run leaves the .part file with what was already deleted
+            if total:
+                tmp.replace(archive_path)
+            elif tmp.exists():
+                tmp.unlink()
+    return total
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import queue
+import threading
+
+from django.conf import settings
+
+# Event types pushed to clients
+EVENT_CREATED = "notification"  # new notification, unread_delta=+1
+EVENT_READ = "read"  # one notification marked read, unread_delta=-1
+EVENT_READ_ALL = "read_all"  # everything read, unread_count=0
+EVENT_RESYNC = "resync"  # events were dropped: the client should refetch
+
+
+class Subscription:
+    """Events for one connected stream. Bounded: a stalled client cannot grow memory."""
+
+    def __init__(self, user_id: int, max_queue_size: int):
+        self.user_id = user_id
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max(1, int(max_queue_size)))
+        self.overflowed = False
+
+    def put(self, event: dict) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+    def get(self, timeout: float) -> dict | None:
+        if self.overflowed:
+            self.overflowed = False
+            self._drain()
+            return {"type": EVENT_RESYNC}
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+
+class NotificationHub:
+    """
+    In-process pub/sub keyed by user id. Only reaches streams served by this process;
+    with PostgreSQL every process receives the events through LISTEN/NOTIFY
+    (postgres_listener) and dispatches them here.
+    Each open stream holds a server thread, so at most max_subscriptions are accepted.
+    """
+
+    def __init__(self, max_queue_size: int = 100, max_subscriptions: int = 50):
+        self.max_queue_size = max_queue_size
+        self.max_subscriptions = max_subscriptions
+        self._lock = threading.Lock()
+        self._subscriptions: dict[int, set[Subscription]] = {}
+        self._count = 0
+
+    def subscribe(self, user_id: int) -> Subscription | None:
+        """None when the process already serves max_subscriptions streams."""
+        subscription = Subscription(user_id, self.max_queue_size)
+        with self._lock:
+            if self._count >= self.max_subscriptions:
+                return None
+            self._subscriptions.setdefault(user_id, set()).add(subscription)
+            self._count += 1
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.user_id)
+            if subscriptions is None or subscription not in subscriptions:
+                return
+            subscriptions.discard(subscription)
+            self._count -= 1
+            if not subscriptions:
+                del self._subscriptions[subscription.user_id]
+
+    def dispatch(self, event: dict) -> int:
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.get("user_id"), ()))
+        for subscription in subscriptions:
+            subscription.put(event)
+        return len(subscriptions)
+
+
+_hub: NotificationHub | None = None
+_hub_lock = threading.Lock()
+
+
+def get_notification_hub() -> NotificationHub:
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = NotificationHub(
+                    max_queue_size=getattr(settings, "NOTIFICATIONS_STREAM_QUEUE_SIZE", 100),
+                    max_subscriptions=getattr(settings, "NOTIFICATIONS_STREAM_MAX_CONNECTIONS", 50),
+                )
+    return _hub
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import select
+import threading
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+
+from notifications.infraestructure.realtime.hub import NotificationHub, get_notification_hub
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "snies_notifications"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7500
+
+
+def encode_event(event: dict) -> str:
+    payload = json.dumps(event, default=str, separators=(",", ":"))
+    if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+        # Long message: send the event without the notification body, the client refetches it
+        event = {k: v for k, v in event.items() if k != "notification"}
+        payload = json.dumps(event, default=str, separators=(",", ":"))
+    return payload
+
+
+def notify(events: list[dict]) -> None:
+    """Broadcasts events to every process listening on CHANNEL (this one included)."""
+    if not events:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+            [CHANNEL, [encode_event(e) for e in events]],
+        )
+
+
+class PostgresNotificationListener:
+    """
+    Bridge between processes: one LISTEN connection per process, started with the first
+    stream, that forwards each NOTIFY on CHANNEL to the in-process hub.
+    - Idle connections are checked every keepalive seconds; on errors it reconnects with
+      backoff (events sent while disconnected are lost, clients resync on reconnect).
+    - Relies on the psycopg2 connection API (notifies / poll), as pinned in requirements.
+    """
+
+    def __init__(self, hub: NotificationHub, keepalive: float = 30.0):
+        self.hub = hub
+        self.keepalive = max(1.0, float(keepalive))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def ensure_started(self) -> None:
+        # Re-create the thread after a fork (gunicorn workers)
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="notifications-listener", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            started = time.monotonic()
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Notifications LISTEN connection failed; reconnecting")
+            if time.monotonic() - started > 60:
+                backoff = 1.0
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def _listen(self) -> None:
+        wrapper = connections.create_connection(DEFAULT_DB_ALIAS)
+        try:
+            wrapper.ensure_connection()
+            wrapper.set_autocommit(True)
+            raw = wrapper.connection
+            with raw.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+            while True:
+                readable, _, _ = select.select([raw], [], [], self.keepalive)
+                if not readable:
+                    with raw.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                raw.poll()
+                while raw.notifies:
+                    self._dispatch(raw.notifies.pop(0).payload)
+        finally:
+            wrapper.close()
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed notification event payload")
+            return
+        self.hub.dispatch(event)
+
+
+_listener: PostgresNotificationListener | None = None
+_listener_lock = threading.Lock()
+
+
+def ensure_listener() -> None:
+    """Starts the LISTEN bridge of this process (no-op on other database backends)."""
+    global _listener
+    if connection.vendor != "postgresql":
+        return
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                _listener = PostgresNotificationListener(get_notification_hub())
+    _listener.ensure_started()
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+
+from django.db import connection, transaction
+
+from notifications.domain.entities.notification import Notification
+from notifications.infraestructure.realtime.hub import (
+    EVENT_CREATED,
+    EVENT_READ,
+    EVENT_READ_ALL,
+    get_notification_hub,
+)
+from notifications.infraestructure.realtime.postgres_listener import notify
+
+logger = logging.getLogger(__name__)
+
+
+def publish_notification_events(events: list[dict]) -> None:
+    """
+    Sends events ({"type", "user_id", ...}) to the users' open streams once the current
+    transaction commits. Best effort: a failure never breaks the write.
+    """
+
+    def send() -> None:
+        try:
+            if connection.vendor == "postgresql":
+                notify(events)
+            else:
+                hub = get_notification_hub()
+                for event in events:
+                    hub.dispatch(event)
+        except Exception:
+            logger.exception("Could not publish %d notification event(s)", len(events))
+
+    if events:
+        transaction.on_commit(send)
+
+
+def publish_notification_event(event: dict) -> None:
+    publish_notification_events([event])
+
+
+def created_event(n: Notification, unread_delta: int = 1) -> dict:
+    # unread_delta=0: an unread notification absorbed more occurrences (coalescing)
+    return {
+        "type": EVENT_CREATED,
+        "user_id": n.user_id,
+        "unread_delta": unread_delta,
+        # Same shape as the items of the notifications list
+        "notification": {
+            "id": n.id,
+            "created_at": n.created_at.isoformat() if n.created_at else None,
+            "is_read": n.is_read,
+            "read_at": n.read_at.isoformat() if n.read_at else None,
+            "title": n.title,
+            "message": n.message,
+            "module": n.module,
+            "action": n.action,
+            "resource_id": n.resource_id,
+            "level": n.level,
+            "occurrences": n.occurrences,
+            "last_seen_at": n.last_seen_at.isoformat() if n.last_seen_at else None,
+        },
+    }
+
+
+def notification_read(user_id: int, notification_id: int) -> None:
+    publish_notification_event(
+        {"type": EVENT_READ, "user_id": user_id, "id": notification_id, "unread_delta": -1}
+    )
+
+
+def notifications_read_all(user_id: int) -> None:
+    publish_notification_event({"type": EVENT_READ_ALL, "user_id": user_id, "unread_count": 0})
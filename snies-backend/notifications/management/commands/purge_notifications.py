@@ -0,0 +1,61 @@
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from notifications.infraestructure.persistence.django.notification_retention import (
+    expired_read,
+    purge_read,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Elimina por lotes las notificaciones leídas con más de N días, opcionalmente "
+        "archivándolas antes (JSONL gzip). Las no leídas nunca se eliminan."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "NOTIFICATIONS_RETENTION_DAYS", 90),
+            help="Días que se conservan las notificaciones leídas (0 = no eliminar).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="Filas eliminadas por transacción."
+        )
+        parser.add_argument(
+            "--archive-dir",
+            default=str(getattr(settings, "NOTIFICATIONS_ARCHIVE_DIR", "") or ""),
+            help="Directorio donde archivar (.jsonl.gz); vacío = eliminar sin archivar.",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Solo cuenta, no elimina.")
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        if days <= 0:
+            self.stdout.write("Retención desactivada (--days 0)")
+            return
+        cutoff = timezone.now() - timedelta(days=days)
+
+        if options["dry_run"]:
+            count = expired_read(cutoff).count()
+            self.stdout.write(f"{count} notificación(es) leídas anteriores a {cutoff:%Y-%m-%d}")
+            return
+
+        archive_path = None
+        if options["archive_dir"]:
+            stamp = timezone.now().strftime("%Y%m%d-%H%M%S")
+            archive_path = Path(options["archive_dir"]) / f"notifications-{stamp}.jsonl.gz"
+
+        try:
+            deleted = purge_read(cutoff, options["batch_size"], archive_path)
+        except Exception as exc:
+            raise CommandError(f"No se pudieron purgar las notificaciones: {exc}") from exc
+
+        if archive_path is not None and deleted:
+            self.stdout.write(f"Archivadas en {archive_path}")
+        self.stdout.write(self.style.SUCCESS(f"{deleted} notificación(es) eliminadas"))
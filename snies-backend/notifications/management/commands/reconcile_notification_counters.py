@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from notifications.infraestructure.persistence.django.notification_counters import reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara el contador de no leídas de cada usuario (notification_counters) con las "
+        "notificaciones reales y corrige las diferencias."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Limita la revisión a un usuario (se puede repetir).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Solo informa, no corrige nada.")
+
+    def handle(self, *args, **options):
+        drifted = reconcile(options.get("user_ids"), dry_run=options["dry_run"])
+        for user_id, stored, actual in drifted:
+            shown = "sin fila" if stored is None else stored
+            self.stdout.write(f"usuario {user_id}: contador {shown}, real {actual}")
+
+        if options["dry_run"]:
+            self.stdout.write(f"{len(drifted)} contador(es) con diferencias (sin cambios)")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{len(drifted)} contador(es) corregidos"))
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NotificationCounterModel",
+            fields=[
+                ("user_id", models.IntegerField(primary_key=True, serialize=False)),
+                ("unread_count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "notification_counters",
+            },
+        ),
+    ]
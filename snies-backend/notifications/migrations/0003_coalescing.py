@@ -0,0 +1,23 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0002_notification_counters"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notificationmodel",
+            name="last_seen_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="notificationmodel",
+            name="occurrences",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
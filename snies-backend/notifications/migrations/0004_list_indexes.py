@@ -0,0 +1,25 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_coalescing"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notificationmodel",
+            index=models.Index(fields=["user_id", "id"], name="notifications_user_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="notificationmodel",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user_id", "id"],
+                name="notifications_unread_idx",
+            ),
+        ),
+    ]
@@ -1,2 +1,5 @@
-from notifications.infraestructure.persistence.django.models import NotificationModel
+from notifications.infraestructure.persistence.django.models import (
+    NotificationCounterModel,
+    NotificationModel,
+)
 
@@ -4,6 +4,7 @@ from notifications.presentation.api.notifications.views import (
     NotificationListAPIView,
     NotificationMarkAllReadAPIView,
     NotificationMarkReadAPIView,
+    NotificationStreamAPIView,
     NotificationUnreadCountAPIView,
 )
 
@@ -11,6 +12,7 @@ from notifications.presentation.api.notifications.views import (
 urlpatterns = [
     path("", NotificationListAPIView.as_view(), name="notifications-list"),
     path("unread-count/", NotificationUnreadCountAPIView.as_view(), name="notifications-unread-count"),
+    path("stream/", NotificationStreamAPIView.as_view(), name="notifications-stream"),
     path("<int:id>/read/", NotificationMarkReadAPIView.as_view(), name="notifications-read"),
     path("read-all/", NotificationMarkAllReadAPIView.as_view(), name="notifications-read-all"),
 ]
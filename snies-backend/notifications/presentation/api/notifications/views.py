@@ -1,15 +1,56 @@
+import json
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.http import StreamingHttpResponse
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer, JSONRenderer
 from rest_framework.response import Response
 from rest_framework import status
 
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import decode_cursor, encode_cursor
 from notifications.application.use_cases.list_notifications import ListNotificationsUseCase
+from notifications.application.use_cases.list_notifications_keyset import (
+    ListNotificationsKeysetUseCase,
+)
 from notifications.application.use_cases.mark_all_read import MarkAllReadUseCase
 from notifications.application.use_cases.mark_notification_read import MarkNotificationReadUseCase
 from notifications.application.use_cases.unread_count import UnreadCountUseCase
 from notifications.infraestructure.persistence.django.notification_repository import (
     DjangoNotificationRepository,
 )
+from notifications.infraestructure.realtime.hub import get_notification_hub
+from notifications.infraestructure.realtime.postgres_listener import ensure_listener
+
+
+def _notification_to_dict(n) -> dict:
+    return {
+        "id": n.id,
+        "created_at": n.created_at.isoformat() if n.created_at else None,
+        "is_read": n.is_read,
+        "read_at": n.read_at.isoformat() if n.read_at else None,
+        "title": n.title,
+        "message": n.message,
+        "module": n.module,
+        "action": n.action,
+        "resource_id": n.resource_id,
+        "level": n.level,
+        "occurrences": n.occurrences,
+        "last_seen_at": n.last_seen_at.isoformat() if n.last_seen_at else None,
+    }
+
+
+def _parse_is_read(value: str | None) -> bool | None:
+    if value is None:
+        return None
+    v = value.strip().lower()
+    if v in ("true", "1", "yes"):
+        return True
+    if v in ("false", "0", "no"):
+        return False
+    raise ValueError("is_read must be true/false")
 
 
 class NotificationListAPIView(AuditedAPIView):
@@ -17,6 +58,9 @@ class NotificationListAPIView(AuditedAPIView):
     audit_enabled = False
 
     def get(self, request):
+        if "cursor" in request.query_params:
+            return self._list_keyset(request)
+
         user_id = request.user.id
         try:
             page = int(request.query_params.get("page", "1"))
@@ -24,16 +68,10 @@ class NotificationListAPIView(AuditedAPIView):
         except ValueError:
             return Response({"error": "Invalid pagination params"}, status=status.HTTP_400_BAD_REQUEST)
 
-        is_read_param = request.query_params.get("is_read")
-        is_read = None
-        if is_read_param is not None:
-            v = is_read_param.strip().lower()
-            if v in ("true", "1", "yes"):
-                is_read = True
-            elif v in ("false", "0", "no"):
-                is_read = False
-            else:
-                return Response({"error": "is_read must be true/false"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            is_read = _parse_is_read(request.query_params.get("is_read"))
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         use_case = ListNotificationsUseCase(notification_repository=DjangoNotificationRepository())
         total, items = use_case.execute(user_id=user_id, page=page, page_size=page_size, is_read=is_read)
@@ -41,24 +79,54 @@ class NotificationListAPIView(AuditedAPIView):
             "count": total,
             "page": page,
             "page_size": page_size,
-            "results": [
-                {
-                    "id": n.id,
-                    "created_at": n.created_at.isoformat() if n.created_at else None,
-                    "is_read": n.is_read,
-                    "read_at": n.read_at.isoformat() if n.read_at else None,
-                    "title": n.title,
-                    "message": n.message,
-                    "module": n.module,
-                    "action": n.action,
-                    "resource_id": n.resource_id,
-                    "level": n.level,
-                }
-                for n in items
-            ],
+            "results": [_notification_to_dict(n) for n in items],
         }
         return Response(data, status=status.HTTP_200_OK)
 
+    def _list_keyset(self, request):
+        """
+        GET ?cursor=&limit=20&is_read=true|false&count=exact|none
+          -> {"count", "limit", "next_cursor", "results"} (newest first)
+        Pass next_cursor back as ?cursor= to get the following page (null = last page).
+        """
+        params = request.query_params
+        try:
+            limit = int(params.get("limit", "20"))
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            is_read = _parse_is_read(params.get("is_read"))
+            before_id = decode_cursor(params.get("cursor", "").strip())
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        count_mode = params.get("count", "exact")
+        if count_mode not in ("exact", "none"):
+            return Response(
+                {"error": "count must be 'exact' or 'none'"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        use_case = ListNotificationsKeysetUseCase(
+            notification_repository=DjangoNotificationRepository()
+        )
+        page = use_case.execute(
+            user_id=request.user.id,
+            limit=limit,
+            before_id=before_id,
+            is_read=is_read,
+            with_count=count_mode == "exact",
+        )
+        return Response(
+            {
+                "count": page.count,
+                "limit": min(max(limit, 1), 200),
+                "next_cursor": encode_cursor(page.next_after_id),
+                "results": [_notification_to_dict(n) for n in page.results],
+            },
+            status=status.HTTP_200_OK,
+        )
+
 
 class NotificationUnreadCountAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated]
@@ -70,6 +138,102 @@ class NotificationUnreadCountAPIView(AuditedAPIView):
         return Response({"unread_count": count}, status=status.HTTP_200_OK)
 
 
+class EventStreamRenderer(BaseRenderer):
+    media_type = "text/event-stream"
+    format = "event-stream"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only errors (401/403) go through here; the stream itself is a StreamingHttpResponse
+        return json.dumps(data).encode()
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+# Seconds the client waits (polling unread-count) after a 503
+STREAM_BUSY_RETRY_AFTER = 30
+
+
+class _ClosingStream:
+    """
+    Iterable of the stream that always releases the subscription on close(): the server
+    closes the response even if the generator never started (then its finally never runs).
+    """
+
+    def __init__(self, events, on_close):
+        self._events = events
+        self._on_close = on_close
+
+    def __iter__(self):
+        return self._events
+
+    def close(self):
+        try:
+            self._events.close()
+        finally:
+            self._on_close()
+
+
+class NotificationStreamAPIView(AuditedAPIView):
+    """
+    Server-sent events with the user's notification changes, replaces polling unread-count.
+    Sends the current unread_count first, then one event per change (notification / read /
+    read_all / resync) and a comment as heartbeat. The stream ends after
+    NOTIFICATIONS_STREAM_MAX_SECONDS; the client reconnects and gets a fresh count.
+    Each open stream holds a server thread: past NOTIFICATIONS_STREAM_MAX_CONNECTIONS per
+    process the answer is 503 + Retry-After and the client polls unread-count meanwhile.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+    audit_enabled = False
+
+    def get(self, request):
+        hub = get_notification_hub()
+        # Subscribe before counting so nothing created in between is missed
+        subscription = hub.subscribe(request.user.id)
+        if subscription is None:
+            return Response(
+                {"detail": "Too many open streams, poll unread-count instead"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(STREAM_BUSY_RETRY_AFTER)},
+            )
+        ensure_listener()
+        response = StreamingHttpResponse(
+            _ClosingStream(
+                self._events(subscription), on_close=lambda: hub.unsubscribe(subscription)
+            ),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # nginx must not buffer the stream
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    def _events(self, subscription):
+        heartbeat = float(getattr(settings, "NOTIFICATIONS_STREAM_HEARTBEAT", 25))
+        max_seconds = float(getattr(settings, "NOTIFICATIONS_STREAM_MAX_SECONDS", 300))
+        use_case = UnreadCountUseCase(notification_repository=DjangoNotificationRepository())
+        count = use_case.execute(user_id=subscription.user_id)
+        # The stream is long-lived: do not hold a database connection while idle
+        connection.close()
+
+        yield f"retry: {int(heartbeat * 1000)}\n\n"
+        yield _sse("unread_count", {"unread_count": count})
+        deadline = time.monotonic() + max_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            event = subscription.get(timeout=min(heartbeat, remaining))
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            data = {k: v for k, v in event.items() if k not in ("type", "user_id")}
+            yield _sse(event["type"], data)
+
+
 class NotificationMarkReadAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated]
     audit_enabled = False
@@ -0,0 +1,499 @@
+"""
+Plantilla SNIES de actividades de software (hoja "Software") descrita una sola vez.
+
+Cada columna declara su letra, la ruta de encabezado (filas 3..6), el atributo o desglose
+de beneficiarios que representa y sus conversores. El export la compila en un RowEncoder
+y el import en un RowDecoder (con las posiciones de cada hoja); las etiquetas del
+encabezado que escribe el export salen de la misma ruta que el import busca al leer.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable
+
+from openpyxl.utils import column_index_from_string
+
+from software_activities.domain.entities.software_activity import BeneficiaryBreakdown
+
+# Fila de la plantilla donde empieza la ruta de encabezado (header[0])
+HEADER_FIRST_ROW = 3
+
+
+# ---- Conversores ----
+
+
+def excel_serial_to_date(value: Any) -> date | None:
+    """
+    Convierte seriales de Excel (e.g., 45776) a date.
+    Excel usa 1899-12-30 como base (por el bug de 1900).
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if isinstance(value, datetime):
+        return value.date()
+    try:
+        n = float(value)
+    except Exception:
+        return None
+    base = date(1899, 12, 30)
+    return base + timedelta(days=int(n))
+
+
+def to_int(value: Any) -> int | None:
+    if value is None or value == "":
+        return None
+    try:
+        return int(float(value))
+    except Exception:
+        return None
+
+
+def to_decimal(value: Any) -> Decimal | None:
+    if value is None or value == "":
+        return None
+    try:
+        raw = str(value)
+        if "." in raw:
+            return Decimal(raw).quantize(Decimal("1.00"))
+        return Decimal(raw)
+    except Exception:
+        return None
+
+
+def text(value: Any) -> str | None:
+    return str(value).strip() if value else None
+
+
+def flag(value: Any) -> bool:
+    return str(value).strip().upper() == "SI" if value is not None else False
+
+
+def _int_or_zero(value: Any) -> int:
+    return to_int(value) or 0
+
+
+def _stripped(value: Any) -> str:
+    return str(value or "").strip()
+
+
+def _campus(value: Any) -> str:
+    return str(value or "").strip() or "CÚCUTA"
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+def _or_blank(value: Any) -> Any:
+    return value or ""
+
+
+def _str_or_blank(value: Any) -> str:
+    return str(value) if value is not None else ""
+
+
+def _yes_no(value: bool) -> str:
+    return "SI" if bool(value) else "NO"
+
+
+def _fmt_date(value: date | None):
+    # openpyxl soporta date y Excel lo renderiza como fecha (no serial visible)
+    return value if value else None
+
+
+# ---- Desglose de beneficiarios ----
+
+
+@lru_cache(maxsize=4096)
+def norm_key(s: str) -> str:
+    s = (s or "").strip()
+    s = unicodedata.normalize("NFKD", s)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = re.sub(r"\s+", " ", s).lower()
+    # compat: a veces el header trae "Programa X" pero en BD guardamos solo "X"
+    if s.startswith("programa "):
+        s = s[len("programa ") :].strip()
+    return s
+
+
+class BreakdownIndex:
+    """
+    Desglose de una actividad indexado por llave normalizada, más el total por población.
+    Si hay varias filas con la misma llave gana la primera.
+    """
+
+    __slots__ = ("by_level", "any_level", "totals")
+
+    def __init__(self, bds: list[BeneficiaryBreakdown]):
+        self.by_level: dict[tuple, int] = {}
+        self.any_level: dict[tuple, int] = {}
+        self.totals: dict[str, int] = {}
+        for b in bds:
+            key = (norm_key(b.population), norm_key(b.campus), norm_key(b.program))
+            self.any_level.setdefault(key, b.count)
+            self.by_level.setdefault(key + (norm_key(b.level),), b.count)
+            self.totals[b.population] = self.totals.get(b.population, 0) + int(b.count or 0)
+
+
+# ---- Descriptor ----
+
+
+@dataclass(frozen=True)
+class TemplateColumn:
+    letter: str
+    header: tuple[str, str, str, str]  # textos de las filas 3..6 ("" = vacía o dentro de un merge)
+    field: str | None = None  # atributo de SoftwareActivity
+    encode: Callable[[Any], Any] = _same  # export: valor del atributo -> celda
+    decode: Callable[[Any], Any] | None = None  # import: celda -> atributo (None = no se importa)
+    names: tuple[str, ...] = ()  # import: encabezados aceptados en orden (default: la etiqueta)
+    fallback: bool = False  # import: sin encabezado reconocible se lee la posición de la letra
+    breakdown: tuple[str, str, str, str | None] | None = None  # población, sede, programa, nivel
+    total: str | None = None  # export: suma del desglose de esa población
+    is_date: bool = False
+    exported: bool = True
+
+    @property
+    def index(self) -> int:
+        """Posición base 0 en la fila."""
+        return column_index_from_string(self.letter) - 1
+
+    @property
+    def label(self) -> str:
+        """Etiqueta más específica de la ruta de encabezado."""
+        return next((part for part in reversed(self.header) if part), "")
+
+    @property
+    def import_names(self) -> tuple[str, ...]:
+        return self.names or (self.label,)
+
+
+_POPULATION = "CLASIFICACIÓN DE POBLACIÓN BENEFICIADA"
+_SPEAKER = "SI LA ACTIVIDAD ES FORMACIÓN CONTINUA, INDIQUE DATOS DEL CONFERENCISTA / PONENTE"
+_CONSULTANCY = "SI LA ACTIVIDAD ES UNA CONSULTORIA DILIGENCIE:"
+_EVIDENCE = "EVIDENCIAS DE LA ACTIVIDAD"
+_BENEFICIARY_TYPE = "TIPO DE BENEFICIARIO"
+_CINE = "CLASIFICACIÓN INTERNACIONAL NORMALIZADA DE LA EDUCACIÓN DE SUPERIOR"
+
+# Bloques de desglose (fila 4) -> (población, sede) como se guardan en BD
+_BREAKDOWN_GROUPS = {
+    "ESTUDIANTES CÚCUTA": ("students", "CÚCUTA"),
+    "ESTUDIANTES OCAÑA": ("students", "OCAÑA"),
+    "GRADUADOS CÚCUTA": ("graduates", "CÚCUTA"),
+    "GRADUADOS OCAÑA": ("graduates", "OCAÑA"),
+    "PROFESOR": ("professor", "N/A"),
+}
+
+
+def _base(letter: str, label: str, field: str, decode, sub: str = "", **kwargs) -> TemplateColumn:
+    return TemplateColumn(
+        letter, ("", "", label, sub), field, decode=decode, fallback=True, **kwargs
+    )
+
+
+def _beneficiary(letter: str, label: str, field: str | None, **kwargs) -> TemplateColumn:
+    return TemplateColumn(letter, ("", _BENEFICIARY_TYPE, label, ""), field, **kwargs)
+
+
+def _breakdown(letter: str, group: str, program: str, level: str = "") -> TemplateColumn:
+    # El nivel (fila 6) solo existe en los bloques de estudiantes; el resto son totales
+    population, campus = _BREAKDOWN_GROUPS[group]
+    return TemplateColumn(
+        letter,
+        (_POPULATION, group, program, level),
+        breakdown=(population, campus, program, level or None),
+    )
+
+
+def _trailing(letter: str, group: str, label: str, field: str, encode, decode) -> TemplateColumn:
+    return TemplateColumn(letter, (group, "", label, ""), field, encode=encode, decode=decode)
+
+
+_FINANCIERA = "Programa Admón Financiera"
+_LOGISTICA = "Programa Logitica Empresarial"
+_TURISMO = "Programa Admón Turistica y Hotelera"
+_SOFTWARE = "Programa Ing. Software"
+_NEGOCIOS = "Programa Admón Negocios Internacionales"
+_NEGOCIOS_PRESENCIAL = "Programa Admón Negocios Internacionales (PRESENCIAL)"
+_NEGOCIOS_DISTANCIA = "Programa Admón Negocios Internacionales (DISTANCIA)"
+_DISENO = "Diseño Grafico"
+_MODA = "Diseño y Admón de la moda"
+_T, _TG, _P = "Tecnico", "Tecnologo", "Profesional"
+_EST_CUC, _EST_OCA = "ESTUDIANTES CÚCUTA", "ESTUDIANTES OCAÑA"
+_GRA_CUC, _GRA_OCA = "GRADUADOS CÚCUTA", "GRADUADOS OCAÑA"
+
+COLUMNS: tuple[TemplateColumn, ...] = (
+    _base("A", "AÑO", "year", _int_or_zero),
+    _base("B", "SEMESTRE", "semester", _int_or_zero),
+    _base(
+        "C",
+        "FECHA INICIO DE LA ACTIVIDAD",
+        "start_date",
+        excel_serial_to_date,
+        encode=_fmt_date,
+        is_date=True,
+    ),
+    _base(
+        "D",
+        "FECHA FIN DE LA ACTIVIDAD",
+        "end_date",
+        excel_serial_to_date,
+        encode=_fmt_date,
+        is_date=True,
+    ),
+    _base("E", "LUGAR DE EJECUCION DE LA ACTIVIDAD", "execution_place", _stripped),
+    _base("F", "SEDE: CÚCUTA / OCAÑA", "campus", _campus),
+    _base(
+        "G",
+        "NOMBRE_DE LA ACTIVDAD",
+        "activity_name",
+        _stripped,
+        names=("NOMBRE_DE LA ACTIVIDAD", "NOMBRE_DE LA ACTIVDAD"),
+    ),
+    _base(
+        "H",
+        "LA ACTIVIDAD SE DESARROLLO EN MARCO DE UN CONVENIO-  DETALLE EL NOMBRE DE LA ENTIDAD",
+        "agreement_entity",
+        text,
+        encode=_or_blank,
+    ),
+    _base("I", "DESCRIPCIÓN", "description", text, encode=_or_blank),
+    # En la plantilla real el CINE viene en la misma columna J (como "613  Desarrollo...")
+    _base(
+        "J",
+        _CINE,
+        "cine_isced_name",
+        text,
+        sub="|ID_CINE_CAMPO_DETALLADO",
+        encode=_or_blank,
+        names=(_CINE,),
+    ),
+    _base(
+        "J", _CINE, "cine_field_detailed_id", text, sub="|ID_CINE_CAMPO_DETALLADO", exported=False
+    ),
+    _base("K", "", "num_hours", to_int, sub="NUM_HORAS", encode=_or_blank),
+    _base("L", "", "activity_type", text, sub="ID_TIPO_ ACTIVIDAD", encode=_or_blank),
+    _base(
+        "M",
+        "",
+        "course_value",
+        to_decimal,
+        sub="VALOR_CURSO (COSTO POR PERSONA DEL EVENTO- INSCRIPCIÓN )",
+        encode=_str_or_blank,
+    ),
+    _base(
+        "N",
+        "",
+        "teacher_document_type",
+        text,
+        sub="ID_TIPO_DOCUMENTO DOCENTE QUE IMPARTIO  EL CURSO",
+        encode=_or_blank,
+    ),
+    _base(
+        "O",
+        "",
+        "teacher_document_number",
+        text,
+        sub="NUM_DOCUMENTO DOCENTE QUE IMPARTIO EL CURSO",
+        encode=_or_blank,
+    ),
+    # Tipo de beneficiario: estudiantes/graduados se totalizan desde el desglose
+    _beneficiary("P", "1. ESTUDIANTE", None, total="students"),
+    _beneficiary("Q", "2. GRADUADO", None, total="graduates"),
+    _beneficiary(
+        "R", "3 PROFESOR", "professors_count", encode=_or_blank, decode=to_int, fallback=True
+    ),
+    _beneficiary(
+        "S",
+        "4 ADMINISTRATIVO IES",
+        "administrative_count",
+        encode=_or_blank,
+        decode=to_int,
+        fallback=True,
+    ),
+    _beneficiary(
+        "T",
+        "5PERSONA NO VINCULADA",
+        "external_people_count",
+        encode=_or_blank,
+        decode=to_int,
+        fallback=True,
+    ),
+    _beneficiary(
+        "U",
+        "TOTAL BENEFICIAIROS",
+        "total_beneficiaries",
+        encode=_or_blank,
+        decode=to_int,
+        fallback=True,
+    ),
+    # Estudiantes Cúcuta (V..AR)
+    _breakdown("V", _EST_CUC, _FINANCIERA, _T),
+    _breakdown("W", _EST_CUC, _FINANCIERA, _TG),
+    _breakdown("X", _EST_CUC, _FINANCIERA, _P),
+    _breakdown("Y", _EST_CUC, _LOGISTICA, _T),
+    _breakdown("Z", _EST_CUC, _LOGISTICA, _TG),
+    _breakdown("AA", _EST_CUC, _TURISMO, _T),
+    _breakdown("AB", _EST_CUC, _TURISMO, _TG),
+    _breakdown("AC", _EST_CUC, _TURISMO, _P),
+    _breakdown("AD", _EST_CUC, _SOFTWARE, _T),
+    _breakdown("AE", _EST_CUC, _SOFTWARE, _TG),
+    _breakdown("AF", _EST_CUC, _SOFTWARE, _P),
+    _breakdown("AG", _EST_CUC, _NEGOCIOS_PRESENCIAL, _T),
+    _breakdown("AH", _EST_CUC, _NEGOCIOS_PRESENCIAL, _TG),
+    _breakdown("AI", _EST_CUC, _NEGOCIOS_PRESENCIAL, _P),
+    _breakdown("AJ", _EST_CUC, _NEGOCIOS_DISTANCIA, _T),
+    _breakdown("AK", _EST_CUC, _NEGOCIOS_DISTANCIA, _TG),
+    _breakdown("AL", _EST_CUC, _NEGOCIOS_DISTANCIA, _P),
+    _breakdown("AM", _EST_CUC, _DISENO, _T),
+    _breakdown("AN", _EST_CUC, _DISENO, _TG),
+    _breakdown("AO", _EST_CUC, _DISENO, _P),
+    _breakdown("AP", _EST_CUC, _MODA, _T),
+    _breakdown("AQ", _EST_CUC, _MODA, _TG),
+    _breakdown("AR", _EST_CUC, _MODA, _P),
+    # Estudiantes Ocaña, solo tecnólogo/profesional (AS..AX)
+    _breakdown("AS", _EST_OCA, _FINANCIERA, _TG),
+    _breakdown("AT", _EST_OCA, _FINANCIERA, _P),
+    _breakdown("AU", _EST_OCA, _NEGOCIOS_PRESENCIAL, _TG),
+    _breakdown("AV", _EST_OCA, _NEGOCIOS_PRESENCIAL, _P),
+    _breakdown("AW", _EST_OCA, _DISENO, _TG),
+    _breakdown("AX", _EST_OCA, _DISENO, _P),
+    # Graduados Cúcuta, totales por programa (AY..BE)
+    _breakdown("AY", _GRA_CUC, _FINANCIERA),
+    _breakdown("AZ", _GRA_CUC, _LOGISTICA),
+    _breakdown("BA", _GRA_CUC, _TURISMO),
+    _breakdown("BB", _GRA_CUC, _SOFTWARE),
+    _breakdown("BC", _GRA_CUC, _NEGOCIOS),
+    _breakdown("BD", _GRA_CUC, _DISENO),
+    _breakdown("BE", _GRA_CUC, _MODA),
+    # Graduados Ocaña (BF..BH)
+    _breakdown("BF", _GRA_OCA, _FINANCIERA),
+    _breakdown("BG", _GRA_OCA, _NEGOCIOS),
+    _breakdown("BH", _GRA_OCA, _DISENO),
+    # Profesor, totales por programa (BI..BO)
+    _breakdown("BI", "PROFESOR", _FINANCIERA),
+    _breakdown("BJ", "PROFESOR", _LOGISTICA),
+    _breakdown("BK", "PROFESOR", _TURISMO),
+    _breakdown("BL", "PROFESOR", _SOFTWARE),
+    _breakdown("BM", "PROFESOR", _NEGOCIOS),
+    _breakdown("BN", "PROFESOR", _DISENO),
+    _breakdown("BO", "PROFESOR", _MODA),
+    # Duplicados en la plantilla (clasificación): repetimos totales
+    TemplateColumn(
+        "BP", (_POPULATION, "ADMINISTRATIVO", "", ""), "administrative_count", encode=_or_blank
+    ),
+    TemplateColumn(
+        "BQ",
+        (_POPULATION, "PERSONA NO VINCULADA", "", ""),
+        "external_people_count",
+        encode=_or_blank,
+    ),
+    # Ponente / formación continua
+    _trailing("BR", _SPEAKER, "NOMBRES Y APELLIDOS", "speaker_full_name", _or_blank, text),
+    _trailing("BS", _SPEAKER, "PROCEDENCIA", "speaker_origin", _or_blank, text),
+    _trailing("BT", _SPEAKER, "EMPRESA QUE REPRESENTA", "speaker_company", _or_blank, text),
+    # Consultoría
+    _trailing("BU", _CONSULTANCY, "NOMBRE_ENTIDAD", "consultancy_entity_name", _or_blank, text),
+    _trailing(
+        "BV", _CONSULTANCY, "ID_SECTOR_CONSULTORIA", "consultancy_sector_id", _or_blank, text
+    ),
+    _trailing("BW", _CONSULTANCY, "VALOR", "consultancy_value", _str_or_blank, to_decimal),
+    # Evidencias
+    _trailing(
+        "BX", _EVIDENCE, "FORMATO PLANEACIÓN DE EVENTOS", "evidence_event_planning", _yes_no, flag
+    ),
+    _trailing(
+        "BY",
+        _EVIDENCE,
+        "CONTROL ASISTENCIA ACTIVIDADES ACADEMICAS EXTRACURRICULARES",
+        "evidence_attendance_control",
+        _yes_no,
+        flag,
+    ),
+    _trailing(
+        "BZ",
+        _EVIDENCE,
+        "FORMATO GUÍA PARA EL DISEÑO DE PROGRAMAS DE EDUCACIÓN      CONTINUADA (Diplomados)",
+        "evidence_program_design_guide",
+        _yes_no,
+        flag,
+    ),
+    _trailing(
+        "CA", _EVIDENCE, "REGISTRO AUDIOVISUAL", "evidence_audiovisual_record", _yes_no, flag
+    ),
+)
+
+EXPORT_COLUMNS: tuple[TemplateColumn, ...] = tuple(c for c in COLUMNS if c.exported)
+IMPORT_COLUMNS: tuple[TemplateColumn, ...] = tuple(c for c in COLUMNS if c.decode is not None)
+
+
+def header_cells(columns: tuple[TemplateColumn, ...] = EXPORT_COLUMNS) -> dict[str, str]:
+    """
+    Etiquetas de las filas 3..6 por coordenada. Cada texto se escribe solo en la primera
+    columna de su bloque (las demás quedan dentro del merge).
+    """
+    cells: dict[str, str] = {}
+    previous: tuple[str, ...] = ()
+    for column in columns:
+        for depth, label in enumerate(column.header):
+            if label and column.header[: depth + 1] != previous[: depth + 1]:
+                cells[f"{column.letter}{HEADER_FIRST_ROW + depth}"] = label
+        previous = column.header
+    return cells
+
+
+class RowEncoder:
+    """
+    Descriptor compilado para el export: (actividad, desglose) -> valores de la fila en
+    orden de columna. Los atributos se leen con un solo attrgetter y el desglose se indexa
+    una vez por actividad.
+    """
+
+    def __init__(self, columns: tuple[TemplateColumn, ...] = EXPORT_COLUMNS):
+        self.width = max(c.index for c in columns) + 1
+        fields = [c for c in columns if c.field]
+        if len(fields) > 1:
+            self._get = attrgetter(*(c.field for c in fields))
+        else:
+            # attrgetter con un solo nombre no devuelve tupla (y sin nombres no existe)
+            self._get = lambda obj: tuple(getattr(obj, c.field) for c in fields)
+        self._fields = tuple((c.index, c.encode) for c in fields)
+        self._breakdowns = tuple(
+            (c.index, c.breakdown[3] is not None, tuple(norm_key(p) for p in c.breakdown if p))
+            for c in columns
+            if c.breakdown
+        )
+        self._totals = tuple((c.index, c.total) for c in columns if c.total)
+
+    def __call__(self, activity, bds: list[BeneficiaryBreakdown]) -> list:
+        row: list = [None] * self.width
+        for (pos, encode), value in zip(self._fields, self._get(activity)):
+            row[pos] = encode(value)
+        index = BreakdownIndex(bds)
+        by_level, any_level, totals = index.by_level, index.any_level, index.totals
+        for pos, per_level, key in self._breakdowns:
+            row[pos] = (by_level if per_level else any_level).get(key, "")
+        for pos, population in self._totals:
+            row[pos] = totals.get(population, 0) or ""
+        return row
+
+
+class RowDecoder:
+    """
+    Descriptor compilado para el import con las posiciones de una hoja concreta:
+    fila -> atributos de SoftwareActivity ya convertidos.
+    """
+
+    def __init__(self, positions: dict[str, int], columns=IMPORT_COLUMNS):
+        self._fields = tuple((c.field, positions[c.field], c.decode) for c in columns)
+
+    def __call__(self, row: tuple) -> dict[str, Any]:
+        return {field: decode(row[idx]) for field, idx, decode in self._fields}
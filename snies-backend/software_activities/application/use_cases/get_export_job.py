@@ -0,0 +1,10 @@
+from software_activities.domain.entities.export_job import ExportJob
+from software_activities.domain.ports.export_job_repository import ExportJobRepository
+
+
+class GetExportJobUseCase:
+    def __init__(self, job_repository: ExportJobRepository):
+        self.job_repository = job_repository
+
+    def execute(self, job_id: int) -> ExportJob | None:
+        return self.job_repository.get(job_id)
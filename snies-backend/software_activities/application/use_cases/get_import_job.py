@@ -0,0 +1,10 @@
+from software_activities.domain.entities.import_job import ImportJob
+from software_activities.domain.ports.import_job_repository import ImportJobRepository
+
+
+class GetImportJobUseCase:
+    def __init__(self, job_repository: ImportJobRepository):
+        self.job_repository = job_repository
+
+    def execute(self, job_id: int) -> ImportJob | None:
+        return self.job_repository.get(job_id)
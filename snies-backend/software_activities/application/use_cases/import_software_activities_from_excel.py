@@ -1,67 +1,69 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass
-from datetime import datetime, date, timedelta
-from decimal import Decimal
 import unicodedata
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Callable
 
 from openpyxl import load_workbook
 
+from software_activities.application.snies_template import (
+    IMPORT_COLUMNS,
+    RowDecoder,
+    to_int,
+)
+from software_activities.domain.entities.import_job import ImportRowError
 from software_activities.domain.entities.software_activity import (
     SoftwareActivity,
     BeneficiaryBreakdown,
+    UpsertResult,
+    activity_natural_key,
 )
+from software_activities.domain.ports.imported_file_repository import ImportedFileRepository
 from software_activities.domain.ports.software_activity_repository import (
     SoftwareActivityRepository,
 )
 
+# Filas leídas de una vez para detectar y armar los encabezados (multinivel)
+HEADER_WINDOW_ROWS = 20
+# Actividades persistidas por lote: la memoria no crece con el tamaño de la hoja
+IMPORT_CHUNK_SIZE = 500
+
 
 @dataclass(frozen=True)
 class ImportResult:
     created: int
     skipped_empty_rows: int
+    rows_parsed: int = 0
+    errors_count: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    duplicate_file: bool = False  # mismo archivo ya importado: no se leyó ni se escribió nada
 
 
-def _excel_serial_to_date(value: Any) -> date | None:
-    """
-    Convierte seriales de Excel (e.g., 45776) a date.
-    Excel usa 1899-12-30 como base (por el bug de 1900).
-    """
-    if value is None or value == "":
-        return None
-    if isinstance(value, date) and not isinstance(value, datetime):
-        return value
-    if isinstance(value, datetime):
-        return value.date()
-    try:
-        n = float(value)
-    except Exception:
-        return None
-    base = date(1899, 12, 30)
-    return base + timedelta(days=int(n))
+@dataclass(frozen=True)
+class ImportProgress:
+    rows_total: int | None  # estimado desde la dimensión de la hoja (puede faltar)
+    rows_parsed: int
+    rows_inserted: int
+    rows_skipped: int
+    errors: list[ImportRowError]  # errores nuevos desde el reporte anterior
+    rows_updated: int = 0
+    rows_unchanged: int = 0
 
 
-def _to_int(value: Any) -> int | None:
-    if value is None or value == "":
-        return None
-    try:
-        return int(float(value))
-    except Exception:
-        return None
+ProgressCallback = Callable[[ImportProgress], None]
 
 
-def _to_decimal(value: Any) -> Decimal | None:
-    if value is None or value == "":
-        return None
-    try:
-        raw = str(value)
-        if "." in raw:
-            return Decimal(raw).quantize(Decimal("1.00"))
-        return Decimal(raw)
-    except Exception:
-        return None
+def _file_digest(file_obj: BinaryIO) -> str:
+    """sha256 del archivo completo, leído por bloques; deja el archivo al inicio."""
+    digest = hashlib.sha256()
+    file_obj.seek(0)
+    for block in iter(lambda: file_obj.read(1024 * 1024), b""):
+        digest.update(block)
+    file_obj.seek(0)
+    return digest.hexdigest()
 
 
 def _norm(s: str) -> str:
@@ -88,19 +90,27 @@ def _ffill_row(values: list[str]) -> list[str]:
     return out
 
 
+def _cell(window: list[tuple], r: int, c: int) -> Any:
+    """Valor de la celda (r, c) (base 1) dentro de la ventana de encabezados."""
+    if r < 1 or r > len(window):
+        return None
+    row = window[r - 1]
+    return row[c - 1] if c <= len(row) else None
+
+
 def _build_composite_headers(
-    ws, header_rows: list[int], ffill_rows: set[int] | None = None
+    window: list[tuple], header_rows: list[int], ffill_rows: set[int] | None = None
 ) -> list[str]:
     """
     Construye encabezados por columna concatenando varias filas (header multinivel).
     Ej: "ESTUDIANTES CUCUTA Programa X Tecnico"
     """
-    max_col = ws.max_column
+    max_col = max((len(row) for row in window), default=0)
     rows = []
     for r in header_rows:
         vals = []
         for c in range(1, max_col + 1):
-            v = ws.cell(r, c).value
+            v = _cell(window, r, c)
             if v is None:
                 vals.append("")
             else:
@@ -120,10 +130,10 @@ def _build_composite_headers(
     return headers
 
 
-def _detect_header_row(ws) -> int | None:
+def _detect_header_row(window: list[tuple]) -> int | None:
     # busca una fila que contenga AÑO y SEMESTRE
-    for r in range(1, 15):
-        row = [str(c.value or "") for c in ws[r]]
+    for r in range(1, min(15, len(window) + 1)):
+        row = [str(v or "") for v in window[r - 1]]
         joined = _norm(" ".join(row))
         # sin tildes: ANO / SEMESTRE
         if "ANO" in joined and "SEMESTRE" in joined:
@@ -199,36 +209,306 @@ def _parse_breakdown_header(header: str) -> tuple[str, str, str, str] | None:
     return population, campus, program, level
 
 
+@dataclass(frozen=True)
+class BreakdownColumn:
+    index: int
+    population: str
+    campus: str
+    program: str
+    level: str
+
+
+@dataclass(frozen=True)
+class SheetSchema:
+    """
+    Encabezados de la hoja compilados una vez por archivo:
+    - normalized: (encabezado normalizado con _norm, posición), índice de búsqueda
+    - columns: atributo de SoftwareActivity -> posición en la fila; las columnas opcionales
+      ausentes apuntan a `width`, una posición que siempre queda vacía al rellenar la fila
+    - breakdowns: columnas de desglose de beneficiarios ya interpretadas
+    - decoder: descriptor de la plantilla (IMPORT_COLUMNS) compilado con esas posiciones
+    """
+
+    headers: tuple[str, ...]
+    normalized: tuple[tuple[str, int], ...]
+    columns: dict[str, int]
+    breakdowns: tuple[BreakdownColumn, ...]
+    width: int
+    decoder: RowDecoder
+
+    @classmethod
+    def compile(cls, headers: list[str]) -> "SheetSchema":
+        # encabezado -> posición (si se repite, gana la última columna), normalizado una vez
+        header_map = {h.strip(): idx for idx, h in enumerate(headers) if str(h or "").strip()}
+        entries = tuple((_norm(h), idx) for h, idx in header_map.items())
+        exact: dict[str, int] = {}
+        by_index: dict[int, str] = {}
+        for n, idx in entries:
+            exact.setdefault(n, idx)
+            by_index[idx] = n
+
+        def find(name: str, preferred: int) -> int | None:
+            # match flexible por normalización; fallback: contiene (encabezado multinivel)
+            n = _norm(name)
+            if n in exact:
+                return exact[n]
+            if n:
+                # gana la columna de la propia letra si su encabezado lo contiene: "VALOR" (BW)
+                # también aparece dentro de "VALOR_CURSO" (M), que está antes
+                if n in by_index.get(preferred, ""):
+                    return preferred
+                for h, idx in entries:
+                    if n in h:
+                        return idx
+            return None
+
+        width = len(headers)
+        columns: dict[str, int] = {}
+        for column in IMPORT_COLUMNS:
+            names = column.import_names
+            idx = None
+            for name in names[:-1]:
+                idx = find(name, column.index)
+                if idx is not None:
+                    break
+            else:
+                idx = find(names[-1], column.index)
+                if column.fallback:
+                    # `col(...) or default`: tambien la posición 0 cae a la letra de la plantilla
+                    idx = idx or column.index
+            columns[column.field] = width if idx is None else idx
+
+        breakdowns = []
+        for idx, header in enumerate(headers):
+            parsed = _parse_breakdown_header(header)
+            if parsed:
+                breakdowns.append(BreakdownColumn(idx, *parsed))
+
+        return cls(
+            headers=tuple(headers),
+            normalized=entries,
+            columns=columns,
+            breakdowns=tuple(breakdowns),
+            width=width,
+            decoder=RowDecoder(columns),
+        )
+
+    @property
+    def row_size(self) -> int:
+        """Largo mínimo de fila para leer cualquier posición sin verificar límites."""
+        return max([self.width, *self.columns.values()]) + 1
+
+    def pad(self, row: tuple) -> tuple:
+        size = self.row_size
+        return row if len(row) >= size else row + (None,) * (size - len(row))
+
+
 class ImportSoftwareActivitiesFromExcelUseCase:
     """
     Importa la hoja "Software" (o la primera si no existe) y crea actividades.
     - Detecta la fila de encabezado automáticamente.
     - Lee datos desde la siguiente fila hasta el final.
+
+    En dos fases sobre un libro read_only: primero se leen las filas de encabezado
+    (HEADER_WINDOW_ROWS) y se compila el SheetSchema; luego las filas de datos se recorren
+    en streaming (solo lectura de celdas) y se guardan en lotes de chunk_size.
+
+    Con upsert cada fila se identifica por su llave natural: reimportar la misma hoja no
+    duplica nada y una hoja corregida solo escribe las filas que cambiaron. Dos filas del
+    mismo archivo con la misma llave no se fusionan: la segunda se reporta como error.
+    Con file_registry, un archivo idéntico (sha256) a uno ya importado sin errores se
+    omite completo.
     """
 
-    def __init__(self, repository: SoftwareActivityRepository):
+    def __init__(
+        self,
+        repository: SoftwareActivityRepository,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        file_registry: ImportedFileRepository | None = None,
+    ):
         self.repository = repository
+        self.chunk_size = max(1, chunk_size)
+        self.file_registry = file_registry
+
+    def execute(
+        self,
+        file_obj: BinaryIO,
+        on_progress: ProgressCallback | None = None,
+        collect_errors: bool = False,
+        upsert: bool = False,
+        force: bool = False,
+        file_name: str = "",
+    ) -> ImportResult:
+        """
+        on_progress: se llama después de cada lote guardado (y al final).
+        collect_errors: las filas que no se pueden leer o guardar se reportan como
+        ImportRowError y el resto continúa; sin él, el primer error se propaga.
+        upsert: inserta o actualiza por llave natural; sin él siempre inserta (append).
+        force: procesa el archivo aunque su digest ya esté registrado.
+        """
+        digest = None
+        if self.file_registry is not None:
+            digest = _file_digest(file_obj)
+            if not force and self.file_registry.exists(digest):
+                return ImportResult(created=0, skipped_empty_rows=0, duplicate_file=True)
+
+        wb = load_workbook(filename=file_obj, data_only=True, read_only=True)
+        try:
+            ws = wb["Software"] if "Software" in wb.sheetnames else wb.worksheets[0]
+            result = self._import_sheet(ws, on_progress, collect_errors, upsert)
+        finally:
+            wb.close()
+
+        # Con filas fallidas el archivo no queda registrado: se puede volver a procesar
+        if digest is not None and not result.errors_count:
+            self.file_registry.register(digest, file_name, result.created, result.updated)
+        return result
+
+    def _import_sheet(
+        self, ws, on_progress: ProgressCallback | None, collect_errors: bool, upsert: bool
+    ) -> ImportResult:
+        # Fase 1: encabezados. En read_only no hay acceso aleatorio a celdas, así que
+        # se materializa solo la ventana superior de la hoja.
+        window = [tuple(row) for row in ws.iter_rows(max_row=HEADER_WINDOW_ROWS, values_only=True)]
+        schema, data_start_row = self._compile_schema(window)
+        rows_total = max(0, ws.max_row - data_start_row + 1) if ws.max_row else None
 
-    def execute(self, file_obj: BinaryIO) -> ImportResult:
-        # read_only=False para poder leer merges/encabezados multinivel
-        # con más fiabilidad.
-        wb = load_workbook(filename=file_obj, data_only=True, read_only=False)
-        ws = wb["Software"] if "Software" in wb.sheetnames else wb.worksheets[0]
+        activities: list[SoftwareActivity] = []
+        breakdowns_by_idx: dict[int, list[BeneficiaryBreakdown]] = {}
+        row_numbers: list[int] = []
+        errors: list[ImportRowError] = []
+        parsed = skipped = created = updated = unchanged = errors_count = 0
+        # llave natural -> primera fila que la usó (solo upsert)
+        seen_keys: dict[str, int] = {}
+
+        def flush() -> None:
+            nonlocal created, updated, unchanged, errors_count
+            nonlocal activities, breakdowns_by_idx, row_numbers, errors
+            saved = self._save_chunk(
+                activities, breakdowns_by_idx, row_numbers, errors, collect_errors, upsert
+            )
+            created += saved.inserted
+            updated += saved.updated
+            unchanged += saved.unchanged
+            errors_count += len(errors)
+            if on_progress is not None:
+                on_progress(
+                    ImportProgress(
+                        rows_total=rows_total,
+                        rows_parsed=parsed,
+                        rows_inserted=created,
+                        rows_skipped=skipped,
+                        errors=errors,
+                        rows_updated=updated,
+                        rows_unchanged=unchanged,
+                    )
+                )
+            activities, breakdowns_by_idx, row_numbers, errors = [], {}, [], []
+
+        # Fase 2: datos en streaming, persistidos por lotes
+        rows = ws.iter_rows(min_row=data_start_row, values_only=True)
+        for row_number, raw in enumerate(rows, start=data_start_row):
+            parsed += 1
+            row = schema.pad(raw)
+            try:
+                activity = self._to_activity(schema, row)
+                breakdowns = self._to_breakdowns(schema, row) if activity else []
+            except Exception as exc:
+                if not collect_errors:
+                    raise
+                errors.append(ImportRowError(row_number, f"No se pudo leer la fila: {exc}"))
+                continue
+            if activity is None:
+                skipped += 1
+                continue
+            if upsert:
+                first_row = seen_keys.setdefault(activity_natural_key(activity), row_number)
+                if first_row != row_number:
+                    message = (
+                        f"Misma actividad que la fila {first_row} (año, semestre, nombre, "
+                        "fechas y sede): la fila no se importó"
+                    )
+                    if not collect_errors:
+                        raise ValueError(message)
+                    errors.append(ImportRowError(row_number, message))
+                    continue
 
-        header_row = _detect_header_row(ws)
+            if breakdowns:
+                breakdowns_by_idx[len(activities)] = breakdowns
+            activities.append(activity)
+            row_numbers.append(row_number)
+
+            if len(activities) >= self.chunk_size:
+                flush()
+
+        flush()
+        return ImportResult(
+            created=created,
+            skipped_empty_rows=skipped,
+            rows_parsed=parsed,
+            errors_count=errors_count,
+            updated=updated,
+            unchanged=unchanged,
+        )
+
+    def _save_chunk(
+        self,
+        activities: list[SoftwareActivity],
+        breakdowns_by_idx: dict[int, list[BeneficiaryBreakdown]],
+        row_numbers: list[int],
+        errors: list[ImportRowError],
+        collect_errors: bool,
+        upsert: bool,
+    ) -> UpsertResult:
+        if not activities:
+            return UpsertResult()
+        try:
+            return self._save(activities, breakdowns_by_idx, upsert)
+        except Exception:
+            if not collect_errors:
+                raise
+
+        # El lote falló completo: se reintenta fila por fila para aislar las inválidas
+        inserted = updated = unchanged = 0
+        for idx, activity in enumerate(activities):
+            try:
+                saved = self._save([activity], {0: breakdowns_by_idx.get(idx, [])}, upsert)
+            except Exception as exc:
+                errors.append(ImportRowError(row_numbers[idx], str(exc)))
+                continue
+            inserted += saved.inserted
+            updated += saved.updated
+            unchanged += saved.unchanged
+        return UpsertResult(inserted=inserted, updated=updated, unchanged=unchanged)
+
+    def _save(
+        self,
+        activities: list[SoftwareActivity],
+        breakdowns_by_idx: dict[int, list[BeneficiaryBreakdown]],
+        upsert: bool,
+    ) -> UpsertResult:
+        if upsert:
+            return self.repository.upsert(
+                activities=activities, breakdowns_by_temp_index=breakdowns_by_idx
+            )
+        created = self.repository.bulk_create(
+            activities=activities, breakdowns_by_temp_index=breakdowns_by_idx
+        )
+        return UpsertResult(inserted=created)
+
+    def _compile_schema(self, window: list[tuple]) -> tuple[SheetSchema, int]:
+        header_row = _detect_header_row(window)
         if header_row is None:
             # fallback al formato descrito: datos desde fila 7, encabezados antes
             header_row = 5
 
         # En la plantilla real hay dos filas de encabezado (row 5 y 6).
         # Usamos encabezados compuestos de (row4,row5,row6) cuando existan.
-        header_rows = [
-            r for r in (header_row - 1, header_row, header_row + 1) if r >= 1
-        ]
+        header_rows = [r for r in (header_row - 1, header_row, header_row + 1) if r >= 1]
         # Importante: NO forward-fill en la fila de niveles (header_row+1),
         # porque las celdas vacías separan bloques (si no, se "arrastra" el nivel).
         headers = _build_composite_headers(
-            ws,
+            window,
             header_rows=header_rows,
             ffill_rows={header_row - 1, header_row},
         )
@@ -237,296 +517,45 @@ class ImportSoftwareActivitiesFromExcelUseCase:
         data_start_row = header_row + 1
         sub_joined = _norm(
             " ".join(
-                str(ws.cell(header_row + 1, c).value or "")
-                for c in range(1, ws.max_column + 1)
+                str(_cell(window, header_row + 1, c) or "") for c in range(1, len(headers) + 1)
             )
         )
         if "ID_CINE" in sub_joined or "NUM_HORAS" in sub_joined or "TECNOLOGO" in sub_joined:
             data_start_row = header_row + 2
 
-        header_map = {
-            h.strip(): idx for idx, h in enumerate(headers) if str(h or "").strip()
-        }
+        return SheetSchema.compile(headers), data_start_row
 
-        def col(name: str) -> int | None:
-            # match flexible por normalización
-            n = _norm(name)
-            for h, idx in header_map.items():
-                if _norm(h) == n:
-                    return idx
-            # fallback: contiene (útil cuando el encabezado es multinivel)
-            for h, idx in header_map.items():
-                if n and n in _norm(h):
-                    return idx
+    def _to_activity(self, schema: SheetSchema, row: tuple) -> SoftwareActivity | None:
+        values = schema.decoder(row)
+        name_cell = row[schema.columns["activity_name"]]
+        # fila vacía -> None (se cuenta como omitida)
+        if not values["year"] and not values["semester"] and not name_cell:
             return None
 
-        # columnas base (si faltan, usamos posición por defecto)
-        idx_year = col("AÑO") or 0
-        idx_sem = col("SEMESTRE") or 1
-        idx_start = col("FECHA INICIO DE LA ACTIVIDAD") or 2
-        idx_end = col("FECHA FIN DE LA ACTIVIDAD") or 3
-        idx_place = col("LUGAR DE EJECUCION DE LA ACTIVIDAD") or 4
-        idx_campus = col("SEDE: CÚCUTA / OCAÑA") or 5
-        idx_name = col("NOMBRE_DE LA ACTIVIDAD")
-        if idx_name is None:
-            idx_name = col("NOMBRE_DE LA ACTIVDAD") or 6
-        idx_agreement = (
-            col(
-                "LA ACTIVIDAD SE DESARROLLO EN MARCO DE UN CONVENIO-  "
-                "DETALLE EL NOMBRE DE LA ENTIDAD"
-            )
-            or 7
-        )
-        idx_desc = col("DESCRIPCIÓN") or 8
-        idx_cine_name = (
-            col(
-                "CLASIFICACIÓN INTERNACIONAL NORMALIZADA DE LA EDUCACIÓN DE SUPERIOR"
-            )
-            or 9
-        )
-        # En la plantilla real, el CINE viene en la misma columna J
-        # (como "613  Desarrollo...").
-        idx_cine_id = col("|ID_CINE_CAMPO_DETALLADO") or 9
-        idx_hours = col("NUM_HORAS") or 10
-        idx_activity_type = col("ID_TIPO_ ACTIVIDAD") or 11
-        idx_course_value = (
-            col("VALOR_CURSO (COSTO POR PERSONA DEL EVENTO- INSCRIPCIÓN )") or 12
-        )
-        idx_teacher_doc_type = (
-            col("ID_TIPO_DOCUMENTO DOCENTE QUE IMPARTIO  EL CURSO") or 13
-        )
-        idx_teacher_doc_num = col("NUM_DOCUMENTO DOCENTE QUE IMPARTIO EL CURSO") or 14
+        cine_name = values["cine_isced_name"]
+        if values["cine_field_detailed_id"] is None and cine_name:
+            # en la plantilla, el campo de CINE suele venir como "613  Desarrollo..."
+            code = cine_name.split(" ", 1)[0]
+            values["cine_field_detailed_id"] = code if code.isdigit() else None
 
-        # campos extra (si existen)
-        idx_total_benef = col("TOTAL BENEFICIAIROS") or 20
-        idx_prof = col("3 PROFESOR") or 17
-        idx_admin = col("4 ADMINISTRATIVO IES") or 18
-        idx_external = col("5PERSONA NO VINCULADA") or 19
-
-        idx_speaker_name = col("NOMBRES Y APELLIDOS")
-        idx_speaker_origin = col("PROCEDENCIA")
-        idx_speaker_company = col("EMPRESA QUE REPRESENTA")
-
-        idx_cons_entity = col("NOMBRE_ENTIDAD")
-        idx_cons_sector = col("ID_SECTOR_CONSULTORIA")
-        idx_cons_value = col("VALOR")
-
-        idx_ev_plan = col("FORMATO PLANEACIÓN DE EVENTOS")
-        idx_ev_att = col(
-            "CONTROL ASISTENCIA ACTIVIDADES ACADEMICAS EXTRACURRICULARES"
-        )
-        idx_ev_prog = col(
-            "FORMATO GUÍA PARA EL DISEÑO DE PROGRAMAS DE EDUCACIÓN CONTINUADA (Diplomados)"
-        )
-        idx_ev_av = col("REGISTRO AUDIOVISUAL")
+        return SoftwareActivity(id=None, career=None, **values)
 
-        activities: list[SoftwareActivity] = []
-        breakdowns_by_idx: dict[int, list[BeneficiaryBreakdown]] = {}
-        skipped = 0
-
-        for row in ws.iter_rows(min_row=data_start_row, values_only=True):
-            year = _to_int(row[idx_year] if idx_year < len(row) else None)
-            semester = _to_int(row[idx_sem] if idx_sem < len(row) else None)
-            # fila vacía -> skip
-            if not year and not semester and not (
-                row[idx_name] if idx_name < len(row) else None
-            ):
-                skipped += 1
+    def _to_breakdowns(self, schema: SheetSchema, row: tuple) -> list[BeneficiaryBreakdown]:
+        # breakdowns detectados desde headers (ya interpretados en el schema)
+        breakdowns: list[BeneficiaryBreakdown] = []
+        for column in schema.breakdowns:
+            count = to_int(row[column.index])
+            if count is None:
                 continue
-
-            start_date = _excel_serial_to_date(
-                row[idx_start] if idx_start < len(row) else None
-            )
-            end_date = _excel_serial_to_date(
-                row[idx_end] if idx_end < len(row) else None
-            )
-            campus = (
-                str(row[idx_campus] or "").strip()
-                if idx_campus < len(row)
-                else ""
-            )
-            campus = campus or "CÚCUTA"
-
-            activity = SoftwareActivity(
-                id=None,
-                career=None,
-                year=year or 0,
-                semester=semester or 0,
-                start_date=start_date,
-                end_date=end_date,
-                execution_place=(
-                    str(row[idx_place] or "").strip()
-                    if idx_place < len(row)
-                    else ""
-                ),
-                campus=campus,
-                activity_name=(
-                    str(row[idx_name] or "").strip() if idx_name < len(row) else ""
-                ),
-                agreement_entity=(
-                    str(row[idx_agreement]).strip()
-                    if idx_agreement < len(row) and row[idx_agreement]
-                    else None
-                ),
-                description=(
-                    str(row[idx_desc]).strip()
-                    if idx_desc < len(row) and row[idx_desc]
-                    else None
-                ),
-                cine_isced_name=(
-                    str(row[idx_cine_name]).strip()
-                    if idx_cine_name < len(row) and row[idx_cine_name]
-                    else None
-                ),
-                # en la plantilla, el campo de CINE suele venir como "613  Desarrollo..."
-                cine_field_detailed_id=(
-                    str(row[idx_cine_id]).strip()
-                    if idx_cine_id < len(row) and row[idx_cine_id]
-                    else (
-                        str(row[idx_cine_name]).strip().split(" ", 1)[0]
-                        if idx_cine_name < len(row)
-                        and row[idx_cine_name]
-                        and str(row[idx_cine_name]).strip().split(" ", 1)[0].isdigit()
-                        else None
-                    )
-                ),
-                num_hours=_to_int(row[idx_hours] if idx_hours < len(row) else None),
-                activity_type=(
-                    str(row[idx_activity_type]).strip()
-                    if idx_activity_type < len(row) and row[idx_activity_type]
-                    else None
-                ),
-                course_value=_to_decimal(row[idx_course_value] if idx_course_value < len(row) else None),
-                teacher_document_type=(
-                    str(row[idx_teacher_doc_type]).strip()
-                    if idx_teacher_doc_type < len(row) and row[idx_teacher_doc_type]
-                    else None
-                ),
-                teacher_document_number=(
-                    str(row[idx_teacher_doc_num]).strip()
-                    if idx_teacher_doc_num < len(row) and row[idx_teacher_doc_num]
-                    else None
-                ),
-                total_beneficiaries=_to_int(
-                    row[idx_total_benef]
-                    if idx_total_benef is not None and idx_total_benef < len(row)
-                    else None
-                ),
-                professors_count=_to_int(
-                    row[idx_prof]
-                    if idx_prof is not None and idx_prof < len(row)
-                    else None
-                ),
-                administrative_count=_to_int(
-                    row[idx_admin]
-                    if idx_admin is not None and idx_admin < len(row)
-                    else None
-                ),
-                external_people_count=_to_int(
-                    row[idx_external]
-                    if idx_external is not None and idx_external < len(row)
-                    else None
-                ),
-                speaker_full_name=(
-                    str(row[idx_speaker_name]).strip()
-                    if idx_speaker_name is not None
-                    and idx_speaker_name < len(row)
-                    and row[idx_speaker_name]
-                    else None
-                ),
-                speaker_origin=(
-                    str(row[idx_speaker_origin]).strip()
-                    if idx_speaker_origin is not None
-                    and idx_speaker_origin < len(row)
-                    and row[idx_speaker_origin]
-                    else None
-                ),
-                speaker_company=(
-                    str(row[idx_speaker_company]).strip()
-                    if idx_speaker_company is not None
-                    and idx_speaker_company < len(row)
-                    and row[idx_speaker_company]
-                    else None
-                ),
-                consultancy_entity_name=(
-                    str(row[idx_cons_entity]).strip()
-                    if idx_cons_entity is not None
-                    and idx_cons_entity < len(row)
-                    and row[idx_cons_entity]
-                    else None
-                ),
-                consultancy_sector_id=(
-                    str(row[idx_cons_sector]).strip()
-                    if idx_cons_sector is not None
-                    and idx_cons_sector < len(row)
-                    and row[idx_cons_sector]
-                    else None
-                ),
-                consultancy_value=_to_decimal(
-                    row[idx_cons_value]
-                    if idx_cons_value is not None and idx_cons_value < len(row)
-                    else None
-                ),
-                evidence_event_planning=(
-                    str(row[idx_ev_plan]).strip().upper() == "SI"
-                    if idx_ev_plan is not None
-                    and idx_ev_plan < len(row)
-                    and row[idx_ev_plan] is not None
-                    else False
-                ),
-                evidence_attendance_control=(
-                    str(row[idx_ev_att]).strip().upper() == "SI"
-                    if idx_ev_att is not None
-                    and idx_ev_att < len(row)
-                    and row[idx_ev_att] is not None
-                    else False
-                ),
-                evidence_program_design_guide=(
-                    str(row[idx_ev_prog]).strip().upper() == "SI"
-                    if idx_ev_prog is not None
-                    and idx_ev_prog < len(row)
-                    and row[idx_ev_prog] is not None
-                    else False
-                ),
-                evidence_audiovisual_record=(
-                    str(row[idx_ev_av]).strip().upper() == "SI"
-                    if idx_ev_av is not None
-                    and idx_ev_av < len(row)
-                    and row[idx_ev_av] is not None
-                    else False
-                ),
-            )
-            temp_idx = len(activities)
-            activities.append(activity)
-
-            # breakdowns detectados desde headers
-            breakdowns: list[BeneficiaryBreakdown] = []
-            for i, h in enumerate(headers):
-                parsed = _parse_breakdown_header(h)
-                if not parsed:
-                    continue
-                if i >= len(row):
-                    continue
-                count = _to_int(row[i])
-                if count is None:
-                    continue
-                population, campus_b, program, level = parsed
-                breakdowns.append(
-                    BeneficiaryBreakdown(
-                        id=None,
-                        activity_id=None,
-                        population=population,
-                        campus=campus_b,
-                        program=program,
-                        level=level,
-                        count=count,
-                    )
+            breakdowns.append(
+                BeneficiaryBreakdown(
+                    id=None,
+                    activity_id=None,
+                    population=column.population,
+                    campus=column.campus,
+                    program=column.program,
+                    level=column.level,
+                    count=count,
                 )
-            if breakdowns:
-                breakdowns_by_idx[temp_idx] = breakdowns
-
-        created = self.repository.bulk_create(
-            activities=activities,
-            breakdowns_by_temp_index=breakdowns_by_idx,
-        )
-        return ImportResult(created=created, skipped_empty_rows=skipped)
+            )
+        return breakdowns
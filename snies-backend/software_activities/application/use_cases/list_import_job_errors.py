@@ -0,0 +1,12 @@
+from software_activities.domain.entities.import_job import ImportRowError
+from software_activities.domain.ports.import_job_repository import ImportJobRepository
+
+
+class ListImportJobErrorsUseCase:
+    def __init__(self, job_repository: ImportJobRepository):
+        self.job_repository = job_repository
+
+    def execute(
+        self, job_id: int, limit: int = 100, offset: int = 0
+    ) -> tuple[int, list[ImportRowError]]:
+        return self.job_repository.list_errors(job_id=job_id, limit=limit, offset=offset)
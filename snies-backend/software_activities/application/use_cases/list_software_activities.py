@@ -1,4 +1,7 @@
-from software_activities.domain.entities.software_activity import SoftwareActivity
+from software_activities.domain.entities.software_activity_query import (
+    SoftwareActivityPage,
+    SoftwareActivityQuery,
+)
 from software_activities.domain.ports.software_activity_repository import (
     SoftwareActivityRepository,
 )
@@ -8,6 +11,5 @@ class ListSoftwareActivitiesUseCase:
     def __init__(self, repository: SoftwareActivityRepository):
         self.repository = repository
 
-    def execute(self, limit: int = 100, offset: int = 0) -> list[SoftwareActivity]:
-        return self.repository.list(limit=limit, offset=offset)
-
+    def execute(self, query: SoftwareActivityQuery) -> SoftwareActivityPage:
+        return self.repository.search(query)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from software_activities.application.use_cases.export_software_activities_to_excel import (
+    ExportSoftwareActivitiesToExcelUseCase,
+)
+from software_activities.domain.entities.export_job import ExportJob
+from software_activities.domain.ports.export_job_repository import ExportJobRepository
+from software_activities.domain.ports.software_activity_repository import (
+    SoftwareActivityRepository,
+)
+
+
+class RequestExportJobUseCase:
+    """
+    Devuelve el export vigente para los datos actuales sin generar nada en la petición:
+    - ya generado con la misma huella -> ese job (listo para descargar)
+    - en curso con la misma huella, o uno pendiente -> ese job (se reutiliza)
+    - si no -> encola uno nuevo para el worker (run_import_worker)
+    """
+
+    def __init__(
+        self,
+        job_repository: ExportJobRepository,
+        activity_repository: SoftwareActivityRepository,
+    ):
+        self.job_repository = job_repository
+        self.activity_repository = activity_repository
+
+    def execute(self, created_by_id: int | None = None) -> ExportJob:
+        fingerprint = ExportSoftwareActivitiesToExcelUseCase(self.activity_repository).fingerprint()
+        job = (
+            self.job_repository.find_ready(fingerprint)
+            or self.job_repository.find_running(fingerprint)
+            or self.job_repository.find_pending()
+        )
+        return job or self.job_repository.create(created_by_id=created_by_id)
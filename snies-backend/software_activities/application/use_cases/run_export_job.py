@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import logging
+
+from software_activities.application.use_cases.export_software_activities_to_excel import (
+    ExportSoftwareActivitiesToExcelUseCase,
+)
+from software_activities.domain.entities.export_job import EXPORT_JOB_FAILED, ExportJob
+from software_activities.domain.ports.export_job_repository import ExportJobRepository
+from software_activities.domain.ports.software_activity_repository import (
+    SoftwareActivityRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RunExportJobUseCase:
+    """
+    Genera el Excel de un job ya tomado (running) y lo guarda como archivo del job.
+    La huella se toma antes de leer los datos: si cambian mientras corre, la huella
+    guardada queda vieja y el próximo pedido vuelve a generar (nunca al revés).
+    """
+
+    def __init__(
+        self,
+        job_repository: ExportJobRepository,
+        activity_repository: SoftwareActivityRepository,
+    ):
+        self.job_repository = job_repository
+        self.activity_repository = activity_repository
+
+    def execute(self, job: ExportJob) -> ExportJob:
+        exporter = ExportSoftwareActivitiesToExcelUseCase(repository=self.activity_repository)
+        try:
+            self.job_repository.start(job.id, exporter.fingerprint())
+            result = exporter.execute()
+            with result.file:
+                return self.job_repository.store_artifact(
+                    job.id, file_name=result.filename, file_obj=result.file, size=result.size
+                )
+        except Exception as exc:
+            logger.exception("Export job %s failed", job.id)
+            return self.job_repository.finish(job.id, EXPORT_JOB_FAILED, error=str(exc))
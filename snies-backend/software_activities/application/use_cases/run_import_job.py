@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import logging
+
+from software_activities.application.use_cases.import_software_activities_from_excel import (
+    ImportProgress,
+    ImportSoftwareActivitiesFromExcelUseCase,
+)
+from software_activities.domain.entities.import_job import (
+    IMPORT_JOB_FAILED,
+    IMPORT_JOB_SUCCEEDED,
+    ImportJob,
+)
+from software_activities.domain.ports.import_job_repository import ImportJobRepository
+from software_activities.domain.ports.imported_file_repository import ImportedFileRepository
+from software_activities.domain.ports.software_activity_repository import (
+    SoftwareActivityRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RunImportJobUseCase:
+    """
+    Procesa un job ya reclamado (running): importa el archivo por lotes reportando progreso
+    y errores por fila. Cada lote se confirma por separado, así el avance es visible
+    mientras corre; las filas inválidas quedan registradas en vez de abortar el archivo.
+    Siempre en modo upsert: reintentar un job o subir el mismo archivo no duplica filas.
+    """
+
+    def __init__(
+        self,
+        job_repository: ImportJobRepository,
+        activity_repository: SoftwareActivityRepository,
+        file_registry: ImportedFileRepository | None = None,
+    ):
+        self.job_repository = job_repository
+        self.activity_repository = activity_repository
+        self.file_registry = file_registry
+
+    def execute(self, job: ImportJob) -> ImportJob:
+        def report(progress: ImportProgress) -> None:
+            self.job_repository.report_progress(
+                job_id=job.id,
+                rows_total=progress.rows_total,
+                rows_parsed=progress.rows_parsed,
+                rows_inserted=progress.rows_inserted,
+                rows_skipped=progress.rows_skipped,
+                errors=progress.errors,
+                rows_updated=progress.rows_updated,
+                rows_unchanged=progress.rows_unchanged,
+            )
+
+        importer = ImportSoftwareActivitiesFromExcelUseCase(
+            repository=self.activity_repository, file_registry=self.file_registry
+        )
+        try:
+            with self.job_repository.open_file(job.id) as file_obj:
+                result = importer.execute(
+                    file_obj,
+                    on_progress=report,
+                    collect_errors=True,
+                    upsert=True,
+                    file_name=job.file_name,
+                )
+        except Exception as exc:
+            logger.exception("Import job %s failed", job.id)
+            return self.job_repository.finish(job.id, IMPORT_JOB_FAILED, error=str(exc))
+        return self.job_repository.finish(
+            job.id, IMPORT_JOB_SUCCEEDED, duplicate_file=result.duplicate_file
+        )
@@ -0,0 +1,16 @@
+from typing import BinaryIO
+
+from software_activities.domain.entities.import_job import ImportJob
+from software_activities.domain.ports.import_job_repository import ImportJobRepository
+
+
+class SubmitImportJobUseCase:
+    """Encola el Excel para que lo procese el worker (run_import_worker)."""
+
+    def __init__(self, job_repository: ImportJobRepository):
+        self.job_repository = job_repository
+
+    def execute(self, file_name: str, file_obj: BinaryIO, created_by_id: int | None) -> ImportJob:
+        return self.job_repository.create(
+            file_name=file_name, file_obj=file_obj, created_by_id=created_by_id
+        )
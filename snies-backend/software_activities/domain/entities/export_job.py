@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+EXPORT_JOB_PENDING = "pending"
+EXPORT_JOB_RUNNING = "running"
+EXPORT_JOB_SUCCEEDED = "succeeded"
+EXPORT_JOB_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    id: int | None
+    status: str
+    # huella de los datos exportados (data_fingerprint); se fija cuando el job arranca
+    fingerprint: str | None = None
+    file_name: str = ""
+    file_path: str | None = None  # ruta del archivo en el storage (None = sin archivo)
+    size: int | None = None
+    created_by_id: int | None = None
+    error: str | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == EXPORT_JOB_SUCCEEDED and bool(self.file_path)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+IMPORT_JOB_PENDING = "pending"
+IMPORT_JOB_RUNNING = "running"
+IMPORT_JOB_SUCCEEDED = "succeeded"
+IMPORT_JOB_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ImportRowError:
+    row_number: int  # fila de la hoja (base 1)
+    message: str
+
+
+@dataclass(frozen=True)
+class ImportJob:
+    id: int | None
+    status: str
+    file_name: str
+    created_by_id: int | None = None
+    rows_total: int | None = None  # estimado desde la dimensión de la hoja
+    rows_parsed: int = 0
+    rows_inserted: int = 0
+    rows_skipped: int = 0
+    rows_updated: int = 0
+    rows_unchanged: int = 0
+    errors_count: int = 0
+    duplicate_file: bool = False
+    error: str | None = None
+    created_at: datetime | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import unicodedata
+from dataclasses import dataclass, fields
 from datetime import date
 from decimal import Decimal
 
@@ -50,3 +52,48 @@ class BeneficiaryBreakdown:
     program: str
     level: str  # técnico|tecnólogo|profesional
     count: int
+
+
+@dataclass(frozen=True)
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0  # la llave ya existía con el mismo contenido: no se escribió nada
+
+
+def _key_part(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        text = unicodedata.normalize("NFKD", value)
+        text = "".join(ch for ch in text if not unicodedata.combining(ch))
+        return " ".join(text.split()).casefold()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def activity_natural_key(activity: SoftwareActivity) -> str:
+    """
+    Llave natural de una actividad importada: (año, semestre, nombre, fechas, sede).
+    Sin tildes/mayúsculas/espacios repetidos, para que el mismo registro escrito con
+    pequeñas diferencias se reconozca al reimportar. sha256 en hex (64 caracteres).
+    """
+    parts = (
+        activity.year,
+        activity.semester,
+        activity.activity_name,
+        activity.start_date,
+        activity.end_date,
+        activity.campus,
+    )
+    return hashlib.sha256("\x1f".join(_key_part(p) for p in parts).encode()).hexdigest()
+
+
+def activity_content_digest(
+    activity: SoftwareActivity, breakdowns: list[BeneficiaryBreakdown] | None = None
+) -> str:
+    """Huella de todo el contenido de la fila (campos + desglose): detecta filas cambiadas."""
+    values = [(f.name, repr(getattr(activity, f.name))) for f in fields(activity) if f.name != "id"]
+    rows = sorted((b.population, b.campus, b.program, b.level, b.count) for b in breakdowns or [])
+    return hashlib.sha256(repr((values, rows)).encode()).hexdigest()
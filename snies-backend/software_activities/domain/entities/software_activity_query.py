@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+
+
+@dataclass(frozen=True)
+class SoftwareActivityQuery:
+    """
+    Filtros y paginación del listado de actividades. Todos los filtros se resuelven en
+    SQL antes de paginar, así una página nunca vuelve más corta de lo pedido.
+    """
+
+    career: str | None = None
+    year: int | None = None
+    semester: int | None = None
+    campus: str | None = None
+    date_from: date | None = None  # start_date >= date_from
+    date_to: date | None = None  # start_date <= date_to
+    search: str | None = None  # texto contenido en activity_name (sin distinguir mayúsculas)
+
+    limit: int = 100
+    # Keyset (orden -id): filas con id menor que after_id. None = primera página
+    after_id: int | None = None
+    # Paginación por offset del listado anterior; solo se usa sin after_id
+    offset: int = 0
+    with_count: bool = False
+    # Campos a devolver por fila (sparse fieldset); None = todos
+    fields: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class SoftwareActivityPage:
+    results: list = field(default_factory=list)
+    # id de la última fila cuando hay más páginas (se pasa como after_id); None = última
+    next_after_id: int | None = None
+    count: int | None = None  # total con los mismos filtros (solo si with_count)
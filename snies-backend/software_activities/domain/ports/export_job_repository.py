@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import BinaryIO
+
+from software_activities.domain.entities.export_job import ExportJob
+
+
+class ExportJobRepository(ABC):
+    @abstractmethod
+    def create(self, created_by_id: int | None) -> ExportJob:
+        """Encola un job (pending) para el worker."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: int) -> ExportJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_ready(self, fingerprint: str) -> ExportJob | None:
+        """Último export terminado con archivo para esa huella de datos."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_pending(self) -> ExportJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_running(self, fingerprint: str) -> ExportJob | None:
+        """
+        Export en curso para esa huella con progreso reciente. Uno sin progreso (worker
+        caído o reiniciado) no cuenta: el worker lo vuelve a encolar (requeue_stale).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_next(self) -> ExportJob | None:
+        """Toma el job pendiente más antiguo y lo marca running (seguro entre workers)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def requeue_stale(self, older_than: timedelta) -> int:
+        """Devuelve a pending los jobs running sin progreso reciente (worker caído)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def start(self, job_id: int, fingerprint: str) -> None:
+        """Registra la huella de los datos que el job va a exportar."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def store_artifact(
+        self, job_id: int, file_name: str, file_obj: BinaryIO, size: int
+    ) -> ExportJob:
+        """
+        Guarda el archivo generado, marca el job succeeded y elimina los archivos de
+        exports anteriores (solo se conserva el más reciente).
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def finish(self, job_id: int, status: str, error: str | None = None) -> ExportJob:
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_file(self, job_id: int) -> BinaryIO:
+        raise NotImplementedError
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from typing import BinaryIO
+
+from software_activities.domain.entities.import_job import ImportJob, ImportRowError
+
+
+class ImportJobRepository(ABC):
+    @abstractmethod
+    def create(self, file_name: str, file_obj: BinaryIO, created_by_id: int | None) -> ImportJob:
+        """Guarda el archivo subido y encola el job (status pending)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: int) -> ImportJob | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def open_file(self, job_id: int) -> BinaryIO:
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_next(self) -> ImportJob | None:
+        """Toma el job pendiente más antiguo y lo marca running (seguro entre workers)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def requeue_stale(self, older_than: timedelta) -> int:
+        """Devuelve a pending los jobs running sin progreso reciente (worker caído)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def report_progress(
+        self,
+        job_id: int,
+        rows_total: int | None,
+        rows_parsed: int,
+        rows_inserted: int,
+        rows_skipped: int,
+        errors: list[ImportRowError],
+        rows_updated: int = 0,
+        rows_unchanged: int = 0,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def finish(
+        self,
+        job_id: int,
+        status: str,
+        error: str | None = None,
+        duplicate_file: bool = False,
+    ) -> ImportJob:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_errors(
+        self, job_id: int, limit: int = 100, offset: int = 0
+    ) -> tuple[int, list[ImportRowError]]:
+        """Retorna (total, errores de la página) ordenados por fila."""
+        raise NotImplementedError
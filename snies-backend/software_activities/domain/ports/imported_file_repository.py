@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class ImportedFileRepository(ABC):
+    """Registro de los Excel ya importados, por sha256 del archivo completo."""
+
+    @abstractmethod
+    def exists(self, digest: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def register(self, digest: str, file_name: str, rows_inserted: int, rows_updated: int) -> None:
+        raise NotImplementedError
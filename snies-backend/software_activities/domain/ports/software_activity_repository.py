@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 from software_activities.domain.entities.software_activity import (
     SoftwareActivity,
     BeneficiaryBreakdown,
+    UpsertResult,
+)
+from software_activities.domain.entities.software_activity_query import (
+    SoftwareActivityPage,
+    SoftwareActivityQuery,
 )
 
 
@@ -30,10 +36,33 @@ class SoftwareActivityRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert(
+        self,
+        activities: list[SoftwareActivity],
+        breakdowns_by_temp_index: dict[int, list[BeneficiaryBreakdown]] | None = None,
+    ) -> UpsertResult:
+        """
+        Inserta o actualiza por llave natural (activity_natural_key) en una transacción.
+        Las filas cuyo contenido no cambió no se escriben; en las actualizadas se reemplaza
+        el desglose de beneficiarios. Dos actividades del lote con la misma llave son un
+        error (ValueError): no se fusionan.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list(self, limit: int = 100, offset: int = 0) -> list[SoftwareActivity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def search(self, query: SoftwareActivityQuery) -> SoftwareActivityPage:
+        """
+        Página de actividades (orden -id) con los filtros de query aplicados en la base.
+        Cada resultado es un dict listo para JSON con los campos de query.fields (el
+        desglose de beneficiarios incluido); el total solo se calcula con query.with_count.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def list_with_breakdowns(
         self, limit: int = 100, offset: int = 0
@@ -43,3 +72,21 @@ class SoftwareActivityRepository(ABC):
         """
         raise NotImplementedError
 
+    @abstractmethod
+    def iter_with_breakdowns(
+        self, chunk_size: int = 500, limit: int | None = None, offset: int = 0
+    ) -> Iterator[tuple[SoftwareActivity, list[BeneficiaryBreakdown]]]:
+        """
+        Igual que list_with_breakdowns (orden -id) pero recorre la tabla por lotes de
+        chunk_size: la memoria queda acotada a un lote. limit=None recorre todo.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def data_fingerprint(self) -> str:
+        """
+        Huella barata de los datos exportables (conteo, id máximo y últimas fechas de
+        actividades y desgloses): cambia cuando se crean, actualizan o borran filas.
+        """
+        raise NotImplementedError
+
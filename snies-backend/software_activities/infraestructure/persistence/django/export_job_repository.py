@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import BinaryIO
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.utils import timezone
+
+from software_activities.domain.entities.export_job import (
+    EXPORT_JOB_PENDING,
+    EXPORT_JOB_RUNNING,
+    EXPORT_JOB_SUCCEEDED,
+    ExportJob,
+)
+from software_activities.domain.ports.export_job_repository import ExportJobRepository
+from software_activities.infraestructure.persistence.django.models import (
+    SoftwareActivityExportJobModel,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _stale_after() -> timedelta:
+    # Mismo umbral con el que run_import_worker vuelve a encolar jobs abandonados
+    return timedelta(minutes=getattr(settings, "IMPORT_WORKER_STALE_MINUTES", 15))
+
+
+class DjangoExportJobRepository(ExportJobRepository):
+    def create(self, created_by_id: int | None) -> ExportJob:
+        m = SoftwareActivityExportJobModel.objects.create(
+            status=EXPORT_JOB_PENDING, created_by_id=created_by_id
+        )
+        return self._to_domain(m)
+
+    def get(self, job_id: int) -> ExportJob | None:
+        m = SoftwareActivityExportJobModel.objects.filter(id=job_id).first()
+        return self._to_domain(m) if m else None
+
+    def find_ready(self, fingerprint: str) -> ExportJob | None:
+        m = (
+            SoftwareActivityExportJobModel.objects.filter(
+                fingerprint=fingerprint, status=EXPORT_JOB_SUCCEEDED
+            )
+            .exclude(file="")
+            .exclude(file__isnull=True)
+            .order_by("-id")
+            .first()
+        )
+        return self._to_domain(m) if m else None
+
+    def find_pending(self) -> ExportJob | None:
+        m = (
+            SoftwareActivityExportJobModel.objects.filter(status=EXPORT_JOB_PENDING)
+            .order_by("id")
+            .first()
+        )
+        return self._to_domain(m) if m else None
+
+    def find_running(self, fingerprint: str) -> ExportJob | None:
+        m = (
+            SoftwareActivityExportJobModel.objects.filter(
+                fingerprint=fingerprint,
+                status=EXPORT_JOB_RUNNING,
+                updated_at__gte=timezone.now() - _stale_after(),
+            )
+            .order_by("-id")
+            .first()
+        )
+        return self._to_domain(m) if m else None
+
+    def claim_next(self) -> ExportJob | None:
+        with transaction.atomic():
+            m = (
+                SoftwareActivityExportJobModel.objects.select_for_update(skip_locked=True)
+                .filter(status=EXPORT_JOB_PENDING)
+                .order_by("id")
+                .first()
+            )
+            if m is None:
+                return None
+            m.status = EXPORT_JOB_RUNNING
+            m.started_at = timezone.now()
+            m.save(update_fields=["status", "started_at", "updated_at"])
+        return self._to_domain(m)
+
+    def requeue_stale(self, older_than: timedelta) -> int:
+        return SoftwareActivityExportJobModel.objects.filter(
+            status=EXPORT_JOB_RUNNING, updated_at__lt=timezone.now() - older_than
+        ).update(status=EXPORT_JOB_PENDING, updated_at=timezone.now())
+
+    def start(self, job_id: int, fingerprint: str) -> None:
+        SoftwareActivityExportJobModel.objects.filter(id=job_id).update(
+            fingerprint=fingerprint, updated_at=timezone.now()
+        )
+
+    def store_artifact(
+        self, job_id: int, file_name: str, file_obj: BinaryIO, size: int
+    ) -> ExportJob:
+        m = SoftwareActivityExportJobModel.objects.get(id=job_id)
+        # Nombre en disco único por job; file_name es el que ve quien descarga
+        m.file.save(f"software_activities_{job_id}.xlsx", File(file_obj), save=False)
+        m.file_name = file_name[:255]
+        m.size = size
+        m.status = EXPORT_JOB_SUCCEEDED
+        m.error = None
+        m.finished_at = timezone.now()
+        m.save()
+        self._delete_older_artifacts(m.id)
+        return self._to_domain(m)
+
+    def finish(self, job_id: int, status: str, error: str | None = None) -> ExportJob:
+        m = SoftwareActivityExportJobModel.objects.get(id=job_id)
+        m.status = status
+        m.error = error
+        m.finished_at = timezone.now()
+        m.save(update_fields=["status", "error", "finished_at", "updated_at"])
+        return self._to_domain(m)
+
+    def open_file(self, job_id: int) -> BinaryIO:
+        m = SoftwareActivityExportJobModel.objects.get(id=job_id)
+        return m.file.open("rb")
+
+    def _delete_older_artifacts(self, keep_id: int) -> None:
+        # Solo sirve el export más reciente; los anteriores se quedan como historial sin archivo
+        older = (
+            SoftwareActivityExportJobModel.objects.filter(id__lt=keep_id)
+            .exclude(file="")
+            .exclude(file__isnull=True)
+        )
+        for m in older:
+            try:
+                m.file.delete(save=False)
+            except OSError:
+                logger.warning("Could not delete export artifact %s", m.file.name)
+                continue
+            m.save(update_fields=["file", "updated_at"])
+
+    def _to_domain(self, m: SoftwareActivityExportJobModel) -> ExportJob:
+        return ExportJob(
+            id=m.id,
+            status=m.status,
+            fingerprint=m.fingerprint,
+            file_name=m.file_name,
+            file_path=m.file.name or None,
+            size=m.size,
+            created_by_id=m.created_by_id,
+            error=m.error,
+            created_at=m.created_at,
+            started_at=m.started_at,
+            finished_at=m.finished_at,
+        )
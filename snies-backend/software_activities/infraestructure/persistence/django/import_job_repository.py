@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import BinaryIO
+
+from django.core.files import File
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from software_activities.domain.entities.import_job import (
+    IMPORT_JOB_PENDING,
+    IMPORT_JOB_RUNNING,
+    IMPORT_JOB_SUCCEEDED,
+    ImportJob,
+    ImportRowError,
+)
+from software_activities.domain.ports.import_job_repository import ImportJobRepository
+from software_activities.infraestructure.persistence.django.models import (
+    SoftwareActivityImportJobErrorModel,
+    SoftwareActivityImportJobModel,
+)
+
+
+class DjangoImportJobRepository(ImportJobRepository):
+    def create(self, file_name: str, file_obj: BinaryIO, created_by_id: int | None) -> ImportJob:
+        m = SoftwareActivityImportJobModel(file_name=file_name[:255], created_by_id=created_by_id)
+        # El archivo queda en MEDIA_ROOT (volumen compartido con el worker)
+        m.file.save(file_name, File(file_obj), save=False)
+        m.save()
+        return self._to_domain(m)
+
+    def get(self, job_id: int) -> ImportJob | None:
+        m = SoftwareActivityImportJobModel.objects.filter(id=job_id).first()
+        return self._to_domain(m) if m else None
+
+    def open_file(self, job_id: int) -> BinaryIO:
+        m = SoftwareActivityImportJobModel.objects.get(id=job_id)
+        return m.file.open("rb")
+
+    def claim_next(self) -> ImportJob | None:
+        with transaction.atomic():
+            m = (
+                SoftwareActivityImportJobModel.objects.select_for_update(skip_locked=True)
+                .filter(status=IMPORT_JOB_PENDING)
+                .order_by("id")
+                .first()
+            )
+            if m is None:
+                return None
+            m.status = IMPORT_JOB_RUNNING
+            m.started_at = timezone.now()
+            # Un job vuelto a encolar se procesa desde cero: se descarta el avance anterior
+            counters = [
+                "rows_total",
+                "rows_parsed",
+                "rows_inserted",
+                "rows_skipped",
+                "rows_updated",
+                "rows_unchanged",
+                "errors_count",
+            ]
+            for name in counters:
+                setattr(m, name, None if name == "rows_total" else 0)
+            SoftwareActivityImportJobErrorModel.objects.filter(job_id=m.id).delete()
+            m.save(update_fields=["status", "started_at", "updated_at", *counters])
+        return self._to_domain(m)
+
+    def requeue_stale(self, older_than: timedelta) -> int:
+        return SoftwareActivityImportJobModel.objects.filter(
+            status=IMPORT_JOB_RUNNING, updated_at__lt=timezone.now() - older_than
+        ).update(status=IMPORT_JOB_PENDING, updated_at=timezone.now())
+
+    def report_progress(
+        self,
+        job_id: int,
+        rows_total: int | None,
+        rows_parsed: int,
+        rows_inserted: int,
+        rows_skipped: int,
+        errors: list[ImportRowError],
+        rows_updated: int = 0,
+        rows_unchanged: int = 0,
+    ) -> None:
+        with transaction.atomic():
+            if errors:
+                SoftwareActivityImportJobErrorModel.objects.bulk_create(
+                    [
+                        SoftwareActivityImportJobErrorModel(
+                            job_id=job_id, row_number=e.row_number, message=e.message
+                        )
+                        for e in errors
+                    ]
+                )
+            SoftwareActivityImportJobModel.objects.filter(id=job_id).update(
+                rows_total=rows_total,
+                rows_parsed=rows_parsed,
+                rows_inserted=rows_inserted,
+                rows_skipped=rows_skipped,
+                rows_updated=rows_updated,
+                rows_unchanged=rows_unchanged,
+                errors_count=F("errors_count") + len(errors),
+                updated_at=timezone.now(),
+            )
+
+    def finish(
+        self,
+        job_id: int,
+        status: str,
+        error: str | None = None,
+        duplicate_file: bool = False,
+    ) -> ImportJob:
+        m = SoftwareActivityImportJobModel.objects.get(id=job_id)
+        m.status = status
+        m.error = error
+        m.duplicate_file = duplicate_file
+        m.finished_at = timezone.now()
+        update_fields = ["status", "error", "duplicate_file", "finished_at", "updated_at"]
+        if status == IMPORT_JOB_SUCCEEDED and m.file:
+            # el Excel ya no hace falta; en fallos se conserva para revisarlo
+            m.file.delete(save=False)
+            update_fields.append("file")
+        m.save(update_fields=update_fields)
+        return self._to_domain(m)
+
+    def list_errors(
+        self, job_id: int, limit: int = 100, offset: int = 0
+    ) -> tuple[int, list[ImportRowError]]:
+        qs = SoftwareActivityImportJobErrorModel.objects.filter(job_id=job_id)
+        total = qs.count()
+        rows = qs.order_by("row_number", "id").values_list("row_number", "message")[
+            offset : offset + limit
+        ]
+        return total, [ImportRowError(row_number=r, message=msg) for r, msg in rows]
+
+    def _to_domain(self, m: SoftwareActivityImportJobModel) -> ImportJob:
+        return ImportJob(
+            id=m.id,
+            status=m.status,
+            file_name=m.file_name,
+            created_by_id=m.created_by_id,
+            rows_total=m.rows_total,
+            rows_parsed=m.rows_parsed,
+            rows_inserted=m.rows_inserted,
+            rows_skipped=m.rows_skipped,
+            rows_updated=m.rows_updated,
+            rows_unchanged=m.rows_unchanged,
+            errors_count=m.errors_count,
+            duplicate_file=m.duplicate_file,
+            error=m.error,
+            created_at=m.created_at,
+            started_at=m.started_at,
+            finished_at=m.finished_at,
+        )
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from software_activities.domain.ports.imported_file_repository import ImportedFileRepository
+from software_activities.infraestructure.persistence.django.models import (
+    SoftwareActivityImportedFileModel,
+)
+
+
+class DjangoImportedFileRepository(ImportedFileRepository):
+    def exists(self, digest: str) -> bool:
+        return SoftwareActivityImportedFileModel.objects.filter(digest=digest).exists()
+
+    def register(self, digest: str, file_name: str, rows_inserted: int, rows_updated: int) -> None:
+        # Reimportar con force actualiza el registro existente en vez de duplicarlo
+        SoftwareActivityImportedFileModel.objects.update_or_create(
+            digest=digest,
+            defaults={
+                "file_name": (file_name or "")[:255],
+                "rows_inserted": rows_inserted,
+                "rows_updated": rows_updated,
+            },
+        )
@@ -59,10 +59,24 @@ class SoftwareActivityModel(models.Model):
     evidence_audiovisual_record = models.BooleanField(default=False)
     evidence_audiovisual_record_file = models.FileField(upload_to="evidences/software/audiovisual_record/", null=True, blank=True)
 
+    # Llave natural de filas importadas (activity_natural_key) y huella de su contenido;
+    # NULL en registros creados a mano o importados en modo append
+    natural_key = models.CharField(max_length=64, null=True, blank=True, unique=True)
+    content_digest = models.CharField(max_length=64, null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
+    # también lo actualiza el upsert del import (forma parte de la huella del export)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = "software_activities"
+        # Filtros del listado + id al final: filtra y recorre en orden -id (keyset) por índice
+        indexes = [
+            models.Index(fields=["career", "id"]),
+            models.Index(fields=["year", "semester", "id"]),
+            models.Index(fields=["campus", "id"]),
+            models.Index(fields=["start_date", "id"]),
+        ]
 
 
 class SoftwareActivityBeneficiaryBreakdownModel(models.Model):
@@ -82,3 +96,99 @@ class SoftwareActivityBeneficiaryBreakdownModel(models.Model):
     class Meta:
         db_table = "software_activity_beneficiary_breakdowns"
 
+
+
+class SoftwareActivityImportJobModel(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pendiente"),
+        ("running", "En proceso"),
+        ("succeeded", "Completado"),
+        ("failed", "Fallido"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    # Bajo media/private/: nginx no lo publica (tiene documentos de docentes)
+    file = models.FileField(upload_to="private/imports/software_activities/%Y/%m/")
+    file_name = models.CharField(max_length=255)
+    created_by_id = models.IntegerField(null=True, blank=True)
+
+    rows_total = models.IntegerField(null=True, blank=True)
+    rows_parsed = models.IntegerField(default=0)
+    rows_inserted = models.IntegerField(default=0)
+    rows_skipped = models.IntegerField(default=0)
+    rows_updated = models.IntegerField(default=0)
+    rows_unchanged = models.IntegerField(default=0)
+    errors_count = models.IntegerField(default=0)
+    # El mismo archivo ya se había importado: el job termina sin tocar datos
+    duplicate_file = models.BooleanField(default=False)
+    error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    # auto_now: cada reporte de progreso sirve de heartbeat del worker
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "software_activity_import_jobs"
+        indexes = [models.Index(fields=["status", "id"])]
+
+
+class SoftwareActivityImportJobErrorModel(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    job = models.ForeignKey(
+        SoftwareActivityImportJobModel,
+        on_delete=models.CASCADE,
+        related_name="row_errors",
+    )
+    row_number = models.IntegerField()
+    message = models.TextField()
+
+    class Meta:
+        db_table = "software_activity_import_job_errors"
+        indexes = [models.Index(fields=["job", "row_number"])]
+
+
+class SoftwareActivityImportedFileModel(models.Model):
+    id = models.BigAutoField(primary_key=True)
+    digest = models.CharField(max_length=64, unique=True)  # sha256 del archivo completo
+    file_name = models.CharField(max_length=255)
+    rows_inserted = models.IntegerField(default=0)
+    rows_updated = models.IntegerField(default=0)
+    imported_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "software_activity_imported_files"
+
+
+class SoftwareActivityExportJobModel(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pendiente"),
+        ("running", "En proceso"),
+        ("succeeded", "Completado"),
+        ("failed", "Fallido"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    # Huella de los datos exportados: un archivo sirve mientras la huella actual sea la misma
+    fingerprint = models.CharField(max_length=80, null=True, blank=True)
+    # Bajo media/private/: nginx no lo publica, solo lo entrega vía X-Accel-Redirect
+    file = models.FileField(upload_to="private/exports/software_activities/", null=True, blank=True)
+    file_name = models.CharField(max_length=255, blank=True, default="")
+    size = models.BigIntegerField(null=True, blank=True)
+    created_by_id = models.IntegerField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "software_activity_export_jobs"
+        indexes = [
+            models.Index(fields=["status", "id"]),
+            models.Index(fields=["fingerprint", "status"]),
+        ]
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+from typing import Iterator
+
 from django.db import transaction
+from django.db.models import Count, Max
 
 from software_activities.domain.entities.software_activity import (
     SoftwareActivity,
     BeneficiaryBreakdown,
+    UpsertResult,
+    activity_content_digest,
+    activity_natural_key,
+)
+from software_activities.domain.entities.software_activity_query import (
+    SoftwareActivityPage,
+    SoftwareActivityQuery,
 )
 from software_activities.domain.ports.software_activity_repository import (
     SoftwareActivityRepository,
@@ -13,6 +24,21 @@ from software_activities.infraestructure.persistence.django.models import (
     SoftwareActivityModel,
     SoftwareActivityBeneficiaryBreakdownModel,
 )
+from software_activities.infraestructure.persistence.django.software_activity_rows import (
+    ActivityRowReader,
+)
+
+# Columnas que se sobreescriben cuando una fila importada ya existe (ON CONFLICT DO UPDATE);
+# quedan fuera la PK, la llave, created_at y los archivos de evidencia subidos a mano
+UPSERT_UPDATE_FIELDS = [
+    f.name
+    for f in SoftwareActivityModel._meta.concrete_fields
+    if not f.primary_key
+    and f.name not in ("natural_key", "created_at")
+    and not f.name.endswith("_file")
+]
+
+MAX_PAGE_SIZE = 1000
 
 
 class SoftwareActivityRepositoryDjango(SoftwareActivityRepository):
@@ -108,12 +134,111 @@ class SoftwareActivityRepositoryDjango(SoftwareActivityRepository):
 
         return len(activities)
 
+    def upsert(
+        self,
+        activities: list[SoftwareActivity],
+        breakdowns_by_temp_index: dict[int, list[BeneficiaryBreakdown]] | None = None,
+    ) -> UpsertResult:
+        if not activities:
+            return UpsertResult()
+
+        breakdowns_by_temp_index = breakdowns_by_temp_index or {}
+
+        pending: dict[str, tuple[SoftwareActivityModel, list[BeneficiaryBreakdown]]] = {}
+        for idx, activity in enumerate(activities):
+            breakdowns = breakdowns_by_temp_index.get(idx, [])
+            model = self._to_model(activity)
+            model.natural_key = activity_natural_key(activity)
+            model.content_digest = activity_content_digest(activity, breakdowns)
+            if model.natural_key in pending:
+                # Fusionarlas perdería datos sin avisar (y ON CONFLICT no admite tocar la
+                # misma fila dos veces en una sentencia)
+                raise ValueError(
+                    f"Actividad repetida en el lote: {activity.activity_name} "
+                    f"({activity.year}-{activity.semester})"
+                )
+            pending[model.natural_key] = (model, breakdowns)
+
+        with transaction.atomic():
+            existing = dict(
+                SoftwareActivityModel.objects.filter(natural_key__in=list(pending)).values_list(
+                    "natural_key", "content_digest"
+                )
+            )
+            changed = {
+                key: item
+                for key, item in pending.items()
+                if key not in existing or existing[key] != item[0].content_digest
+            }
+            if not changed:
+                return UpsertResult(unchanged=len(activities))
+
+            SoftwareActivityModel.objects.bulk_create(
+                [model for model, _ in changed.values()],
+                update_conflicts=True,
+                unique_fields=["natural_key"],
+                update_fields=UPSERT_UPDATE_FIELDS,
+            )
+            # Django 4.2 no devuelve las PK de un upsert: se leen por llave
+            ids = dict(
+                SoftwareActivityModel.objects.filter(natural_key__in=list(changed)).values_list(
+                    "natural_key", "id"
+                )
+            )
+            updated_ids = [ids[key] for key in changed if key in existing]
+            if updated_ids:
+                SoftwareActivityBeneficiaryBreakdownModel.objects.filter(
+                    activity_id__in=updated_ids
+                ).delete()
+
+            breakdown_rows = [
+                SoftwareActivityBeneficiaryBreakdownModel(
+                    activity_id=ids[key],
+                    population=b.population,
+                    campus=b.campus,
+                    program=b.program,
+                    level=b.level,
+                    count=b.count,
+                )
+                for key, (_, breakdowns) in changed.items()
+                for b in breakdowns
+            ]
+            if breakdown_rows:
+                SoftwareActivityBeneficiaryBreakdownModel.objects.bulk_create(breakdown_rows)
+
+        updated = len(updated_ids)
+        inserted = len(changed) - updated
+        return UpsertResult(
+            inserted=inserted, updated=updated, unchanged=len(activities) - inserted - updated
+        )
+
     def list(self, limit: int = 100, offset: int = 0) -> list[SoftwareActivity]:
         qs = SoftwareActivityModel.objects.all().order_by("-id")[
             offset: offset + limit
         ]
         return [self._to_domain(x) for x in qs]
 
+    def search(self, query: SoftwareActivityQuery) -> SoftwareActivityPage:
+        reader = ActivityRowReader(query.fields)
+        limit = min(max(query.limit, 1), MAX_PAGE_SIZE)
+        qs = self._filtered(query)
+
+        page = qs.order_by("-id")
+        if query.after_id is not None:
+            page = page.filter(id__lt=query.after_id)
+        else:
+            page = page[max(query.offset, 0) :]
+        # Una fila de más indica si hay página siguiente sin contar
+        items = reader.read(page[: limit + 1])
+        has_more = len(items) > limit
+        items = items[:limit]
+
+        return SoftwareActivityPage(
+            results=items,
+            next_after_id=items[-1]["id"] if has_more else None,
+            count=qs.count() if query.with_count else None,
+        )
+
     def list_with_breakdowns(
         self, limit: int = 100, offset: int = 0
     ) -> list[tuple[SoftwareActivity, list[BeneficiaryBreakdown]]]:
@@ -122,23 +247,80 @@ class SoftwareActivityRepositoryDjango(SoftwareActivityRepository):
             .prefetch_related("beneficiary_breakdowns")
             .order_by("-id")[offset: offset + limit]
         )
-        out: list[tuple[SoftwareActivity, list[BeneficiaryBreakdown]]] = []
-        for m in qs:
-            activity = self._to_domain(m)
-            bds = [
-                BeneficiaryBreakdown(
-                    id=bd.id,
-                    activity_id=m.id,
-                    population=bd.population,
-                    campus=bd.campus,
-                    program=bd.program,
-                    level=bd.level,
-                    count=bd.count,
-                )
-                for bd in m.beneficiary_breakdowns.all()
-            ]
-            out.append((activity, bds))
-        return out
+        return [self._with_breakdowns(m) for m in qs]
+
+    def iter_with_breakdowns(
+        self, chunk_size: int = 500, limit: int | None = None, offset: int = 0
+    ) -> Iterator[tuple[SoftwareActivity, list[BeneficiaryBreakdown]]]:
+        chunk_size = max(1, chunk_size)
+        remaining = limit
+        qs = SoftwareActivityModel.objects.prefetch_related("beneficiary_breakdowns").order_by(
+            "-id"
+        )
+        # offset solo aplica al primer lote; los siguientes siguen por id (keyset)
+        page = qs[offset : offset + chunk_size]
+        while remaining is None or remaining > 0:
+            if remaining is not None:
+                page = page[: min(chunk_size, remaining)]
+            models = list(page)
+            if not models:
+                return
+            for m in models:
+                yield self._with_breakdowns(m)
+            if remaining is not None:
+                remaining -= len(models)
+            if len(models) < chunk_size:
+                return
+            page = qs.filter(id__lt=models[-1].id)[:chunk_size]
+
+    def data_fingerprint(self) -> str:
+        # Un agregado por tabla: mucho más barato que volver a armar el libro
+        activities = SoftwareActivityModel.objects.aggregate(
+            count=Count("id"),
+            max_id=Max("id"),
+            created=Max("created_at"),
+            updated=Max("updated_at"),
+        )
+        breakdowns = SoftwareActivityBeneficiaryBreakdownModel.objects.aggregate(
+            count=Count("id"), max_id=Max("id")
+        )
+        raw = "|".join(str(v) for v in (*activities.values(), *breakdowns.values()))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _filtered(self, query: SoftwareActivityQuery):
+        qs = SoftwareActivityModel.objects.all()
+        if query.career:
+            qs = qs.filter(career=query.career)
+        if query.year is not None:
+            qs = qs.filter(year=query.year)
+        if query.semester is not None:
+            qs = qs.filter(semester=query.semester)
+        if query.campus:
+            qs = qs.filter(campus=query.campus)
+        if query.date_from:
+            qs = qs.filter(start_date__gte=query.date_from)
+        if query.date_to:
+            qs = qs.filter(start_date__lte=query.date_to)
+        if query.search:
+            qs = qs.filter(activity_name__icontains=query.search)
+        return qs
+
+    def _with_breakdowns(
+        self, m: SoftwareActivityModel
+    ) -> tuple[SoftwareActivity, list[BeneficiaryBreakdown]]:
+        bds = [
+            BeneficiaryBreakdown(
+                id=bd.id,
+                activity_id=m.id,
+                population=bd.population,
+                campus=bd.campus,
+                program=bd.program,
+                level=bd.level,
+                count=bd.count,
+            )
+            for bd in m.beneficiary_breakdowns.all()
+        ]
+        return self._to_domain(m), bds
 
     def _to_domain(self, m: SoftwareActivityModel) -> SoftwareActivity:
         return SoftwareActivity(
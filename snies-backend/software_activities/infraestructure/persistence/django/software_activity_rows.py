@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Sequence
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+
+from software_activities.infraestructure.persistence.django.models import (
+    SoftwareActivityBeneficiaryBreakdownModel,
+    SoftwareActivityModel,
+)
+
+# Campos del listado en el orden de la respuesta (SoftwareActivitySerializer usa los mismos)
+ACTIVITY_FIELDS = (
+    "id",
+    "career",
+    "year",
+    "semester",
+    "start_date",
+    "end_date",
+    "execution_place",
+    "campus",
+    "activity_name",
+    "agreement_entity",
+    "description",
+    "cine_isced_name",
+    "cine_field_detailed_id",
+    "num_hours",
+    "activity_type",
+    "course_value",
+    "teacher_document_type",
+    "teacher_document_number",
+    "total_beneficiaries",
+    "professors_count",
+    "administrative_count",
+    "external_people_count",
+    "speaker_full_name",
+    "speaker_origin",
+    "speaker_company",
+    "consultancy_entity_name",
+    "consultancy_sector_id",
+    "consultancy_value",
+    "evidence_event_planning",
+    "evidence_event_planning_file",
+    "evidence_attendance_control",
+    "evidence_attendance_control_file",
+    "evidence_program_design_guide",
+    "evidence_program_design_guide_file",
+    "evidence_audiovisual_record",
+    "evidence_audiovisual_record_file",
+    "created_at",
+)
+BREAKDOWNS_FIELD = "beneficiary_breakdowns"
+LIST_FIELDS = (*ACTIVITY_FIELDS, BREAKDOWNS_FIELD)
+BREAKDOWN_FIELDS = ("population", "campus", "program", "level", "count")
+
+
+def _decimal(field: models.DecimalField) -> Callable[[Decimal], str]:
+    step = Decimal(1).scaleb(-field.decimal_places)
+    return lambda value: f"{value.quantize(step):f}"
+
+
+def _file_url(field: models.FileField) -> Callable[[str], str | None]:
+    storage = field.storage
+    return lambda name: storage.url(name) if name else None
+
+
+def _datetime(value: datetime) -> str:
+    if settings.USE_TZ and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _converter(field: models.Field) -> Callable | None:
+    """Misma salida que el campo DRF equivalente (None si el valor sale tal cual)."""
+    if isinstance(field, models.FileField):
+        return _file_url(field)
+    if isinstance(field, models.DecimalField):
+        return _decimal(field)
+    if isinstance(field, models.DateTimeField):
+        return _datetime
+    if isinstance(field, models.DateField):
+        return lambda value: value.isoformat()
+    return None
+
+
+class ActivityRowReader:
+    """
+    Lectura del listado sin pasar por ModelSerializer: trae tuplas con values_list, agrupa
+    el desglose por actividad en una sola pasada y arma dicts con la misma forma que
+    SoftwareActivitySerializer. fields limita las columnas (el id siempre va).
+    """
+
+    def __init__(self, fields: Sequence[str] | None = None):
+        wanted = set(LIST_FIELDS if fields is None else fields)
+        unknown = wanted - set(LIST_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos desconocidos: {', '.join(sorted(unknown))}")
+
+        self.columns = tuple(f for f in ACTIVITY_FIELDS if f == "id" or f in wanted)
+        self.with_breakdowns = BREAKDOWNS_FIELD in wanted
+        self._converters = []
+        for position, name in enumerate(self.columns):
+            convert = _converter(SoftwareActivityModel._meta.get_field(name))
+            if convert is not None:
+                self._converters.append((position, name, convert))
+
+    def read(self, queryset) -> list[dict]:
+        """queryset ya filtrado, ordenado y recortado sobre SoftwareActivityModel."""
+        columns, converters = self.columns, self._converters
+        items = []
+        for row in queryset.values_list(*columns):
+            item = dict(zip(columns, row))
+            for position, name, convert in converters:
+                value = row[position]
+                if value is not None:
+                    item[name] = convert(value)
+            items.append(item)
+
+        if self.with_breakdowns and items:
+            by_activity = self._breakdowns([item["id"] for item in items])
+            for item in items:
+                item[BREAKDOWNS_FIELD] = by_activity.get(item["id"], [])
+        return items
+
+    def _breakdowns(self, activity_ids: list[int]) -> dict[int, list[dict]]:
+        rows = (
+            SoftwareActivityBeneficiaryBreakdownModel.objects.filter(activity_id__in=activity_ids)
+            .order_by("id")
+            .values_list("activity_id", *BREAKDOWN_FIELDS)
+        )
+        by_activity: dict[int, list[dict]] = defaultdict(list)
+        for activity_id, *values in rows:
+            by_activity[activity_id].append(dict(zip(BREAKDOWN_FIELDS, values)))
+        return by_activity
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from datetime import date
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+
+from software_activities.application.snies_template import EXPORT_COLUMNS, RowEncoder, norm_key
+from software_activities.application.use_cases.export_software_activities_to_excel import (
+    ExportSoftwareActivitiesToExcelUseCase,
+)
+from software_activities.domain.entities.software_activity import (
+    BeneficiaryBreakdown,
+    SoftwareActivity,
+)
+
+# (población, sede, programa, nivel) tal como se guardan al importar: con y sin "Programa",
+# tildes y mayúsculas distintas, para que la normalización tenga trabajo real
+_DENSE_BREAKDOWNS = [
+    ("students", "CÚCUTA", "Admón Financiera", "técnico"),
+    ("students", "CÚCUTA", "Admón Financiera", "tecnólogo"),
+    ("students", "CÚCUTA", "Admón Financiera", "profesional"),
+    ("students", "CÚCUTA", "Programa Logitica Empresarial", "tecnico"),
+    ("students", "CÚCUTA", "Logitica Empresarial", "tecnólogo"),
+    ("students", "CÚCUTA", "Admón Turistica y Hotelera", "técnico"),
+    ("students", "CÚCUTA", "Admón Turistica y Hotelera", "tecnólogo"),
+    ("students", "CÚCUTA", "Admón Turistica y Hotelera", "profesional"),
+    ("students", "CÚCUTA", "Ing. Software", "técnico"),
+    ("students", "CÚCUTA", "Ing. Software", "tecnólogo"),
+    ("students", "CÚCUTA", "Ing. Software", "profesional"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (PRESENCIAL)", "técnico"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (PRESENCIAL)", "tecnólogo"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (PRESENCIAL)", "profesional"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (DISTANCIA)", "técnico"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (DISTANCIA)", "tecnólogo"),
+    ("students", "CÚCUTA", "Admón Negocios Internacionales (DISTANCIA)", "profesional"),
+    ("students", "CÚCUTA", "Diseño Grafico", "técnico"),
+    ("students", "CÚCUTA", "Diseño Grafico", "tecnólogo"),
+    ("students", "CÚCUTA", "Diseño Grafico", "profesional"),
+    ("students", "CÚCUTA", "Diseño y Admón de la moda", "técnico"),
+    ("students", "CÚCUTA", "Diseño y Admón de la moda", "tecnólogo"),
+    ("students", "CÚCUTA", "Diseño y Admón de la moda", "profesional"),
+    ("students", "OCAÑA", "Admón Financiera", "tecnólogo"),
+    ("students", "OCAÑA", "Admón Financiera", "profesional"),
+    ("students", "OCAÑA", "Admón Negocios Internacionales (PRESENCIAL)", "tecnólogo"),
+    ("students", "OCAÑA", "Admón Negocios Internacionales (PRESENCIAL)", "profesional"),
+    ("students", "OCAÑA", "Diseño Grafico", "tecnólogo"),
+    ("students", "OCAÑA", "Diseño Grafico", "profesional"),
+    ("graduates", "CÚCUTA", "Admón Financiera", "profesional"),
+    ("graduates", "CÚCUTA", "Logitica Empresarial", "tecnólogo"),
+    ("graduates", "CÚCUTA", "Admón Turistica y Hotelera", "profesional"),
+    ("graduates", "CÚCUTA", "Ing. Software", "profesional"),
+    ("graduates", "CÚCUTA", "Admón Negocios Internacionales", "profesional"),
+    ("graduates", "CÚCUTA", "Diseño Grafico", "profesional"),
+    ("graduates", "CÚCUTA", "Diseño y Admón de la moda", "profesional"),
+    ("graduates", "OCAÑA", "Admón Financiera", "profesional"),
+    ("graduates", "OCAÑA", "Admón Negocios Internacionales", "profesional"),
+    ("graduates", "OCAÑA", "Diseño Grafico", "profesional"),
+    ("professor", "N/A", "Admón Financiera", "N/A"),
+    ("professor", "N/A", "Ing. Software", "N/A"),
+    ("professor", "N/A", "Diseño Grafico", "N/A"),
+]
+
+
+def build_activities(rows: int) -> list[tuple[SoftwareActivity, list[BeneficiaryBreakdown]]]:
+    out = []
+    for i in range(rows):
+        activity = SoftwareActivity(
+            id=rows - i,
+            career="software",
+            year=2025,
+            semester=1 + i % 2,
+            start_date=date(2025, 2, 3),
+            end_date=date(2025, 2, 7),
+            execution_place="Auditorio principal",
+            campus="CÚCUTA",
+            activity_name=f"Actividad {i}",
+            agreement_entity=None,
+            description="Jornada de actualización",
+            cine_isced_name="Tecnologías de la información",
+            cine_field_detailed_id="0613",
+            num_hours=20,
+            activity_type="1",
+            course_value=Decimal("150000.00"),
+            teacher_document_type="CC",
+            teacher_document_number="1090000000",
+            total_beneficiaries=120,
+            professors_count=3,
+            administrative_count=1,
+            external_people_count=2,
+            speaker_full_name=None,
+            speaker_origin=None,
+            speaker_company=None,
+            consultancy_entity_name=None,
+            consultancy_sector_id=None,
+            consultancy_value=None,
+            evidence_event_planning=True,
+            evidence_attendance_control=True,
+            evidence_program_design_guide=False,
+            evidence_audiovisual_record=False,
+        )
+        bds = [
+            BeneficiaryBreakdown(None, activity.id, pop, campus, program, level, 1 + (i + j) % 9)
+            for j, (pop, campus, program, level) in enumerate(_DENSE_BREAKDOWNS)
+        ]
+        out.append((activity, bds))
+    return out
+
+
+# Búsqueda previa (recorrido lineal + normalización en cada comparación), solo para comparar.
+def _legacy_norm_key(s: str) -> str:
+    import re
+    import unicodedata
+
+    s = (s or "").strip()
+    s = unicodedata.normalize("NFKD", s)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = re.sub(r"\s+", " ", s).lower()
+    if s.startswith("programa "):
+        s = s[len("programa ") :].strip()
+    return s
+
+
+def _legacy_values(bds: list[BeneficiaryBreakdown], columns: list[tuple]) -> list:
+    out = []
+    for key in columns:
+        want = tuple(_legacy_norm_key(part) for part in key)
+        value = ""
+        for b in bds:
+            parts = (b.population, b.campus, b.program, b.level)[: len(want)]
+            if tuple(_legacy_norm_key(part) for part in parts) == want:
+                value = b.count
+                break
+        out.append(value)
+    return out
+
+
+class _MemoryRepository:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def iter_with_breakdowns(self, chunk_size=500, limit=None, offset=0):
+        return iter(self.rows[offset : None if limit is None else offset + limit])
+
+
+class Command(BaseCommand):
+    help = "Benchmark del export de actividades de software (desglose indexado vs previo)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        data = build_activities(rows)
+        # Solo las columnas de desglose del descriptor (V..BO), compiladas igual que en el export
+        breakdown_columns = tuple(c for c in EXPORT_COLUMNS if c.breakdown)
+        encode = RowEncoder(breakdown_columns)
+        first = breakdown_columns[0].index
+        columns = [tuple(norm_key(p) for p in c.breakdown if p) for c in breakdown_columns]
+        self.stdout.write(
+            f"{rows} actividades, {len(_DENSE_BREAKDOWNS)} filas de desglose c/u, "
+            f"{len(columns)} columnas de desglose"
+        )
+
+        t = time.perf_counter()
+        legacy = [_legacy_values(bds, columns) for _, bds in data]
+        legacy_s = time.perf_counter() - t
+
+        t = time.perf_counter()
+        indexed = [encode(a, bds)[first:] for a, bds in data]
+        indexed_s = time.perf_counter() - t
+
+        self.stdout.write(
+            f"Desglose: previo {legacy_s:.2f} s ({legacy_s / rows * 1e6:.0f} us/fila), "
+            f"indexado {indexed_s:.2f} s ({indexed_s / rows * 1e6:.0f} us/fila), "
+            f"x{legacy_s / indexed_s:.1f}; mismos valores: {legacy == indexed}"
+        )
+
+        use_case = ExportSoftwareActivitiesToExcelUseCase(repository=_MemoryRepository(data))
+        t = time.perf_counter()
+        result = use_case.execute()
+        elapsed = time.perf_counter() - t
+        result.file.close()
+        self.stdout.write(
+            f"Export completo: {rows} filas en {elapsed:.1f} s ({rows / elapsed:,.0f} filas/s), "
+            f"{result.size / 1e6:.1f} MB"
+        )
+
+        # segunda pasada solo para medir memoria (tracemalloc agrega overhead)
+        tracemalloc.start()
+        use_case.execute().file.close()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.stdout.write(f"Pico de memoria Python durante el export: {peak / 1e6:.1f} MB")
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import io
+import time
+import timeit
+import tracemalloc
+from datetime import date
+
+from openpyxl import Workbook, load_workbook
+
+from django.core.management.base import BaseCommand
+
+from software_activities.application.snies_template import IMPORT_COLUMNS
+from software_activities.application.use_cases.import_software_activities_from_excel import (
+    ImportSoftwareActivitiesFromExcelUseCase,
+    SheetSchema,
+    _norm,
+    _parse_breakdown_header,
+)
+
+_BASE_HEADERS = [
+    "AÑO",
+    "SEMESTRE",
+    "FECHA INICIO DE LA ACTIVIDAD",
+    "FECHA FIN DE LA ACTIVIDAD",
+    "LUGAR DE EJECUCION DE LA ACTIVIDAD",
+    "SEDE: CÚCUTA / OCAÑA",
+    "NOMBRE_DE LA ACTIVIDAD",
+    "LA ACTIVIDAD SE DESARROLLO EN MARCO DE UN CONVENIO-  DETALLE EL NOMBRE DE LA ENTIDAD",
+    "DESCRIPCIÓN",
+    "CLASIFICACIÓN INTERNACIONAL NORMALIZADA DE LA EDUCACIÓN DE SUPERIOR",
+    "NUM_HORAS",
+    "ID_TIPO_ ACTIVIDAD",
+    "VALOR_CURSO (COSTO POR PERSONA DEL EVENTO- INSCRIPCIÓN )",
+    "ID_TIPO_DOCUMENTO DOCENTE QUE IMPARTIO  EL CURSO",
+    "NUM_DOCUMENTO DOCENTE QUE IMPARTIO EL CURSO",
+    "1 ESTUDIANTE",
+    "2 GRADUADO",
+    "3 PROFESOR",
+    "4 ADMINISTRATIVO IES",
+    "5PERSONA NO VINCULADA",
+    "TOTAL BENEFICIAIROS",
+]
+_PROGRAMS = ["Sistemas", "Civil", "Industrial", "Mecanica"]
+
+
+def build_template(rows: int) -> bytes:
+    """Plantilla sintética con encabezado multinivel (grupo / programa / nivel)."""
+    group, program, level = (
+        [""] * len(_BASE_HEADERS),
+        list(_BASE_HEADERS),
+        [""] * len(_BASE_HEADERS),
+    )
+    for campus in ("CÚCUTA", "OCAÑA"):
+        for name in _PROGRAMS:
+            group += [f"ESTUDIANTES {campus}", "", ""]
+            program += [f"PROGRAMA {name}", "", ""]
+            level += ["TÉCNICO", "TECNÓLOGO", "PROFESIONAL"]
+    for name in _PROGRAMS:
+        group.append("GRADUADOS CÚCUTA")
+        program.append(f"PROGRAMA {name}")
+        level.append("")
+    breakdown_cells = len(group) - len(_BASE_HEADERS)
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Software")
+    for _ in range(3):
+        ws.append(["FORMATO ACTIVIDADES DE SOFTWARE"])
+    ws.append(group)
+    ws.append(program)
+    ws.append(level)
+    for i in range(rows):
+        ws.append(
+            [
+                2025,
+                1 + i % 2,
+                date(2025, 2, 3),
+                45776,
+                "Auditorio",
+                "CÚCUTA" if i % 3 else "OCAÑA",
+                f"Actividad {i}",
+                None,
+                "Taller de actualizacion",
+                "613  Desarrollo de software",
+                40,
+                "1",
+                150000,
+                "CC",
+                str(10000000 + i),
+                5,
+                1,
+                1,
+                2,
+                0,
+                9,
+                *[(i + c) % 4 or None for c in range(breakdown_cells)],
+            ]
+        )
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+# Resolución previa (closure col() + _parse_breakdown_header por fila), solo para comparar.
+def _legacy_resolve(headers: list[str]) -> list[int | None]:
+    header_map = {h.strip(): idx for idx, h in enumerate(headers) if str(h or "").strip()}
+
+    def col(name: str) -> int | None:
+        n = _norm(name)
+        for h, idx in header_map.items():
+            if _norm(h) == n:
+                return idx
+        for h, idx in header_map.items():
+            if n and n in _norm(h):
+                return idx
+        return None
+
+    return [col(name) for column in IMPORT_COLUMNS for name in column.import_names]
+
+
+def _legacy_breakdowns_per_row(headers: list[str], rows: int) -> int:
+    found = 0
+    for _ in range(rows):
+        for h in headers:
+            if _parse_breakdown_header(h):
+                found += 1
+    return found
+
+
+class _NullRepository:
+    def bulk_create(self, activities, breakdowns_by_temp_index=None) -> int:
+        return len(activities)
+
+
+class Command(BaseCommand):
+    help = "Benchmark del import de Excel de actividades de software (SheetSchema vs previo)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=50000)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        self.stdout.write(f"Generando plantilla sintética de {rows} filas...")
+        data = build_template(rows)
+        self.stdout.write(f"  {len(data) / 1e6:.1f} MB")
+
+        use_case = ImportSoftwareActivitiesFromExcelUseCase(repository=_NullRepository())
+        wb = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        head = [tuple(r) for r in wb["Software"].iter_rows(max_row=20, values_only=True)]
+        wb.close()
+        schema, _ = use_case._compile_schema(head)
+        headers = list(schema.headers)
+
+        number = 50
+        legacy = min(timeit.repeat(lambda: _legacy_resolve(headers), number=number, repeat=3))
+        compiled = min(timeit.repeat(lambda: SheetSchema.compile(headers), number=number, repeat=3))
+        self.stdout.write(
+            f"Resolución de encabezados ({len(headers)} columnas): "
+            f"previo {legacy / number * 1e3:.2f} ms, SheetSchema {compiled / number * 1e3:.2f} ms"
+        )
+
+        sample = min(rows, 5000)
+        t = time.perf_counter()
+        _legacy_breakdowns_per_row(headers, sample)
+        per_row_legacy = (time.perf_counter() - t) / sample
+        self.stdout.write(
+            f"Desglose por fila: previo {per_row_legacy * 1e6:.1f} us/fila "
+            f"(~{per_row_legacy * rows:.1f} s en {rows} filas), SheetSchema 0 (precompilado)"
+        )
+
+        t = time.perf_counter()
+        result = use_case.execute(io.BytesIO(data))
+        elapsed = time.perf_counter() - t
+        self.stdout.write(
+            f"Import completo: {result.created} actividades en {elapsed:.1f} s "
+            f"({result.created / elapsed:,.0f} filas/s)"
+        )
+
+        # segunda pasada solo para medir memoria (tracemalloc agrega overhead)
+        tracemalloc.start()
+        use_case.execute(io.BytesIO(data))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.stdout.write(f"Pico de memoria Python durante el import: {peak / 1e6:.1f} MB")
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from software_activities.infraestructure.persistence.django.models import SoftwareActivityModel
+from software_activities.infraestructure.persistence.django.software_activity_repository import (
+    SoftwareActivityRepositoryDjango,
+)
+from software_activities.infraestructure.persistence.django.software_activity_rows import (
+    ActivityRowReader,
+)
+from software_activities.management.commands.benchmark_software_export import build_activities
+from software_activities.presentation.api.software_activities.serializers import (
+    SoftwareActivitySerializer,
+)
+
+_SPARSE_FIELDS = ("id", "year", "semester", "campus", "activity_name", "career")
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark del listado de actividades: serialización DRF (ModelSerializer + "
+        "prefetch) contra la lectura con values_list. Inserta filas sintéticas dentro de "
+        "una transacción que se revierte al terminar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--limit", type=int, default=500)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows, limit, repeat = options["rows"], options["limit"], options["repeat"]
+        try:
+            with transaction.atomic():
+                self._run(rows, limit, repeat)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, rows: int, limit: int, repeat: int) -> None:
+        data = build_activities(rows)
+        SoftwareActivityRepositoryDjango().bulk_create(
+            [a for a, _ in data], {i: bds for i, (_, bds) in enumerate(data)}
+        )
+        page = SoftwareActivityModel.objects.order_by("-id")[:limit]
+
+        def drf():
+            qs = page.prefetch_related("beneficiary_breakdowns")
+            return SoftwareActivitySerializer(qs, many=True).data
+
+        def values(fields=None):
+            return ActivityRowReader(fields).read(page)
+
+        drf_s, expected = self._best(drf, repeat)
+        values_s, got = self._best(values, repeat)
+        sparse_s, _ = self._best(lambda: values(_SPARSE_FIELDS), repeat)
+
+        self.stdout.write(f"Página de {len(got)} actividades, mejor de {repeat}:")
+        self.stdout.write(f"  DRF ModelSerializer:    {drf_s * 1000:8.1f} ms")
+        self.stdout.write(
+            f"  values_list + dicts:    {values_s * 1000:8.1f} ms  (x{drf_s / values_s:.1f})"
+        )
+        self.stdout.write(
+            f"  fields={','.join(_SPARSE_FIELDS)}: {sparse_s * 1000:.1f} ms "
+            f"(x{drf_s / sparse_s:.1f})"
+        )
+        # Mismos valores y mismas claves en el mismo orden (el JSON queda idéntico)
+        same = list(expected) == got and [list(e) for e in expected] == [list(g) for g in got]
+        self.stdout.write(f"Misma salida que el serializer: {same}")
+
+    def _best(self, fn, repeat: int):
+        best, result = float("inf"), None
+        for _ in range(max(1, repeat)):
+            t = time.perf_counter()
+            result = fn()
+            best = min(best, time.perf_counter() - t)
+        return best, result
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from software_activities.application.snies_template import EXPORT_COLUMNS, RowEncoder
+from software_activities.application.use_cases.export_software_activities_to_excel import (
+    ExportSoftwareActivitiesToExcelUseCase,
+)
+from software_activities.application.use_cases.import_software_activities_from_excel import (
+    ImportSoftwareActivitiesFromExcelUseCase,
+)
+from software_activities.management.commands.benchmark_software_export import (
+    _MemoryRepository,
+    build_activities,
+)
+
+
+class _CollectingRepository:
+    def __init__(self):
+        self.rows = []
+
+    def bulk_create(self, activities, breakdowns_by_temp_index=None) -> int:
+        by_idx = breakdowns_by_temp_index or {}
+        self.rows.extend((a, by_idx.get(i, [])) for i, a in enumerate(activities))
+        return len(activities)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark de ida y vuelta sobre el descriptor de la plantilla SNIES: exporta "
+        "actividades, importa el archivo generado y compara ambas filas codificadas."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        data = build_activities(rows)
+
+        t = time.perf_counter()
+        exported = ExportSoftwareActivitiesToExcelUseCase(_MemoryRepository(data)).execute()
+        export_s = time.perf_counter() - t
+        self.stdout.write(
+            f"Export: {rows} filas en {export_s:.1f} s ({rows / export_s:,.0f} filas/s), "
+            f"{exported.size / 1e6:.1f} MB"
+        )
+
+        repository = _CollectingRepository()
+        t = time.perf_counter()
+        result = ImportSoftwareActivitiesFromExcelUseCase(repository).execute(exported.file)
+        import_s = time.perf_counter() - t
+        exported.file.close()
+        self.stdout.write(
+            f"Import: {result.created} filas en {import_s:.1f} s "
+            f"({result.created / import_s:,.0f} filas/s)"
+        )
+
+        # Mismo encoder para lo exportado y lo leído de vuelta: toda columna del descriptor
+        # (atributos, desglose y totales) debe sobrevivir la ida y vuelta
+        encode = RowEncoder(EXPORT_COLUMNS)
+        letters = [c.letter for c in EXPORT_COLUMNS]
+        mismatched: dict[str, int] = {}
+        for (a, bds), (back, back_bds) in zip(data, repository.rows):
+            for letter, before, after in zip(letters, encode(a, bds), encode(back, back_bds)):
+                if before != after:
+                    mismatched[letter] = mismatched.get(letter, 0) + 1
+        same = len(repository.rows) == len(data) and not mismatched
+        self.stdout.write(f"Ida y vuelta sin diferencias: {same}")
+        for letter, count in mismatched.items():
+            self.stdout.write(f"  columna {letter}: {count} filas distintas")
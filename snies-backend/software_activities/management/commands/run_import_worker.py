@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection
+
+from software_activities.application.use_cases.request_export_job import RequestExportJobUseCase
+from software_activities.application.use_cases.run_export_job import RunExportJobUseCase
+from software_activities.application.use_cases.run_import_job import RunImportJobUseCase
+from software_activities.domain.entities.import_job import IMPORT_JOB_SUCCEEDED
+from software_activities.infraestructure.persistence.django.export_job_repository import (
+    DjangoExportJobRepository,
+)
+from software_activities.infraestructure.persistence.django.import_job_repository import (
+    DjangoImportJobRepository,
+)
+from software_activities.infraestructure.persistence.django.imported_file_repository import (
+    DjangoImportedFileRepository,
+)
+from software_activities.infraestructure.persistence.django.software_activity_repository import (
+    SoftwareActivityRepositoryDjango,
+)
+
+logger = logging.getLogger(__name__)
+
+# Cada cuánto se buscan jobs running abandonados (el umbral es --stale-minutes)
+REQUEUE_INTERVAL_SECONDS = 60
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker local de importaciones y exportaciones Excel: toma jobs pendientes "
+        "(software_activity_import_jobs y software_activity_export_jobs) y los procesa con "
+        "un pool de hilos. Las importaciones van primero."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=getattr(settings, "IMPORT_WORKER_THREADS", 2),
+            help="Jobs procesados en paralelo.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=getattr(settings, "IMPORT_WORKER_POLL_INTERVAL", 2.0),
+            help="Segundos de espera cuando no hay jobs pendientes.",
+        )
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=getattr(settings, "IMPORT_WORKER_STALE_MINUTES", 15),
+            help="Jobs running sin progreso por más tiempo se vuelven a encolar.",
+        )
+        parser.add_argument("--once", action="store_true", help="Procesa lo pendiente y termina.")
+
+    def handle(self, *args, **options):
+        self.stop = threading.Event()
+        self.once = options["once"]
+        self.poll_interval = max(0.1, options["poll_interval"])
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._shutdown)
+            signal.signal(signal.SIGINT, self._shutdown)
+
+        self.stale = timedelta(minutes=options["stale_minutes"])
+        # Se revisa al arrancar y luego periódicamente (jobs cortados por un reinicio)
+        self._requeue_lock = threading.Lock()
+        self._next_requeue = 0.0
+
+        threads = [
+            threading.Thread(target=self._loop, name=f"import-worker-{i}")
+            for i in range(max(1, options["threads"]))
+        ]
+        for thread in threads:
+            thread.start()
+        self.stdout.write(f"Worker de importaciones iniciado ({len(threads)} hilo(s))")
+        # join con timeout para que las señales se atiendan en el hilo principal
+        while any(t.is_alive() for t in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+        self.stdout.write("Worker de importaciones detenido")
+
+    def _shutdown(self, signum, frame):
+        self.stdout.write("Deteniendo worker: se termina el job en curso")
+        self.stop.set()
+
+    def _loop(self) -> None:
+        jobs = DjangoImportJobRepository()
+        activities = SoftwareActivityRepositoryDjango()
+        run = RunImportJobUseCase(
+            job_repository=jobs,
+            activity_repository=activities,
+            file_registry=DjangoImportedFileRepository(),
+        )
+        export_jobs = DjangoExportJobRepository()
+        run_export = RunExportJobUseCase(job_repository=export_jobs, activity_repository=activities)
+        request_export = RequestExportJobUseCase(
+            job_repository=export_jobs, activity_repository=activities
+        )
+        try:
+            while not self.stop.is_set():
+                close_old_connections()
+                self._requeue_stale()
+                try:
+                    job = jobs.claim_next()
+                except Exception:
+                    logger.exception("Could not claim an import job")
+                    job = None
+                if job is None:
+                    if self._run_export(export_jobs, run_export):
+                        continue
+                    if self.once:
+                        return
+                    self.stop.wait(self.poll_interval)
+                    continue
+                self.stdout.write(f"Procesando job {job.id} ({job.file_name})")
+                result = run.execute(job)
+                if result.duplicate_file:
+                    self.stdout.write(f"Job {job.id}: archivo ya importado, se omite")
+                    continue
+                self.stdout.write(
+                    f"Job {job.id}: {result.status} - {result.rows_inserted} insertadas, "
+                    f"{result.rows_updated} actualizadas, {result.rows_unchanged} sin cambios, "
+                    f"{result.errors_count} error(es)"
+                )
+                if result.status == IMPORT_JOB_SUCCEEDED and (
+                    result.rows_inserted or result.rows_updated
+                ):
+                    # datos nuevos: el Excel guardado quedó viejo, se regenera en segundo plano
+                    try:
+                        request_export.execute(created_by_id=job.created_by_id)
+                    except Exception:
+                        logger.exception("Could not enqueue the export refresh")
+        finally:
+            connection.close()
+
+    def _requeue_stale(self) -> None:
+        """Vuelve a encolar los jobs running sin progreso; lo hace un solo hilo por intervalo."""
+        with self._requeue_lock:
+            now = time.monotonic()
+            if now < self._next_requeue:
+                return
+            self._next_requeue = now + REQUEUE_INTERVAL_SECONDS
+        try:
+            requeued = DjangoImportJobRepository().requeue_stale(self.stale)
+            requeued += DjangoExportJobRepository().requeue_stale(self.stale)
+        except Exception:
+            logger.exception("Could not requeue stale jobs")
+            return
+        if requeued:
+            self.stdout.write(f"{requeued} job(s) sin progreso vueltos a encolar")
+
+    def _run_export(self, export_jobs, run_export) -> bool:
+        """Procesa un export pendiente, si hay. Devuelve True si tomó alguno."""
+        try:
+            job = export_jobs.claim_next()
+        except Exception:
+            logger.exception("Could not claim an export job")
+            return False
+        if job is None:
+            return False
+        self.stdout.write(f"Generando export {job.id}")
+        result = run_export.execute(job)
+        self.stdout.write(f"Export {job.id}: {result.status} ({result.size or 0} bytes)")
+        return True
@@ -0,0 +1,74 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("software_activities", "0002_softwareactivitymodel_career"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SoftwareActivityImportJobModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendiente"),
+                            ("running", "En proceso"),
+                            ("succeeded", "Completado"),
+                            ("failed", "Fallido"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("file", models.FileField(upload_to="imports/software_activities/%Y/%m/")),
+                ("file_name", models.CharField(max_length=255)),
+                ("created_by_id", models.IntegerField(blank=True, null=True)),
+                ("rows_total", models.IntegerField(blank=True, null=True)),
+                ("rows_parsed", models.IntegerField(default=0)),
+                ("rows_inserted", models.IntegerField(default=0)),
+                ("rows_skipped", models.IntegerField(default=0)),
+                ("errors_count", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "software_activity_import_jobs",
+                "indexes": [
+                    models.Index(fields=["status", "id"], name="software_ac_status_075885_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="SoftwareActivityImportJobErrorModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("row_number", models.IntegerField()),
+                ("message", models.TextField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="row_errors",
+                        to="software_activities.softwareactivityimportjobmodel",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "software_activity_import_job_errors",
+                "indexes": [
+                    models.Index(fields=["job", "row_number"], name="software_ac_job_id_a12149_idx")
+                ],
+            },
+        ),
+    ]
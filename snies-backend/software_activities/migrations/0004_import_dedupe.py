@@ -0,0 +1,81 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:40
+
+from types import SimpleNamespace
+
+from django.db import migrations, models
+
+from software_activities.domain.entities.software_activity import activity_natural_key
+
+KEY_FIELDS = ("id", "year", "semester", "activity_name", "start_date", "end_date", "campus")
+
+
+def backfill_natural_keys(apps, schema_editor):
+    """
+    Asigna la llave natural a las filas existentes. Si ya hay duplicados (imports repetidos)
+    solo la fila más antigua recibe la llave; las demás quedan en NULL y no se borran.
+    """
+    model = apps.get_model("software_activities", "SoftwareActivityModel")
+    seen: set[str] = set()
+    batch = []
+    rows = model.objects.order_by("id").values(*KEY_FIELDS).iterator(chunk_size=2000)
+    for row in rows:
+        key = activity_natural_key(SimpleNamespace(**row))
+        if key in seen:
+            continue
+        seen.add(key)
+        batch.append(model(id=row["id"], natural_key=key))
+        if len(batch) >= 1000:
+            model.objects.bulk_update(batch, ["natural_key"])
+            batch = []
+    if batch:
+        model.objects.bulk_update(batch, ["natural_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("software_activities", "0003_import_jobs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SoftwareActivityImportedFileModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("digest", models.CharField(max_length=64, unique=True)),
+                ("file_name", models.CharField(max_length=255)),
+                ("rows_inserted", models.IntegerField(default=0)),
+                ("rows_updated", models.IntegerField(default=0)),
+                ("imported_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "software_activity_imported_files",
+            },
+        ),
+        migrations.AddField(
+            model_name="softwareactivityimportjobmodel",
+            name="duplicate_file",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="softwareactivityimportjobmodel",
+            name="rows_unchanged",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="softwareactivityimportjobmodel",
+            name="rows_updated",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="softwareactivitymodel",
+            name="content_digest",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="softwareactivitymodel",
+            name="natural_key",
+            field=models.CharField(blank=True, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_natural_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("software_activities", "0004_import_dedupe"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="softwareactivitymodel",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.CreateModel(
+            name="SoftwareActivityExportJobModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendiente"),
+                            ("running", "En proceso"),
+                            ("succeeded", "Completado"),
+                            ("failed", "Fallido"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("fingerprint", models.CharField(blank=True, max_length=80, null=True)),
+                (
+                    "file",
+                    models.FileField(
+                        blank=True, null=True, upload_to="private/exports/software_activities/"
+                    ),
+                ),
+                ("file_name", models.CharField(blank=True, default="", max_length=255)),
+                ("size", models.BigIntegerField(blank=True, null=True)),
+                ("created_by_id", models.IntegerField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "software_activity_export_jobs",
+                "indexes": [
+                    models.Index(fields=["status", "id"], name="software_ac_status_a44fcb_idx"),
+                    models.Index(
+                        fields=["fingerprint", "status"], name="software_ac_fingerp_0b108f_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
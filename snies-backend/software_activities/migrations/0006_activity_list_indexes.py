@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("software_activities", "0005_export_jobs"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="softwareactivitymodel",
+            index=models.Index(fields=["career", "id"], name="software_ac_career_a155a9_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="softwareactivitymodel",
+            index=models.Index(
+                fields=["year", "semester", "id"], name="software_ac_year_4b562b_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="softwareactivitymodel",
+            index=models.Index(fields=["campus", "id"], name="software_ac_campus_201c12_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="softwareactivitymodel",
+            index=models.Index(fields=["start_date", "id"], name="software_ac_start_d_8d614b_idx"),
+        ),
+    ]
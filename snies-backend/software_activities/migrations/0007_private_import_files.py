@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def move_to_private(apps, schema_editor):
+    """Los Excel ya subidos (p. ej. de jobs fallidos) pasan de media/imports/ a media/private/."""
+    Job = apps.get_model("software_activities", "SoftwareActivityImportJobModel")
+    jobs = Job.objects.exclude(file="").exclude(file__startswith="private/")
+    for job in jobs.iterator():
+        storage, old_name = job.file.storage, job.file.name
+        if not storage.exists(old_name):
+            continue
+        with storage.open(old_name, "rb") as fh:
+            job.file.name = storage.save(f"private/{old_name}", fh)
+        job.save(update_fields=["file"])
+        storage.delete(old_name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("software_activities", "0006_activity_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="softwareactivityimportjobmodel",
+            name="file",
+            field=models.FileField(upload_to="private/imports/software_activities/%Y/%m/"),
+        ),
+        migrations.RunPython(move_to_private, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,9 @@
 from software_activities.infraestructure.persistence.django.models import (
     SoftwareActivityModel,
     SoftwareActivityBeneficiaryBreakdownModel,
+    SoftwareActivityImportJobModel,
+    SoftwareActivityImportJobErrorModel,
+    SoftwareActivityImportedFileModel,
+    SoftwareActivityExportJobModel,
 )
 
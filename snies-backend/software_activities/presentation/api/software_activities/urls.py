@@ -4,12 +4,48 @@ from software_activities.presentation.api.software_activities.views import (
     SoftwareActivityListCreateAPIView,
     SoftwareActivityImportExcelAPIView,
     SoftwareActivityExportExcelAPIView,
+    SoftwareActivityImportJobCreateAPIView,
+    SoftwareActivityImportJobDetailAPIView,
+    SoftwareActivityImportJobErrorsAPIView,
+    SoftwareActivityExportJobCreateAPIView,
+    SoftwareActivityExportJobDetailAPIView,
+    SoftwareActivityExportJobDownloadAPIView,
 )
 
 
 urlpatterns = [
     path("", SoftwareActivityListCreateAPIView.as_view(), name="software-activities-list-create"),
     path("import/", SoftwareActivityImportExcelAPIView.as_view(), name="software-activities-import"),
+    path(
+        "import/jobs/",
+        SoftwareActivityImportJobCreateAPIView.as_view(),
+        name="software-activities-import-jobs",
+    ),
+    path(
+        "import/jobs/<int:job_id>/",
+        SoftwareActivityImportJobDetailAPIView.as_view(),
+        name="software-activities-import-job-detail",
+    ),
+    path(
+        "import/jobs/<int:job_id>/errors/",
+        SoftwareActivityImportJobErrorsAPIView.as_view(),
+        name="software-activities-import-job-errors",
+    ),
     path("export/", SoftwareActivityExportExcelAPIView.as_view(), name="software-activities-export"),
+    path(
+        "export/jobs/",
+        SoftwareActivityExportJobCreateAPIView.as_view(),
+        name="software-activities-export-jobs",
+    ),
+    path(
+        "export/jobs/<int:job_id>/",
+        SoftwareActivityExportJobDetailAPIView.as_view(),
+        name="software-activities-export-job-detail",
+    ),
+    path(
+        "export/jobs/<int:job_id>/download/",
+        SoftwareActivityExportJobDownloadAPIView.as_view(),
+        name="software-activities-export-job-download",
+    ),
 ]
 
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import logging
+from datetime import date
+from urllib.parse import quote
+
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import decode_cursor, encode_cursor
 from rest_framework import status
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
-from django.http import HttpResponse
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, HttpResponse
+from django.urls import reverse
 from rest_framework.response import Response
 
 from users.presentation.permissions import HasModulePermission
@@ -13,14 +21,64 @@ from ....application.use_cases.import_software_activities_from_excel import (
     ImportSoftwareActivitiesFromExcelUseCase,
 )
 from ....application.use_cases.list_software_activities import ListSoftwareActivitiesUseCase
-from ....application.use_cases.export_software_activities_to_excel import (
-    ExportSoftwareActivitiesToExcelUseCase,
-)
+from ....application.use_cases.submit_import_job import SubmitImportJobUseCase
+from ....application.use_cases.get_import_job import GetImportJobUseCase
+from ....application.use_cases.list_import_job_errors import ListImportJobErrorsUseCase
+from ....application.use_cases.export_software_activities_to_excel import EXPORT_CONTENT_TYPE
+from ....domain.entities.software_activity_query import SoftwareActivityQuery
+from ....application.use_cases.request_export_job import RequestExportJobUseCase
+from ....application.use_cases.get_export_job import GetExportJobUseCase
 from ....infraestructure.persistence.django.software_activity_repository import (
     SoftwareActivityRepositoryDjango,
 )
+from ....infraestructure.persistence.django.import_job_repository import (
+    DjangoImportJobRepository,
+)
+from ....infraestructure.persistence.django.imported_file_repository import (
+    DjangoImportedFileRepository,
+)
+from ....infraestructure.persistence.django.export_job_repository import (
+    DjangoExportJobRepository,
+)
+from ....infraestructure.persistence.django.software_activity_rows import LIST_FIELDS
 from .serializers import SoftwareActivitySerializer
-from ....infraestructure.persistence.django.models import SoftwareActivityModel
+
+logger = logging.getLogger(__name__)
+
+
+def _clean(value: str | None) -> str | None:
+    value = value.strip() if isinstance(value, str) else None
+    return value or None
+
+
+def _parse_int(value: str | None) -> int | None:
+    value = _clean(value)
+    return int(value) if value is not None else None
+
+
+def _parse_date(value: str | None) -> date | None:
+    value = _clean(value)
+    return date.fromisoformat(value) if value is not None else None
+
+
+def _parse_fields(value: str | None) -> tuple[str, ...] | None:
+    """?fields=id,activity_name -> ("id", "activity_name"); vacío = todos los campos."""
+    names = tuple(f.strip() for f in (value or "").split(",") if f.strip())
+    return names or None
+
+
+def _refresh_export(created_by_id: int | None) -> None:
+    """
+    Los datos cambiaron: encola la regeneración del Excel para que la próxima descarga
+    ya esté lista. Es best-effort, un fallo aquí no debe tumbar la escritura ya hecha.
+    """
+    try:
+        RequestExportJobUseCase(
+            job_repository=DjangoExportJobRepository(),
+            activity_repository=SoftwareActivityRepositoryDjango(),
+        ).execute(created_by_id=created_by_id)
+    except Exception:
+        logger.exception("Could not enqueue the software activities export refresh")
 
 
 class SoftwareActivityListCreateAPIView(AuditedAPIView):
@@ -40,32 +98,89 @@ class SoftwareActivityListCreateAPIView(AuditedAPIView):
         return super().get_permissions()
 
     def get(self, request):
-        limit = int(request.query_params.get("limit", "100"))
-        offset = int(request.query_params.get("offset", "0"))
-        career = request.query_params.get("career")
-        career = career.strip() if isinstance(career, str) else None
+        """
+        GET /api/software_activities/?limit=100&offset=0&career=&year=&semester=&campus=
+            &from=2026-01-01&to=2026-06-30&q=texto&fields=id,activity_name  -> lista
+
+        Modo cursor (las páginas profundas cuestan lo mismo que la primera):
+        GET /api/software_activities/?cursor=&limit=100&count=exact|none&...filtros
+          -> {"count", "limit", "next_cursor", "results"}
+        next_cursor se devuelve como ?cursor= para la página siguiente (null = última).
+        """
+        params = request.query_params
+        try:
+            limit = int(params.get("limit", "100"))
+            offset = int(params.get("offset", "0"))
+            year = _parse_int(params.get("year"))
+            semester = _parse_int(params.get("semester"))
+        except ValueError:
+            return Response(
+                {"detail": "limit, offset, year y semester deben ser enteros."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            date_from = _parse_date(params.get("from"))
+            date_to = _parse_date(params.get("to"))
+        except ValueError:
+            return Response(
+                {"detail": "from y to deben ser fechas YYYY-MM-DD."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        use_case = ListSoftwareActivitiesUseCase(
-            repository=SoftwareActivityRepositoryDjango()
+        fields = _parse_fields(params.get("fields"))
+        unknown = sorted(set(fields or ()) - set(LIST_FIELDS))
+        if unknown:
+            return Response(
+                {"detail": f"Campos desconocidos en fields: {', '.join(unknown)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        keyset = "cursor" in params
+        try:
+            after_id = decode_cursor(params.get("cursor", "").strip()) if keyset else None
+        except ValueError:
+            return Response({"detail": "cursor inválido."}, status=status.HTTP_400_BAD_REQUEST)
+        count_mode = params.get("count", "exact")
+        if count_mode not in ("exact", "none"):
+            return Response(
+                {"detail": "count debe ser 'exact' o 'none'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        query = SoftwareActivityQuery(
+            career=_clean(params.get("career")),
+            year=year,
+            semester=semester,
+            campus=_clean(params.get("campus")),
+            date_from=date_from,
+            date_to=date_to,
+            search=_clean(params.get("q")),
+            limit=limit,
+            after_id=after_id,
+            offset=offset,
+            with_count=keyset and count_mode == "exact",
+            fields=fields,
         )
-        activities = use_case.execute(limit=limit, offset=offset)
-        # devolvemos desde ORM para incluir breakdowns (prefetch)
-        ids = [a.id for a in activities if a.id is not None]
-        qs = SoftwareActivityModel.objects.filter(id__in=ids)
-        if career:
-            qs = qs.filter(career=career)
-        qs = (
-            qs
-            .prefetch_related("beneficiary_breakdowns")
-            .order_by("-id")
+        use_case = ListSoftwareActivitiesUseCase(repository=SoftwareActivityRepositoryDjango())
+        page = use_case.execute(query)
+        data = page.results
+        if not keyset:
+            return Response(data, status=status.HTTP_200_OK)
+        return Response(
+            {
+                "count": page.count,
+                "limit": query.limit,
+                "next_cursor": encode_cursor(page.next_after_id),
+                "results": data,
+            },
+            status=status.HTTP_200_OK,
         )
-        data = SoftwareActivitySerializer(qs, many=True).data
-        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request):
         serializer = SoftwareActivitySerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         activity = serializer.save()
+        _refresh_export(getattr(request.user, "id", None))
         return Response(
             {"id": activity.id, "message": "Actividad creada"},
             status=status.HTTP_201_CREATED,
@@ -80,35 +195,266 @@ class SoftwareActivityImportExcelAPIView(AuditedAPIView):
     parser_classes = [MultiPartParser, FormParser]
 
     def post(self, request):
+        """
+        ?mode=upsert (default) inserta/actualiza por llave natural; ?mode=append inserta todo.
+        ?force=1 reprocesa un archivo que ya se había importado.
+        """
         file = request.FILES.get("file")
         if not file:
             return Response(
                 {"detail": "Debes enviar el archivo en el campo 'file'."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        mode = (request.query_params.get("mode") or "upsert").strip().lower()
+        if mode not in ("upsert", "append"):
+            return Response(
+                {"detail": "mode debe ser 'upsert' o 'append'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        force = (request.query_params.get("force") or "").strip().lower() in ("1", "true", "yes")
 
         use_case = ImportSoftwareActivitiesFromExcelUseCase(
-            repository=SoftwareActivityRepositoryDjango()
+            repository=SoftwareActivityRepositoryDjango(),
+            file_registry=DjangoImportedFileRepository(),
         )
-        result = use_case.execute(file_obj=file)
+        # Los lotes se guardan dentro de una sola transacción: o entra el archivo completo o nada
+        try:
+            with transaction.atomic():
+                result = use_case.execute(
+                    file_obj=file, upsert=mode == "upsert", force=force, file_name=file.name
+                )
+        except ValueError as exc:
+            # p. ej. dos filas con la misma actividad: no se guardó nada
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        if result.created or result.updated:
+            _refresh_export(getattr(request.user, "id", None))
         return Response(
-            {"created": result.created, "skipped_empty_rows": result.skipped_empty_rows},
-            status=status.HTTP_201_CREATED,
+            {
+                "created": result.created,
+                "updated": result.updated,
+                "unchanged": result.unchanged,
+                "skipped_empty_rows": result.skipped_empty_rows,
+                "duplicate_file": result.duplicate_file,
+            },
+            status=status.HTTP_200_OK if result.duplicate_file else status.HTTP_201_CREATED,
         )
 
 
-class SoftwareActivityExportExcelAPIView(AuditedAPIView):
+def _import_job_payload(job) -> dict:
+    progress = None
+    if job.rows_total:
+        progress = min(100, round(job.rows_parsed * 100 / job.rows_total))
+    return {
+        "id": job.id,
+        "status": job.status,
+        "file_name": job.file_name,
+        "rows_total": job.rows_total,
+        "rows_parsed": job.rows_parsed,
+        "rows_inserted": job.rows_inserted,
+        "rows_skipped": job.rows_skipped,
+        "rows_updated": job.rows_updated,
+        "rows_unchanged": job.rows_unchanged,
+        "errors_count": job.errors_count,
+        "duplicate_file": job.duplicate_file,
+        "progress": progress,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+class SoftwareActivityImportJobCreateAPIView(AuditedAPIView):
+    """
+    POST /api/software_activities/import/jobs/ (multipart, campo "file")
+    Encola el archivo y responde 202 de inmediato; el worker (run_import_worker) lo procesa.
+    """
+
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "create"
+
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        file = request.FILES.get("file")
+        if not file:
+            return Response(
+                {"detail": "Debes enviar el archivo en el campo 'file'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        use_case = SubmitImportJobUseCase(job_repository=DjangoImportJobRepository())
+        job = use_case.execute(
+            file_name=file.name,
+            file_obj=file,
+            created_by_id=getattr(request.user, "id", None),
+        )
+        return Response(_import_job_payload(job), status=status.HTTP_202_ACCEPTED)
+
+
+class SoftwareActivityImportJobDetailAPIView(AuditedAPIView):
+    """GET /api/software_activities/import/jobs/<id>/ -> estado y progreso del job."""
+
     permission_classes = [IsAuthenticated, HasModulePermission]
     required_module = "software_activities"
     required_action = "view"
 
-    def get(self, request):
-        use_case = ExportSoftwareActivitiesToExcelUseCase(
-            repository=SoftwareActivityRepositoryDjango()
+    def get(self, request, job_id: int):
+        job = GetImportJobUseCase(job_repository=DjangoImportJobRepository()).execute(job_id)
+        if job is None:
+            return Response({"detail": "Job no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(_import_job_payload(job), status=status.HTTP_200_OK)
+
+
+class SoftwareActivityImportJobErrorsAPIView(AuditedAPIView):
+    """GET /api/software_activities/import/jobs/<id>/errors/?limit=100&offset=0"""
+
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "view"
+
+    def get(self, request, job_id: int):
+        try:
+            limit = min(max(int(request.query_params.get("limit", 100)), 1), 1000)
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+        except ValueError:
+            return Response(
+                {"detail": "limit/offset inválidos."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        jobs = DjangoImportJobRepository()
+        if GetImportJobUseCase(job_repository=jobs).execute(job_id) is None:
+            return Response({"detail": "Job no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        total, errors = ListImportJobErrorsUseCase(job_repository=jobs).execute(
+            job_id=job_id, limit=limit, offset=offset
         )
-        result = use_case.execute(limit=5000, offset=0)
-        resp = HttpResponse(result.data, content_type=result.content_type)
-        resp["Content-Disposition"] = (
-            f'attachment; filename="{result.filename}"'
+        return Response(
+            {
+                "count": total,
+                "limit": limit,
+                "offset": offset,
+                "results": [{"row": e.row_number, "message": e.message} for e in errors],
+            },
+            status=status.HTTP_200_OK,
         )
+
+
+def _export_job_payload(job) -> dict:
+    return {
+        "id": job.id,
+        "status": job.status,
+        "ready": job.ready,
+        "file_name": job.file_name,
+        "size": job.size,
+        "download_url": (
+            reverse("software-activities-export-job-download", args=[job.id]) if job.ready else None
+        ),
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+def _export_file_response(job, jobs: DjangoExportJobRepository):
+    """
+    Entrega el archivo de un export terminado. Con EXPORT_X_ACCEL_REDIRECT_PREFIX
+    configurado, Django solo responde la cabecera y nginx sirve el archivo (location
+    internal sobre MEDIA_ROOT); sin nginx delante se envía por bloques desde Django.
+    """
+    prefix = getattr(settings, "EXPORT_X_ACCEL_REDIRECT_PREFIX", "")
+    if prefix:
+        resp = HttpResponse(content_type=EXPORT_CONTENT_TYPE)
+        resp["X-Accel-Redirect"] = f"{prefix.rstrip('/')}/{quote(job.file_path)}"
+        resp["Content-Disposition"] = f'attachment; filename="{job.file_name}"'
         return resp
+    resp = FileResponse(
+        jobs.open_file(job.id),
+        as_attachment=True,
+        filename=job.file_name,
+        content_type=EXPORT_CONTENT_TYPE,
+    )
+    if job.size is not None:
+        resp["Content-Length"] = str(job.size)
+    return resp
+
+
+class SoftwareActivityExportJobCreateAPIView(AuditedAPIView):
+    """
+    POST /api/software_activities/export/jobs/
+    Si ya hay un Excel generado para los datos actuales responde 200 con él (ready=true);
+    si no, responde 202 con el job que lo está generando (pendiente o en curso).
+    """
+
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "view"
+
+    def post(self, request):
+        job = RequestExportJobUseCase(
+            job_repository=DjangoExportJobRepository(),
+            activity_repository=SoftwareActivityRepositoryDjango(),
+        ).execute(created_by_id=getattr(request.user, "id", None))
+        return Response(
+            _export_job_payload(job),
+            status=status.HTTP_200_OK if job.ready else status.HTTP_202_ACCEPTED,
+        )
+
+
+class SoftwareActivityExportJobDetailAPIView(AuditedAPIView):
+    """GET /api/software_activities/export/jobs/<id>/ -> estado del export."""
+
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "view"
+
+    def get(self, request, job_id: int):
+        job = GetExportJobUseCase(job_repository=DjangoExportJobRepository()).execute(job_id)
+        if job is None:
+            return Response({"detail": "Export no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(_export_job_payload(job), status=status.HTTP_200_OK)
+
+
+class SoftwareActivityExportJobDownloadAPIView(AuditedAPIView):
+    """GET /api/software_activities/export/jobs/<id>/download/ -> el Excel generado."""
+
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "view"
+
+    def get(self, request, job_id: int):
+        jobs = DjangoExportJobRepository()
+        job = GetExportJobUseCase(job_repository=jobs).execute(job_id)
+        if job is None:
+            return Response({"detail": "Export no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        if not job.ready:
+            # pendiente/en curso, fallido, o reemplazado por un export más nuevo
+            return Response(
+                {"detail": "El archivo de este export no está disponible.", "status": job.status},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return _export_file_response(job, jobs)
+
+
+class SoftwareActivityExportExcelAPIView(AuditedAPIView):
+    permission_classes = [IsAuthenticated, HasModulePermission]
+    required_module = "software_activities"
+    required_action = "view"
+
+    def get(self, request):
+        """
+        Descarga directa del Excel guardado si los datos no cambiaron desde que se generó.
+        Si no hay uno vigente no se genera en la petición: se encola (o reutiliza) el job y
+        se responde 202 como POST export/jobs/; el cliente sigue por el flujo de jobs.
+        """
+        activities = SoftwareActivityRepositoryDjango()
+        jobs = DjangoExportJobRepository()
+        job = RequestExportJobUseCase(job_repository=jobs, activity_repository=activities).execute(
+            created_by_id=getattr(request.user, "id", None)
+        )
+        if not job.ready:
+            resp = Response(_export_job_payload(job), status=status.HTTP_202_ACCEPTED)
+            resp["Location"] = reverse("software-activities-export-job-detail", args=[job.id])
+            return resp
+        return _export_file_response(job, jobs)
@@ -1,10 +1,48 @@
+from __future__ import annotations
+
+import hashlib
+
+from stats.domain.ports.stats_cache import StatsCache
 from stats.domain.ports.stats_repository import StatsRepository
 
 
 class GetDashboardStatsUseCase:
-    def __init__(self, stats_repository: StatsRepository):
+    """
+    Devuelve el payload del dashboard. Si se inyecta un cache, la respuesta se guarda
+    con una clave (year, semester, top_n, version de datos): cualquier escritura en las
+    tablas origen cambia la version y deja obsoletas las entradas anteriores.
+    """
+
+    CACHE_PREFIX = "stats:dashboard"
+
+    def __init__(self, stats_repository: StatsRepository, stats_cache: StatsCache | None = None):
         self.stats_repository = stats_repository
+        self.stats_cache = stats_cache
+        self._data_version: str | None = None
+
+    def _normalize(self, year, semester, top_n) -> tuple[str | None, int | None, int]:
+        year = str(year) if year else None
+        semester = int(semester) if semester is not None else None
+        top_n = max(1, min(int(top_n or 10), 50))
+        return year, semester, top_n
+
+    def _fingerprint(self, year: str | None, semester: int | None, top_n: int) -> str:
+        if self._data_version is None:
+            self._data_version = self.stats_repository.get_data_version()
+        raw = f"{year}|{semester}|{top_n}|{self._data_version}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def etag(self, year: str | None, semester: int | None, top_n: int = 10) -> str:
+        return self._fingerprint(*self._normalize(year, semester, top_n))
 
     def execute(self, year: str | None, semester: int | None, top_n: int = 10) -> dict:
-        return self.stats_repository.get_dashboard(year=year, semester=semester, top_n=top_n)
+        year, semester, top_n = self._normalize(year, semester, top_n)
+        if self.stats_cache is None:
+            return self.stats_repository.get_dashboard(year=year, semester=semester, top_n=top_n)
 
+        key = f"{self.CACHE_PREFIX}:{self._fingerprint(year, semester, top_n)}"
+        data = self.stats_cache.get(key)
+        if data is None:
+            data = self.stats_repository.get_dashboard(year=year, semester=semester, top_n=top_n)
+            self.stats_cache.set(key, data)
+        return data
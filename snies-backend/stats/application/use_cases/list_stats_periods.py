@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from stats.domain.ports.stats_repository import StatsRepository
+
+
+class ListStatsPeriodsUseCase:
+    def __init__(self, stats_repository: StatsRepository):
+        self.stats_repository = stats_repository
+
+    def execute(self, source: str | None = None) -> dict:
+        periods = self.stats_repository.list_periods(source=source)
+
+        grouped: dict[tuple[str, int], list[str]] = {}
+        for p in periods:
+            grouped.setdefault((p["year"], p["semester"]), []).append(p["source"])
+
+        return {
+            "years": sorted({year for year, _ in grouped}),
+            "semesters": sorted({semester for _, semester in grouped}),
+            "periods": [
+                {"year": year, "semester": semester, "sources": sorted(sources)}
+                for (year, semester), sources in sorted(grouped.items())
+            ],
+        }
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class StatsCache(ABC):
+    @abstractmethod
+    def get(self, key: str) -> dict | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: dict) -> None:
+        raise NotImplementedError
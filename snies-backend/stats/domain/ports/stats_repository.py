@@ -8,3 +8,12 @@ class StatsRepository(ABC):
     def get_dashboard(self, year: str | None, semester: int | None, top_n: int) -> dict:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_periods(self, source: str | None = None) -> list[dict]:
+        """Catalogo de periodos: [{source, year, semester, records}] ordenado por periodo."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_data_version(self) -> str:
+        """Huella de las generaciones de las tablas que alimentan el dashboard."""
+        raise NotImplementedError
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+
+from stats.domain.ports.stats_cache import StatsCache
+
+
+class DjangoStatsCache(StatsCache):
+    """Cache de respuestas del dashboard sobre el backend de cache de Django."""
+
+    def __init__(self, timeout: int | None = None):
+        self.timeout = (
+            timeout
+            if timeout is not None
+            else getattr(settings, "STATS_DASHBOARD_CACHE_TIMEOUT", 3600)
+        )
+
+    def get(self, key: str) -> dict | None:
+        return cache.get(key)
+
+    def set(self, key: str, value: dict) -> None:
+        cache.set(key, value, self.timeout)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from django.db.models import F
+from django.utils import timezone
+
+from stats.infraestructure.persistence.django.models import StatsGenerationModel
+
+
+def bump_generation(*tables: str) -> None:
+    """Incrementa el contador de generacion de cada tabla (lo crea si no existe)."""
+    for table in tables:
+        updated = StatsGenerationModel.objects.filter(table_name=table).update(
+            generation=F("generation") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            StatsGenerationModel.objects.bulk_create(
+                [StatsGenerationModel(table_name=table, generation=1)], ignore_conflicts=True
+            )
+
+
+def generation_vector() -> dict[str, int]:
+    """Estado actual de todos los contadores en una sola consulta."""
+    return dict(StatsGenerationModel.objects.values_list("table_name", "generation"))
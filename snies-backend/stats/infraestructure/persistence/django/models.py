@@ -0,0 +1,74 @@
+from django.db import models
+
+
+class StatsRollupModel(models.Model):
+    """
+    Agregado materializado por (source, year, semester, dimension, dimension_value).
+    La dimension "total" guarda los totales del periodo con dimension_value "".
+    """
+
+    DIMENSION_TOTAL = "total"
+
+    id = models.BigAutoField(primary_key=True)
+    source = models.CharField(max_length=64)
+    year = models.CharField(max_length=4)
+    semester = models.IntegerField()
+    dimension = models.CharField(max_length=32)
+    dimension_value = models.CharField(max_length=64, blank=True, default="")
+
+    records = models.BigIntegerField(default=0)
+    quantity = models.BigIntegerField(default=0)
+    amount = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+    amount_secondary = models.DecimalField(max_digits=20, decimal_places=2, default=0)
+
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stats_rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "year", "semester", "dimension", "dimension_value"],
+                name="stats_rollups_unique_key",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["year", "semester", "dimension"]),
+            models.Index(fields=["dimension", "source"]),
+        ]
+
+
+class StatsGenerationModel(models.Model):
+    """
+    Contador de generacion por tabla origen. Se incrementa en cada escritura y
+    versiona las respuestas cacheadas del dashboard.
+    """
+
+    table_name = models.CharField(max_length=64, primary_key=True)
+    generation = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stats_generations"
+
+
+class StatsPeriodModel(models.Model):
+    """
+    Catalogo de periodos (year, semester) con datos por tabla origen.
+    Se mantiene junto con los rollups; alimenta los filtros de años/semestres.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    source = models.CharField(max_length=64)
+    year = models.CharField(max_length=4)
+    semester = models.IntegerField()
+    records = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "stats_periods"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "year", "semester"], name="stats_periods_unique_key"
+            )
+        ]
+        indexes = [models.Index(fields=["year", "semester"])]
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from continuing_education.infraestructure.persistence.django.models import ContinuingEducationModel
+from continuing_education_beneficiaries.infraestructure.persistence.django.models import (
+    ContinuingEducationBeneficiaryModel,
+)
+from continuing_education_teachers.infraestructure.persistence.django.models import (
+    ContinuingEducationTeacherModel,
+)
+from stats.infraestructure.persistence.django.generations import bump_generation
+from stats.infraestructure.persistence.django.models import StatsPeriodModel, StatsRollupModel
+from wellbeing_activities.infraestructure.persistence.django.models import WellbeingActivityModel
+from wellbeing_beneficiaries.infraestructure.persistence.django.models import (
+    WellbeingBeneficiaryActivityModel,
+)
+from wellbeing_human_resources.infraestructure.persistence.django.models import (
+    WellbeingHumanResourceModel,
+)
+
+logger = logging.getLogger(__name__)
+
+Period = tuple[str, int]
+
+
+@dataclass(frozen=True)
+class RollupSource:
+    """
+    Describe how one year/semester table is rolled up:
+    - quantity/amount/amount_secondary: source fields summed into the rollup measures
+    - dimensions: rollup dimension name -> source field used as group key
+    """
+
+    model: type
+    quantity: str | None = None
+    amount: str | None = None
+    amount_secondary: str | None = None
+    dimensions: dict[str, str] = field(default_factory=dict)
+
+    def decode(self, dimension: str, value: str):
+        """Convierte dimension_value (texto) al tipo del campo origen."""
+        field_obj = self.model._meta.get_field(self.dimensions[dimension])
+        target = getattr(field_obj, "target_field", field_obj)
+        if target.get_internal_type() in (
+            "IntegerField",
+            "BigIntegerField",
+            "AutoField",
+            "BigAutoField",
+        ):
+            return int(value) if value != "" else None
+        return value
+
+    def measures(self) -> dict:
+        measures = {"records": Count("id")}
+        if self.quantity:
+            measures["quantity"] = Sum(self.quantity)
+        if self.amount:
+            measures["amount"] = Sum(self.amount)
+        if self.amount_secondary:
+            measures["amount_secondary"] = Sum(self.amount_secondary)
+        return measures
+
+
+ROLLUP_SOURCES: dict[str, RollupSource] = {
+    "continuing_education": RollupSource(
+        model=ContinuingEducationModel,
+        quantity="num_hours",
+        amount="value",
+        dimensions={"course": "id_course_id"},
+    ),
+    "continuing_education_teachers": RollupSource(
+        model=ContinuingEducationTeacherModel,
+        dimensions={"course": "course_code", "document_type": "document_type_id"},
+    ),
+    "continuing_education_beneficiaries": RollupSource(
+        model=ContinuingEducationBeneficiaryModel,
+        quantity="beneficiaries_count",
+        dimensions={
+            "course": "course_code",
+            "beneficiary_type": "beneficiary_type_extension_id",
+        },
+    ),
+    "wellbeing_activities": RollupSource(
+        model=WellbeingActivityModel,
+        amount="national_funding_value",
+        amount_secondary="international_funding_value",
+        dimensions={
+            "type": "wellbeing_activity_type_id",
+            "organization_unit": "organization_unit_code",
+            "funding_country": "funding_country_id",
+        },
+    ),
+    "wellbeing_beneficiaries": RollupSource(
+        model=WellbeingBeneficiaryActivityModel,
+        quantity="beneficiaries_count",
+        dimensions={"beneficiary_type": "beneficiary_type_id", "activity": "activity_code"},
+    ),
+    "wellbeing_human_resources": RollupSource(
+        model=WellbeingHumanResourceModel,
+        dimensions={
+            "activity": "activity_code",
+            "organization_unit": "organization_unit_code",
+            "document_type": "document_type_id",
+            "dedication": "dedication",
+        },
+    ),
+}
+
+_MEASURE_FIELDS = ("records", "quantity", "amount", "amount_secondary")
+
+
+def _rollup_row(source: str, period: Period, dimension: str, value, row: dict) -> StatsRollupModel:
+    return StatsRollupModel(
+        source=source,
+        year=period[0],
+        semester=period[1],
+        dimension=dimension,
+        dimension_value="" if value is None else str(value),
+        records=int(row.get("records") or 0),
+        quantity=int(row.get("quantity") or 0),
+        amount=Decimal(row.get("amount") or 0),
+        amount_secondary=Decimal(row.get("amount_secondary") or 0),
+    )
+
+
+def _normalize_period(year, semester) -> Period:
+    return str(year), int(semester)
+
+
+def refresh_period(source: str, year, semester) -> int:
+    """
+    Recalcula las filas de rollup de (source, year, semester) a partir de la tabla origen.
+    Hace upsert de las claves vigentes y elimina las que ya no existen; mantiene tambien la
+    entrada del periodo en el catalogo (stats_periods). Devuelve filas escritas.
+    """
+    spec = ROLLUP_SOURCES[source]
+    period = _normalize_period(year, semester)
+    qs = spec.model.objects.filter(year=period[0], semester=period[1])
+    measures = spec.measures()
+
+    rows: list[StatsRollupModel] = []
+    totals = qs.aggregate(**measures)
+    if totals["records"]:
+        rows.append(_rollup_row(source, period, StatsRollupModel.DIMENSION_TOTAL, "", totals))
+        for dimension, field_name in spec.dimensions.items():
+            grouped = qs.values(field_name).annotate(**measures).order_by()
+            rows.extend(_rollup_row(source, period, dimension, r[field_name], r) for r in grouped)
+
+    with transaction.atomic():
+        stale = StatsRollupModel.objects.filter(source=source, year=period[0], semester=period[1])
+        catalog = StatsPeriodModel.objects.filter(source=source, year=period[0], semester=period[1])
+        if rows:
+            StatsPeriodModel.objects.bulk_create(
+                [
+                    StatsPeriodModel(
+                        source=source, year=period[0], semester=period[1], records=rows[0].records
+                    )
+                ],
+                update_conflicts=True,
+                unique_fields=["source", "year", "semester"],
+                update_fields=["records", "updated_at"],
+            )
+            StatsRollupModel.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["source", "year", "semester", "dimension", "dimension_value"],
+                update_fields=[*_MEASURE_FIELDS, "refreshed_at"],
+            )
+            keep = {(r.dimension, r.dimension_value) for r in rows}
+            stale_ids = [
+                pk
+                for pk, dimension, value in stale.values_list("id", "dimension", "dimension_value")
+                if (dimension, value) not in keep
+            ]
+            StatsRollupModel.objects.filter(id__in=stale_ids).delete()
+        else:
+            stale.delete()
+            catalog.delete()
+    return len(rows)
+
+
+def refresh_all(sources: Iterable[str] | None = None) -> dict[str, int]:
+    """
+    Reconstruye los rollups completos (job de mantenimiento / backfill).
+    Devuelve cantidad de periodos recalculados por source.
+    """
+    summary: dict[str, int] = {}
+    for source in sources or ROLLUP_SOURCES.keys():
+        spec = ROLLUP_SOURCES[source]
+        periods = {
+            _normalize_period(y, s)
+            for y, s in spec.model.objects.values_list("year", "semester").distinct()
+        }
+        stored = {
+            _normalize_period(y, s)
+            for y, s in StatsRollupModel.objects.filter(source=source)
+            .values_list("year", "semester")
+            .distinct()
+        }
+        for year, semester in sorted(periods | stored):
+            refresh_period(source, year, semester)
+        bump_generation(source)
+        summary[source] = len(periods)
+    return summary
+
+
+def schedule_refresh(source: str, *periods) -> None:
+    """
+    Programa el recalculo de los periodos afectados cuando la transaccion actual confirma.
+    Llamado desde los repositorios en create/update/delete. Al terminar incrementa la
+    generacion de la fuente para invalidar las respuestas cacheadas del dashboard.
+    """
+    pending = {_normalize_period(y, s) for y, s in periods if y is not None and s is not None}
+    if not pending:
+        return
+
+    def _run() -> None:
+        for year, semester in sorted(pending):
+            try:
+                refresh_period(source, year, semester)
+            except Exception:
+                logger.exception("Stats rollup refresh failed for %s %s-%s", source, year, semester)
+        bump_generation(source)
+
+    transaction.on_commit(_run)
@@ -1,25 +1,17 @@
 from __future__ import annotations
 
-from django.db.models import Count, Sum, Value, DecimalField
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, Sum, Value
 from django.db.models.functions import Coalesce
 
+from courses.infraestructure.persistence.django.models import CourseModel
 from stats.domain.ports.stats_repository import StatsRepository
+from stats.infraestructure.persistence.django.generations import generation_vector
+from stats.infraestructure.persistence.django.models import StatsPeriodModel, StatsRollupModel
+from stats.infraestructure.persistence.django.rollups import ROLLUP_SOURCES
 from users.models import RoleModel, UserModel
-from courses.infraestructure.persistence.django.models import CourseModel
-from continuing_education.infraestructure.persistence.django.models import ContinuingEducationModel
-from continuing_education_teachers.infraestructure.persistence.django.models import (
-    ContinuingEducationTeacherModel,
-)
-from continuing_education_beneficiaries.infraestructure.persistence.django.models import (
-    ContinuingEducationBeneficiaryModel,
-)
-from wellbeing_activities.infraestructure.persistence.django.models import WellbeingActivityModel
-from wellbeing_beneficiaries.infraestructure.persistence.django.models import (
-    WellbeingBeneficiaryActivityModel,
-)
-from wellbeing_human_resources.infraestructure.persistence.django.models import (
-    WellbeingHumanResourceModel,
-)
 
 
 class DjangoStatsRepository(StatsRepository):
@@ -41,30 +33,83 @@ class DjangoStatsRepository(StatsRepository):
             qs = qs.filter(semester=int(semester))
         return qs
 
+    def _rollups(self, year: str | None, semester: int | None) -> dict:
+        """
+        Una sola consulta agregada sobre stats_rollups para los filtros pedidos.
+        Devuelve {(source, dimension): [row, ...]} con dimension_value decodificado en "key".
+        """
+        qs = self._filter_year_semester(StatsRollupModel.objects.all(), year, semester)
+        rows = (
+            qs.values("source", "dimension", "dimension_value")
+            .annotate(
+                records_sum=Sum("records"),
+                quantity_sum=Sum("quantity"),
+                amount_sum=self._dec_sum("amount", 20, 2),
+                amount_secondary_sum=self._dec_sum("amount_secondary", 20, 2),
+            )
+            .order_by()
+        )
+        grouped: dict = defaultdict(list)
+        for r in rows:
+            source, dimension = r["source"], r["dimension"]
+            spec = ROLLUP_SOURCES.get(source)
+            if spec is None:
+                continue
+            key = (
+                r["dimension_value"]
+                if dimension == StatsRollupModel.DIMENSION_TOTAL
+                else spec.decode(dimension, r["dimension_value"])
+            )
+            grouped[(source, dimension)].append(
+                {
+                    "key": key,
+                    "records": int(r["records_sum"] or 0),
+                    "quantity": int(r["quantity_sum"] or 0),
+                    "amount": r["amount_sum"],
+                    "amount_secondary": r["amount_secondary_sum"],
+                }
+            )
+        return grouped
+
+    def _totals(self, rollups: dict, source: str) -> dict:
+        rows = rollups.get((source, StatsRollupModel.DIMENSION_TOTAL))
+        if not rows:
+            return {"records": 0, "quantity": 0, "amount": Decimal(0), "amount_secondary": Decimal(0)}
+        return rows[0]
+
+    def _top(self, rollups: dict, source: str, dimension: str, measure: str, top_n: int) -> list[dict]:
+        rows = rollups.get((source, dimension), [])
+        return sorted(rows, key=lambda r: r[measure], reverse=True)[:top_n]
+
+    def _time_series(self) -> dict[str, list[tuple[str, int, int]]]:
+        series: dict[str, list[tuple[str, int, int]]] = {source: [] for source in ROLLUP_SOURCES}
+        for p in self.list_periods():
+            if p["source"] in series:
+                series[p["source"]].append((p["year"], p["semester"], p["records"]))
+        return series
+
+    def list_periods(self, source: str | None = None) -> list[dict]:
+        qs = StatsPeriodModel.objects.all()
+        if source:
+            qs = qs.filter(source=source)
+        rows = qs.values_list("source", "year", "semester", "records").order_by("year", "semester")
+        return [
+            {"source": src, "year": y, "semester": s, "records": int(records)}
+            for src, y, s, records in rows
+        ]
+
+    def get_data_version(self) -> str:
+        return ",".join(f"{table}:{gen}" for table, gen in sorted(generation_vector().items()))
+
     def get_dashboard(self, year: str | None, semester: int | None, top_n: int) -> dict:
         top_n = max(1, min(int(top_n or 10), 50))
 
-        # Available filters (union across year/semester-based tables)
-        years = set()
-        semesters = set()
-        for qs in (
-            WellbeingActivityModel.objects.values_list("year", flat=True).distinct(),
-            WellbeingBeneficiaryActivityModel.objects.values_list("year", flat=True).distinct(),
-            ContinuingEducationModel.objects.values_list("year", flat=True).distinct(),
-            ContinuingEducationTeacherModel.objects.values_list("year", flat=True).distinct(),
-            ContinuingEducationBeneficiaryModel.objects.values_list("year", flat=True).distinct(),
-            WellbeingHumanResourceModel.objects.values_list("year", flat=True).distinct(),
-        ):
-            years.update([str(y) for y in qs if y is not None])
-        for qs in (
-            WellbeingActivityModel.objects.values_list("semester", flat=True).distinct(),
-            WellbeingBeneficiaryActivityModel.objects.values_list("semester", flat=True).distinct(),
-            ContinuingEducationModel.objects.values_list("semester", flat=True).distinct(),
-            ContinuingEducationTeacherModel.objects.values_list("semester", flat=True).distinct(),
-            ContinuingEducationBeneficiaryModel.objects.values_list("semester", flat=True).distinct(),
-            WellbeingHumanResourceModel.objects.values_list("semester", flat=True).distinct(),
-        ):
-            semesters.update([int(s) for s in qs if s is not None])
+        rollups = self._rollups(year, semester)
+        series = self._time_series()
+
+        # Available filters (period catalogue, stats_periods)
+        years = {period[0] for periods in series.values() for period in periods}
+        semesters = {period[1] for periods in series.values() for period in periods}
 
         # Users / Roles (no year/semester)
         users_total = UserModel.objects.count()
@@ -85,154 +130,53 @@ class DjangoStatsRepository(StatsRepository):
             CourseModel.objects.values("is_extension").annotate(count=Count("id")).order_by("-count")
         )
 
-        # Continuing education (year/semester applies)
-        ce_qs = self._filter_year_semester(ContinuingEducationModel.objects.all(), year, semester)
-        ce_totals = ce_qs.aggregate(
-            records=Count("id"),
-            total_value=Coalesce(Sum("value"), 0),
-            total_hours=Coalesce(Sum("num_hours"), 0),
-        )
-        ce_by_course = (
-            ce_qs.values("id_course_id")
-            .annotate(records=Count("id"), total_value=Coalesce(Sum("value"), 0))
-            .order_by("-records")[:top_n]
-        )
+        # Year/semester sources are read from the materialized rollups (stats_rollups)
+        ce_totals = self._totals(rollups, "continuing_education")
+        ce_by_course = self._top(rollups, "continuing_education", "course", "records", top_n)
 
-        # Wellbeing activities (year/semester applies)
-        wa_qs = self._filter_year_semester(WellbeingActivityModel.objects.all(), year, semester)
-        wa_totals = wa_qs.aggregate(
-            records=Count("id"),
-            national_funding_total=self._dec_sum("national_funding_value"),
-            international_funding_total=self._dec_sum("international_funding_value"),
+        wa_totals = self._totals(rollups, "wellbeing_activities")
+        wa_by_type = self._top(rollups, "wellbeing_activities", "type", "records", top_n)
+        wa_by_org_unit = self._top(
+            rollups, "wellbeing_activities", "organization_unit", "records", top_n
         )
-        wa_by_type = (
-            wa_qs.values("wellbeing_activity_type_id")
-            .annotate(count=Count("id"))
-            .order_by("-count")[:top_n]
-        )
-        wa_by_org_unit = (
-            wa_qs.values("organization_unit_code")
-            .annotate(count=Count("id"))
-            .order_by("-count")[:top_n]
-        )
-        wa_by_country = (
-            wa_qs.values("funding_country_id")
-            .annotate(
-                count=Count("id"),
-                national_funding_total=self._dec_sum("national_funding_value"),
-                international_funding_total=self._dec_sum("international_funding_value"),
-            )
-            .order_by("-count")[:top_n]
+        wa_by_country = self._top(
+            rollups, "wellbeing_activities", "funding_country", "records", top_n
         )
 
-        # Wellbeing beneficiaries (year/semester applies)
-        wb_qs = self._filter_year_semester(
-            WellbeingBeneficiaryActivityModel.objects.all(), year, semester
-        )
-        wb_totals = wb_qs.aggregate(
-            records=Count("id"),
-            beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0),
-        )
-        wb_by_type = (
-            wb_qs.values("beneficiary_type_id")
-            .annotate(beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0))
-            .order_by("-beneficiaries_total")[:top_n]
-        )
-        wb_by_activity = (
-            wb_qs.values("activity_code")
-            .annotate(beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0))
-            .order_by("-beneficiaries_total")[:top_n]
+        wb_totals = self._totals(rollups, "wellbeing_beneficiaries")
+        wb_by_type = self._top(
+            rollups, "wellbeing_beneficiaries", "beneficiary_type", "quantity", top_n
         )
+        wb_by_activity = self._top(rollups, "wellbeing_beneficiaries", "activity", "quantity", top_n)
 
-        # Continuing education - teachers (year/semester applies)
-        cet_qs = self._filter_year_semester(
-            ContinuingEducationTeacherModel.objects.all(), year, semester
+        cet_totals = self._totals(rollups, "continuing_education_teachers")
+        cet_by_course = self._top(
+            rollups, "continuing_education_teachers", "course", "records", top_n
         )
-        cet_totals = cet_qs.aggregate(records=Count("id"))
-        cet_by_course = (
-            cet_qs.values("course_code")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
-        )
-        cet_by_doc_type = (
-            cet_qs.values("document_type_id")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
+        cet_by_doc_type = self._top(
+            rollups, "continuing_education_teachers", "document_type", "records", top_n
         )
 
-        # Continuing education - beneficiaries (year/semester applies)
-        ceb_qs = self._filter_year_semester(
-            ContinuingEducationBeneficiaryModel.objects.all(), year, semester
-        )
-        ceb_totals = ceb_qs.aggregate(
-            records=Count("id"),
-            beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0),
+        ceb_totals = self._totals(rollups, "continuing_education_beneficiaries")
+        ceb_by_course = self._top(
+            rollups, "continuing_education_beneficiaries", "course", "quantity", top_n
         )
-        ceb_by_course = (
-            ceb_qs.values("course_code")
-            .annotate(beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0))
-            .order_by("-beneficiaries_total")[:top_n]
-        )
-        ceb_by_type = (
-            ceb_qs.values("beneficiary_type_extension_id")
-            .annotate(beneficiaries_total=Coalesce(Sum("beneficiaries_count"), 0))
-            .order_by("-beneficiaries_total")[:top_n]
+        ceb_by_type = self._top(
+            rollups, "continuing_education_beneficiaries", "beneficiary_type", "quantity", top_n
         )
 
-        # Wellbeing - human resources (year/semester applies)
-        whr_qs = self._filter_year_semester(WellbeingHumanResourceModel.objects.all(), year, semester)
-        whr_totals = whr_qs.aggregate(records=Count("id"))
-        whr_by_activity = (
-            whr_qs.values("activity_code")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
+        whr_totals = self._totals(rollups, "wellbeing_human_resources")
+        whr_by_activity = self._top(
+            rollups, "wellbeing_human_resources", "activity", "records", top_n
         )
-        whr_by_org_unit = (
-            whr_qs.values("organization_unit_code")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
+        whr_by_org_unit = self._top(
+            rollups, "wellbeing_human_resources", "organization_unit", "records", top_n
         )
-        whr_by_doc_type = (
-            whr_qs.values("document_type_id")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
+        whr_by_doc_type = self._top(
+            rollups, "wellbeing_human_resources", "document_type", "records", top_n
         )
-        whr_by_dedication = (
-            whr_qs.values("dedication")
-            .annotate(records=Count("id"))
-            .order_by("-records")[:top_n]
-        )
-
-        # Time series (NOT filtered by request filters; intended for line/stacked-bar charts)
-        ts_ce = (
-            ContinuingEducationModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
-        )
-        ts_cet = (
-            ContinuingEducationTeacherModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
-        )
-        ts_ceb = (
-            ContinuingEducationBeneficiaryModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
-        )
-        ts_wa = (
-            WellbeingActivityModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
-        )
-        ts_wb = (
-            WellbeingBeneficiaryActivityModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
-        )
-        ts_whr = (
-            WellbeingHumanResourceModel.objects.values("year", "semester")
-            .annotate(records=Count("id"))
-            .order_by("year", "semester")
+        whr_by_dedication = self._top(
+            rollups, "wellbeing_human_resources", "dedication", "records", top_n
         )
 
         return {
@@ -256,86 +200,81 @@ class DjangoStatsRepository(StatsRepository):
             },
             "continuing_education": {
                 "totals": {
-                    "records": int(ce_totals["records"]),
-                    "total_value": int(ce_totals["total_value"]),
-                    "total_hours": int(ce_totals["total_hours"]),
+                    "records": ce_totals["records"],
+                    "total_value": int(ce_totals["amount"]),
+                    "total_hours": ce_totals["quantity"],
                 },
                 "by_course_top": [
                     {
-                        "course_id": r["id_course_id"],
+                        "course_id": r["key"],
                         "records": r["records"],
-                        "total_value": int(r["total_value"]),
+                        "total_value": int(r["amount"]),
                     }
                     for r in ce_by_course
                 ],
             },
             "continuing_education_teachers": {
-                "totals": {"records": int(cet_totals["records"])},
-                "by_course_top": [{"course_code": r["course_code"], "records": r["records"]} for r in cet_by_course],
-                "by_document_type_top": [{"document_type_id": r["document_type_id"], "records": r["records"]} for r in cet_by_doc_type],
+                "totals": {"records": cet_totals["records"]},
+                "by_course_top": [{"course_code": r["key"], "records": r["records"]} for r in cet_by_course],
+                "by_document_type_top": [{"document_type_id": r["key"], "records": r["records"]} for r in cet_by_doc_type],
             },
             "continuing_education_beneficiaries": {
                 "totals": {
-                    "records": int(ceb_totals["records"]),
-                    "beneficiaries_total": int(ceb_totals["beneficiaries_total"]),
+                    "records": ceb_totals["records"],
+                    "beneficiaries_total": ceb_totals["quantity"],
                 },
-                "by_course_top": [{"course_code": r["course_code"], "beneficiaries_total": int(r["beneficiaries_total"])} for r in ceb_by_course],
-                "by_type_top": [{"beneficiary_type_extension_id": r["beneficiary_type_extension_id"], "beneficiaries_total": int(r["beneficiaries_total"])} for r in ceb_by_type],
+                "by_course_top": [{"course_code": r["key"], "beneficiaries_total": r["quantity"]} for r in ceb_by_course],
+                "by_type_top": [{"beneficiary_type_extension_id": r["key"], "beneficiaries_total": r["quantity"]} for r in ceb_by_type],
             },
             "wellbeing": {
                 "activities": {
                     "totals": {
-                        "records": int(wa_totals["records"]),
-                        "national_funding_total": str(wa_totals["national_funding_total"]),
-                        "international_funding_total": str(wa_totals["international_funding_total"]),
+                        "records": wa_totals["records"],
+                        "national_funding_total": str(wa_totals["amount"]),
+                        "international_funding_total": str(wa_totals["amount_secondary"]),
                     },
                     "by_type_top": [
-                        {"type_id": r["wellbeing_activity_type_id"], "count": r["count"]}
+                        {"type_id": r["key"], "count": r["records"]}
                         for r in wa_by_type
                     ],
                     "by_org_unit_top": [
-                        {"organization_unit_code": r["organization_unit_code"], "count": r["count"]}
+                        {"organization_unit_code": r["key"], "count": r["records"]}
                         for r in wa_by_org_unit
                     ],
                     "by_country_top": [
                         {
-                            "funding_country_id": r["funding_country_id"],
-                            "count": r["count"],
-                            "national_funding_total": str(r["national_funding_total"]),
-                            "international_funding_total": str(r["international_funding_total"]),
+                            "funding_country_id": r["key"],
+                            "count": r["records"],
+                            "national_funding_total": str(r["amount"]),
+                            "international_funding_total": str(r["amount_secondary"]),
                         }
                         for r in wa_by_country
                     ],
                 },
                 "beneficiaries": {
                     "totals": {
-                        "records": int(wb_totals["records"]),
-                        "beneficiaries_total": int(wb_totals["beneficiaries_total"]),
+                        "records": wb_totals["records"],
+                        "beneficiaries_total": wb_totals["quantity"],
                     },
                     "by_type_top": [
-                        {"beneficiary_type_id": r["beneficiary_type_id"], "beneficiaries_total": int(r["beneficiaries_total"])}
+                        {"beneficiary_type_id": r["key"], "beneficiaries_total": r["quantity"]}
                         for r in wb_by_type
                     ],
                     "by_activity_top": [
-                        {"activity_code": r["activity_code"], "beneficiaries_total": int(r["beneficiaries_total"])}
+                        {"activity_code": r["key"], "beneficiaries_total": r["quantity"]}
                         for r in wb_by_activity
                     ],
                 },
                 "human_resources": {
-                    "totals": {"records": int(whr_totals["records"])},
-                    "by_activity_top": [{"activity_code": r["activity_code"], "records": r["records"]} for r in whr_by_activity],
-                    "by_org_unit_top": [{"organization_unit_code": r["organization_unit_code"], "records": r["records"]} for r in whr_by_org_unit],
-                    "by_document_type_top": [{"document_type_id": r["document_type_id"], "records": r["records"]} for r in whr_by_doc_type],
-                    "by_dedication_top": [{"dedication": r["dedication"], "records": r["records"]} for r in whr_by_dedication],
+                    "totals": {"records": whr_totals["records"]},
+                    "by_activity_top": [{"activity_code": r["key"], "records": r["records"]} for r in whr_by_activity],
+                    "by_org_unit_top": [{"organization_unit_code": r["key"], "records": r["records"]} for r in whr_by_org_unit],
+                    "by_document_type_top": [{"document_type_id": r["key"], "records": r["records"]} for r in whr_by_doc_type],
+                    "by_dedication_top": [{"dedication": r["key"], "records": r["records"]} for r in whr_by_dedication],
                 },
             },
             "time_series": {
-                "continuing_education": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_ce],
-                "continuing_education_teachers": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_cet],
-                "continuing_education_beneficiaries": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_ceb],
-                "wellbeing_activities": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_wa],
-                "wellbeing_beneficiaries": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_wb],
-                "wellbeing_human_resources": [{"year": r["year"], "semester": r["semester"], "records": r["records"]} for r in ts_whr],
+                source: [{"year": y, "semester": s, "records": records} for y, s, records in points]
+                for source, points in series.items()
             },
         }
-
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from stats.infraestructure.persistence.django.rollups import ROLLUP_SOURCES, refresh_all
+
+
+class Command(BaseCommand):
+    help = "Recalcula las tablas de rollup del dashboard (stats_rollups) desde las tablas origen."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            action="append",
+            dest="sources",
+            choices=sorted(ROLLUP_SOURCES.keys()),
+            help="Limita el recalculo a una fuente (se puede repetir).",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            summary = refresh_all(options.get("sources"))
+        except Exception as exc:
+            raise CommandError(f"No se pudieron recalcular los rollups: {exc}") from exc
+
+        for source, periods in summary.items():
+            self.stdout.write(f"{source}: {periods} periodo(s)")
+        self.stdout.write(self.style.SUCCESS("Rollups actualizados"))
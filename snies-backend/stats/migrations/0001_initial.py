@@ -0,0 +1,50 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="StatsRollupModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("source", models.CharField(max_length=64)),
+                ("year", models.CharField(max_length=4)),
+                ("semester", models.IntegerField()),
+                ("dimension", models.CharField(max_length=32)),
+                ("dimension_value", models.CharField(blank=True, default="", max_length=64)),
+                ("records", models.BigIntegerField(default=0)),
+                ("quantity", models.BigIntegerField(default=0)),
+                ("amount", models.DecimalField(decimal_places=2, default=0, max_digits=20)),
+                (
+                    "amount_secondary",
+                    models.DecimalField(decimal_places=2, default=0, max_digits=20),
+                ),
+                ("refreshed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "stats_rollups",
+                "indexes": [
+                    models.Index(
+                        fields=["year", "semester", "dimension"], name="stats_rollu_year_acc7e4_idx"
+                    ),
+                    models.Index(
+                        fields=["dimension", "source"], name="stats_rollu_dimensi_adb387_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="statsrollupmodel",
+            constraint=models.UniqueConstraint(
+                fields=("source", "year", "semester", "dimension", "dimension_value"),
+                name="stats_rollups_unique_key",
+            ),
+        ),
+    ]
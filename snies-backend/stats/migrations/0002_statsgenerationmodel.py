@@ -0,0 +1,24 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stats", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatsGenerationModel",
+            fields=[
+                ("table_name", models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ("generation", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "stats_generations",
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:18
+
+from django.db import migrations, models
+
+
+def backfill_periods_from_rollups(apps, schema_editor):
+    StatsRollupModel = apps.get_model("stats", "StatsRollupModel")
+    StatsPeriodModel = apps.get_model("stats", "StatsPeriodModel")
+
+    totals = StatsRollupModel.objects.filter(dimension="total").values_list(
+        "source", "year", "semester", "records"
+    )
+    StatsPeriodModel.objects.bulk_create(
+        [
+            StatsPeriodModel(source=source, year=year, semester=semester, records=records)
+            for source, year, semester, records in totals
+        ],
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stats", "0002_statsgenerationmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatsPeriodModel",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("source", models.CharField(max_length=64)),
+                ("year", models.CharField(max_length=4)),
+                ("semester", models.IntegerField()),
+                ("records", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "stats_periods",
+                "indexes": [
+                    models.Index(fields=["year", "semester"], name="stats_perio_year_58b861_idx")
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="statsperiodmodel",
+            constraint=models.UniqueConstraint(
+                fields=("source", "year", "semester"), name="stats_periods_unique_key"
+            ),
+        ),
+        migrations.RunPython(backfill_periods_from_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,5 @@
+from stats.infraestructure.persistence.django.models import (
+    StatsGenerationModel,
+    StatsPeriodModel,
+    StatsRollupModel,
+)
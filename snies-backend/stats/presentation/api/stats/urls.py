@@ -1,9 +1,10 @@
 from django.urls import path
 
-from stats.presentation.api.stats.views import StatsDashboardAPIView
+from stats.presentation.api.stats.views import StatsDashboardAPIView, StatsPeriodsAPIView
 
 
 urlpatterns = [
     path("dashboard/", StatsDashboardAPIView.as_view()),
+    path("periods/", StatsPeriodsAPIView.as_view()),
 ]
 
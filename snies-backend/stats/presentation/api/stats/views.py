@@ -2,8 +2,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.views import APIView
+from django.utils.http import parse_etags, quote_etag
 
 from stats.application.use_cases.get_dashboard_stats import GetDashboardStatsUseCase
+from stats.application.use_cases.list_stats_periods import ListStatsPeriodsUseCase
+from stats.infraestructure.cache.django_stats_cache import DjangoStatsCache
 from stats.infraestructure.persistence.django.stats_repository import DjangoStatsRepository
 from users.presentation.permissions import IsRootUser
 
@@ -15,6 +18,7 @@ class StatsDashboardAPIView(APIView):
       - year: str
       - semester: int
       - top_n: int (default 10, max 50)
+    Soporta If-None-Match: responde 304 si la version de datos no cambio.
     """
 
     permission_classes = [IsAuthenticated, IsRootUser]
@@ -36,7 +40,32 @@ class StatsDashboardAPIView(APIView):
         except ValueError:
             return Response({"error": "top_n must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
 
-        use_case = GetDashboardStatsUseCase(stats_repository=DjangoStatsRepository())
+        use_case = GetDashboardStatsUseCase(
+            stats_repository=DjangoStatsRepository(), stats_cache=DjangoStatsCache()
+        )
+        etag = quote_etag(use_case.etag(year=year, semester=semester, top_n=top_n))
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == "*"):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
         data = use_case.execute(year=year, semester=semester, top_n=top_n)
-        return Response(data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK, headers=headers)
+
 
+
+class StatsPeriodsAPIView(APIView):
+    """
+    GET /api/stats/periods/?source=wellbeing_human_resources
+    Catalogo de periodos (year, semester) con datos, para poblar filtros.
+    Filtro (opcional):
+      - source: tabla origen (continuing_education, wellbeing_activities, ...)
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        source = request.query_params.get("source") or None
+        use_case = ListStatsPeriodsUseCase(stats_repository=DjangoStatsRepository())
+        return Response(use_case.execute(source=source), status=status.HTTP_200_OK)
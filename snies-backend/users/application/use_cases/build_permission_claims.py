@@ -0,0 +1,29 @@
+from users.domain.ports.role_repository import RoleRepository
+
+
+class BuildPermissionClaimsUseCase:
+    """
+    Claims embedded in the access token when JWT_EMBED_PERMISSIONS is on:
+    role id/name, module -> action bitmask, the role's permissions version and the
+    user's token version. Read from the DB, never from the process-local cache.
+    """
+
+    def __init__(self, role_repository: RoleRepository):
+        self.role_repository = role_repository
+
+    def execute(self, role_id: int | None, role_name: str | None, token_version: int) -> dict:
+        if role_id is None:
+            return {
+                "role_id": None,
+                "role_name": None,
+                "perms": {},
+                "perms_version": 0,
+                "token_version": token_version,
+            }
+        return {
+            "role_id": role_id,
+            "role_name": role_name,
+            "perms": self.role_repository.load_permission_masks(role_id),
+            "perms_version": self.role_repository.get_permissions_version(role_id) or 0,
+            "token_version": token_version,
+        }
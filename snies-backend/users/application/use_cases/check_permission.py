@@ -1,3 +1,4 @@
+from users.domain.entities.role_permission import ACTION_BITS
 from users.domain.ports.role_repository import RoleRepository
 
 
@@ -7,18 +8,8 @@ class CheckPermissionUseCase:
 
     def execute(self, role_id: int, module: str, action: str) -> bool:
         # Root (role_id None) is handled outside; this is pure role-permissions check.
-        perms = self.role_repository.get_permissions(role_id)
-        for p in perms:
-            if p.module != module:
-                continue
-            if action == "view":
-                return p.can_view
-            if action == "create":
-                return p.can_create
-            if action == "edit":
-                return p.can_edit
-            if action == "delete":
-                return p.can_delete
+        bit = ACTION_BITS.get(action)
+        if not bit:
             return False
-        return False
-
+        mask = self.role_repository.get_permission_masks(role_id).get(module, 0)
+        return bool(mask & bit)
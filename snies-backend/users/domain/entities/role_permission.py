@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+# Bitmask per action; a module's permissions fit in one int (view|create|edit|delete)
+ACTION_BITS = {"view": 1, "create": 2, "edit": 4, "delete": 8}
+
 
 @dataclass(frozen=True)
 class RolePermission:
@@ -10,3 +13,11 @@ class RolePermission:
     can_edit: bool
     can_delete: bool
 
+    @property
+    def mask(self) -> int:
+        return (
+            (ACTION_BITS["view"] if self.can_view else 0)
+            | (ACTION_BITS["create"] if self.can_create else 0)
+            | (ACTION_BITS["edit"] if self.can_edit else 0)
+            | (ACTION_BITS["delete"] if self.can_delete else 0)
+        )
@@ -24,6 +24,19 @@ class RoleRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def set_permissions(self, role_id: int, permissions: list[RolePermission]) -> None:
+    def get_permission_masks(self, role_id: int) -> dict[str, int]:
+        """module -> bitmask of ACTION_BITS for the role."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_permission_masks(self, role_id: int) -> dict[str, int]:
+        """Same as get_permission_masks but read from the DB, bypassing any cache."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_permissions_version(self, role_id: int) -> int | None:
         raise NotImplementedError
 
+    @abstractmethod
+    def set_permissions(self, role_id: int, permissions: list[RolePermission]) -> None:
+        raise NotImplementedError
@@ -6,3 +6,7 @@ class UserRoleRepository(ABC):
     def assign_role(self, user_id: int, role_id: int) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_token_versions(self, user_id: int) -> tuple[int, int] | None:
+        """(user token_version, role permissions_version or 0); None if missing or inactive."""
+        raise NotImplementedError
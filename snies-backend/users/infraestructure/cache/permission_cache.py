@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+from django.conf import settings
+
+
+class PermissionCache:
+    """
+    Process-local map role_id -> module -> action bitmask.
+    Loaded in one query on first use, dropped on invalidate() (set_permissions) and
+    reloaded after PERMISSION_CACHE_TTL seconds as a safety net for other processes.
+    """
+
+    def __init__(self, loader: Callable[[], dict[int, dict[str, int]]]):
+        self._loader = loader
+        self._masks: dict[int, dict[str, int]] | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _ttl(self) -> float:
+        return float(getattr(settings, "PERMISSION_CACHE_TTL", 300))
+
+    def get(self, role_id: int) -> dict[str, int]:
+        masks = self._masks
+        if masks is None or time.monotonic() - self._loaded_at > self._ttl():
+            with self._lock:
+                masks = self._masks
+                if masks is None or time.monotonic() - self._loaded_at > self._ttl():
+                    masks = self._loader()
+                    self._masks = masks
+                    self._loaded_at = time.monotonic()
+        return masks.get(role_id, {})
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._masks = None
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
+from django.db import transaction
+from django.db.models import F
+
+from stats.infraestructure.persistence.django.generations import bump_generation
 from users.domain.entities.role import Role
 from users.domain.entities.role_permission import RolePermission
 from users.domain.ports.role_repository import RoleRepository
+from users.infraestructure.cache.permission_cache import PermissionCache
 from users.models import RoleModel, RolePermissionModel
 
 
+def _load_permission_masks(**filters) -> dict[int, dict[str, int]]:
+    masks: dict[int, dict[str, int]] = {}
+    rows = RolePermissionModel.objects.filter(**filters).values_list(
+        "role_id", "module", "can_view", "can_create", "can_edit", "can_delete"
+    )
+    for role_id, module, *flags in rows:
+        masks.setdefault(role_id, {})[module] = RolePermission(role_id, module, *flags).mask
+    return masks
+
+
+permission_cache = PermissionCache(loader=_load_permission_masks)
+
+
 class DjangoRoleRepository(RoleRepository):
     def create(self, role: Role) -> Role:
         role_model = RoleModel.objects.create(name=role.name, description=role.description)
+        bump_generation("roles")
         return Role(id=role_model.id, name=role_model.name, description=role_model.description)
 
     def list(self) -> list[Role]:
@@ -35,6 +54,19 @@ class DjangoRoleRepository(RoleRepository):
             for p in qs
         ]
 
+    def get_permission_masks(self, role_id: int) -> dict[str, int]:
+        return permission_cache.get(role_id)
+
+    def load_permission_masks(self, role_id: int) -> dict[str, int]:
+        return _load_permission_masks(role_id=role_id).get(role_id, {})
+
+    def get_permissions_version(self, role_id: int) -> int | None:
+        return (
+            RoleModel.objects.filter(id=role_id)
+            .values_list("permissions_version", flat=True)
+            .first()
+        )
+
     def set_permissions(self, role_id: int, permissions: list[RolePermission]) -> None:
         # Replace permissions for the given role_id
         RolePermissionModel.objects.filter(role_id=role_id).delete()
@@ -51,4 +83,7 @@ class DjangoRoleRepository(RoleRepository):
                 for p in permissions
             ]
         )
-
+        RoleModel.objects.filter(id=role_id).update(
+            permissions_version=F("permissions_version") + 1
+        )
+        transaction.on_commit(permission_cache.invalidate)
@@ -1,13 +1,18 @@
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
 from domain.entities.users import User
 from domain.ports.user_repository import UserRepository
+from stats.infraestructure.persistence.django.generations import bump_generation
 from users.models import UserModel
 
 
-class DjangoUserRepository(UserRepository):
+class DjangoUserRepository(DjangoRepositoryBase[UserModel], UserRepository):
+    model = UserModel
+
     def create(self, user: User) -> User:
         user_model = UserModel.objects.create_user(
             email=user.email, password=user.password, name=user.name
         )
+        bump_generation("users")
         return self._to_domain(user_model)
 
     def get_by_id(self, user_id: int) -> User | None:
@@ -25,22 +30,17 @@ class DjangoUserRepository(UserRepository):
             return None
 
     def update(self, user: User) -> User | None:
-        try:
-            user_model = UserModel.objects.get(id=user.id)
-            user_model.name = user.name
-            user_model.email = user.email
-            user_model.password = user.password
-            user_model.save()
-            return self._to_domain(user_model)
-        except UserModel.DoesNotExist:
+        user_model, _ = self._update_returning(
+            user.id, {"name": user.name, "email": user.email, "password": user.password}
+        )
+        if user_model is None:
             return None
+        bump_generation("users")
+        return self._to_domain(user_model)
 
     def delete(self, user_id: int) -> None:
-        try:
-            user_model = UserModel.objects.get(id=user_id)
-            user_model.delete()
-        except UserModel.DoesNotExist:
-            pass
+        if self._delete_returning(user_id) is not None:
+            bump_generation("users")
 
     def list_paginated(self, page: int, page_size: int) -> tuple[int, list[User]]:
         if page < 1:
@@ -1,3 +1,6 @@
+from django.db.models import F
+
+from stats.infraestructure.persistence.django.generations import bump_generation
 from users.domain.ports.user_role_repository import UserRoleRepository
 from users.models import UserModel
 
@@ -6,5 +9,18 @@ class DjangoUserRoleRepository(UserRoleRepository):
     def assign_role(self, user_id: int, role_id: int) -> None:
         user = UserModel.objects.get(id=user_id)
         user.role_id = role_id
-        user.save(update_fields=["role"])
+        # Only this user's tokens carry the old role's claims: bump its own token_version
+        user.token_version = F("token_version") + 1
+        user.save(update_fields=["role", "token_version"])
+        bump_generation("users")
 
+    def get_token_versions(self, user_id: int) -> tuple[int, int] | None:
+        row = (
+            UserModel.objects.filter(pk=user_id, is_active=True)
+            .values_list("token_version", "role__permissions_version")
+            .first()
+        )
+        if row is None:
+            return None
+        token_version, permissions_version = row
+        return token_version, permissions_version or 0
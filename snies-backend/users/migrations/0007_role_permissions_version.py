@@ -0,0 +1,32 @@
+# Generated by Django 4.2.15 on 2026-10-18 10:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_seed_root_audit_permission"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rolemodel",
+            name="permissions_version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name="rolepermissionmodel",
+            name="module",
+            field=models.CharField(
+                choices=[
+                    ("courses", "Cursos"),
+                    ("wellbeing", "Bienestar"),
+                    ("continuing_education", "Educación continua"),
+                    ("audit", "Auditoría"),
+                    ("software_activities", "Actividades (Ing. Software)"),
+                ],
+                max_length=32,
+            ),
+        ),
+    ]
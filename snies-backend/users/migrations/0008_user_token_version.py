@@ -0,0 +1,18 @@
+# Generated by Django 4.2.15 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0007_role_permissions_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="usermodel",
+            name="token_version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
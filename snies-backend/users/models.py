@@ -6,6 +6,8 @@ from .managers import CustomUserManager
 class RoleModel(models.Model):
     name = models.CharField(max_length=50, unique=True)
     description = models.CharField(max_length=255, null=True, blank=True)
+    # Incremented whenever the role's permissions change (JWT permission claims check it)
+    permissions_version = models.PositiveIntegerField(default=1)
 
     class Meta:
         db_table = "roles"
@@ -48,6 +50,8 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     role = models.ForeignKey(RoleModel, null=True, blank=True, on_delete=models.SET_NULL, related_name="users")
+    # Incremented when the user's role changes (JWT permission claims check it)
+    token_version = models.PositiveIntegerField(default=1)
 
     objects = CustomUserManager()
 
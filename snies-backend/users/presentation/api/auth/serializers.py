@@ -1,10 +1,64 @@
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from users.application.use_cases.build_permission_claims import BuildPermissionClaimsUseCase
+from users.infraestructure.persistence.django.role_repository import DjangoRoleRepository
+from users.models import UserModel
 
 
 class RegisterSerializer(serializers.Serializer):
     name = serializers.CharField(max_length=100)
     email = serializers.EmailField()
     password = serializers.CharField(max_length=100)
-                                                                                                                                               
 
-                                                 
+
+def _stamp_permission_claims(token, user) -> None:
+    role = getattr(user, "role", None)
+    claims = BuildPermissionClaimsUseCase(role_repository=DjangoRoleRepository()).execute(
+        role_id=getattr(role, "id", None),
+        role_name=getattr(role, "name", None),
+        token_version=user.token_version,
+    )
+    token["email"] = user.email
+    for claim, value in claims.items():
+        token[claim] = value
+
+
+class PermissionClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login: adds role/permission claims to the refresh (and derived access) token."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        _stamp_permission_claims(token, user)
+        return token
+
+
+class PermissionClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh: reloads the user, its role and the role's permissions from the DB (not the
+    process-local cache) so the new access token carries the current claims.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data["access"])
+        user = (
+            UserModel.objects.select_related("role")
+            .filter(
+                is_active=True,
+                **{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]},
+            )
+            .first()
+        )
+        if user is None:
+            raise AuthenticationFailed("No active account found for the given token.")
+        _stamp_permission_claims(access, user)
+        data["access"] = str(access)
+        return data
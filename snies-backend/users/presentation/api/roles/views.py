@@ -93,8 +93,8 @@ class RolePermissionsAPIView(RootOnlyAPIView):
         # Notify users with this role that their permissions changed
         affected_users = UserModel.objects.filter(role_id=role_id).values_list("id", flat=True)
         notifier = CreateNotificationUseCase(notification_repository=DjangoNotificationRepository())
-        for uid in affected_users:
-            notifier.execute(
+        notifier.execute_many(
+            [
                 Notification(
                     id=None,
                     user_id=int(uid),
@@ -108,7 +108,9 @@ class RolePermissionsAPIView(RootOnlyAPIView):
                     resource_id=str(role_id),
                     level="info",
                 )
-            )
+                for uid in affected_users
+            ]
+        )
 
         return Response({"message": "Permissions updated successfully"}, status=status.HTTP_200_OK)
 
@@ -0,0 +1,63 @@
+from functools import cached_property
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from users.domain.entities.role import Role
+from users.infraestructure.persistence.django.user_role_repository import (
+    DjangoUserRoleRepository,
+)
+
+PERMS_VERSION_CLAIM = "perms_version"
+TOKEN_VERSION_CLAIM = "token_version"
+
+
+class PermissionClaimsUser(TokenUser):
+    """Stateless user built from token claims (no users/roles query)."""
+
+    @cached_property
+    def email(self) -> str | None:
+        return self.token.get("email")
+
+    @cached_property
+    def role(self) -> Role | None:
+        role_id = self.token.get("role_id")
+        if role_id is None:
+            return None
+        return Role(id=role_id, name=self.token.get("role_name") or "")
+
+    @cached_property
+    def permission_masks(self) -> dict[str, int]:
+        return self.token.get("perms") or {}
+
+
+class PermissionClaimsJWTAuthentication(JWTAuthentication):
+    """
+    Trusts role/permission claims (JWT_EMBED_PERMISSIONS). One PK query reads the user's
+    token_version (bumped when its role changes) and its role's permissions_version; if
+    either differs from the token, it is rejected so the client refreshes it.
+    Tokens without the claims fall back to the regular DB user lookup.
+    """
+
+    def get_user(self, validated_token):
+        if PERMS_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        current = DjangoUserRoleRepository().get_token_versions(user_id)
+        if current is None:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        claimed = (
+            validated_token.get(TOKEN_VERSION_CLAIM),
+            validated_token[PERMS_VERSION_CLAIM],
+        )
+        if current != claimed:
+            raise InvalidToken(
+                {
+                    "detail": "Los permisos del usuario cambiaron; renueve el token",
+                    "code": "permissions_changed",
+                }
+            )
+        return PermissionClaimsUser(validated_token)
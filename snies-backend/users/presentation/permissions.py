@@ -1,6 +1,7 @@
 from rest_framework.permissions import BasePermission
 
 from users.application.use_cases.check_permission import CheckPermissionUseCase
+from users.domain.entities.role_permission import ACTION_BITS
 from users.infraestructure.persistence.django.role_repository import DjangoRoleRepository
 
 
@@ -40,6 +41,11 @@ class HasModulePermission(BasePermission):
         if getattr(role, "name", None) == "root":
             return True
 
+        # Stateless tokens (JWT_EMBED_PERMISSIONS) already carry the module bitmasks
+        masks = getattr(user, "permission_masks", None)
+        if masks is not None:
+            bit = ACTION_BITS.get(required_action, 0)
+            return bool(bit) and bool(masks.get(required_module, 0) & bit)
+
         use_case = CheckPermissionUseCase(role_repository=DjangoRoleRepository())
         return use_case.execute(role_id=role.id, module=required_module, action=required_action)
-
@@ -0,0 +1,17 @@
+from common.domain.pagination import Page, PageQuery
+from wellbeing_activities.domain.entities.wellbeing_activity import (
+    WellbeingActivity,
+)
+from wellbeing_activities.domain.ports.wellbeing_activity_repository import (
+    WellbeingActivityRepository,
+)
+
+
+class ListWellbeingActivitiesKeysetUseCase:
+    """Listado por cursor: cada página queda acotada por query.limit sea cual sea la tabla."""
+
+    def __init__(self, repository: WellbeingActivityRepository):
+        self.repository = repository
+
+    def execute(self, query: PageQuery) -> Page[WellbeingActivity]:
+        return self.repository.list_page(query)
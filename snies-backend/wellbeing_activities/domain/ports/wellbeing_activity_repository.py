@@ -1,9 +1,10 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
+from common.domain.pagination import PaginatedRepository
 from wellbeing_activities.domain.entities.wellbeing_activity import WellbeingActivity
 
 
-class WellbeingActivityRepository(ABC):
+class WellbeingActivityRepository(PaginatedRepository[WellbeingActivity]):
     @abstractmethod
     def create(self, activity: WellbeingActivity) -> WellbeingActivity:
         pass
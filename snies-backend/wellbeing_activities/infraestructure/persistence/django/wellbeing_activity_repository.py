@@ -1,3 +1,7 @@
+from common.domain.pagination import Page, PageQuery
+from common.infraestructure.persistence.django.pagination import keyset_page
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
 from wellbeing_activities.domain.entities.wellbeing_activity import WellbeingActivity
 from wellbeing_activities.domain.ports.wellbeing_activity_repository import (
     WellbeingActivityRepository,
@@ -6,8 +10,14 @@ from wellbeing_activities.infraestructure.persistence.django.models import (
     WellbeingActivityModel,
 )
 
+ROLLUP_SOURCE = "wellbeing_activities"
+
+
+class WellbeingActivityRepositoryDjango(
+    DjangoRepositoryBase[WellbeingActivityModel], WellbeingActivityRepository
+):
+    model = WellbeingActivityModel
 
-class WellbeingActivityRepositoryDjango(WellbeingActivityRepository):
     def create(self, activity: WellbeingActivity) -> WellbeingActivity:
         model = WellbeingActivityModel.objects.create(
             year=activity.year,
@@ -24,10 +34,14 @@ class WellbeingActivityRepositoryDjango(WellbeingActivityRepository):
             international_source_entity_name=activity.international_source_entity_name,
             international_funding_value=activity.international_funding_value,
         )
+        schedule_refresh(ROLLUP_SOURCE, (model.year, model.semester))
         return self._to_domain(model)
 
     def list(self) -> list[WellbeingActivity]:
-        return [self._to_domain(m) for m in WellbeingActivityModel.objects.all()]
+        return [self._to_domain(m) for m in WellbeingActivityModel.objects.order_by("id")]
+
+    def list_page(self, query: PageQuery) -> Page[WellbeingActivity]:
+        return keyset_page(WellbeingActivityModel.objects.all(), query, self._to_domain)
 
     def get_by_id(self, id: int) -> WellbeingActivity | None:
         try:
@@ -36,30 +50,36 @@ class WellbeingActivityRepositoryDjango(WellbeingActivityRepository):
             return None
 
     def update(self, id: int, activity: WellbeingActivity) -> WellbeingActivity | None:
-        try:
-            model = WellbeingActivityModel.objects.get(id=id)
-        except WellbeingActivityModel.DoesNotExist:
+        model, previous_period = self._update_returning(
+            id,
+            {
+                "year": activity.year,
+                "semester": activity.semester,
+                "organization_unit_code": activity.organization_unit_code,
+                "activity_code": activity.activity_code,
+                "activity_description": activity.activity_description,
+                "wellbeing_activity_type_id": activity.wellbeing_activity_type_id,
+                "start_date": activity.start_date,
+                "end_date": activity.end_date,
+                "national_source_id": activity.national_source_id,
+                "national_funding_value": activity.national_funding_value,
+                "funding_country_id": activity.funding_country_id,
+                "international_source_entity_name": activity.international_source_entity_name,
+                "international_funding_value": activity.international_funding_value,
+            },
+            previous=("year", "semester"),
+        )
+        if model is None:
             return None
-
-        model.year = activity.year
-        model.semester = activity.semester
-        model.organization_unit_code = activity.organization_unit_code
-        model.activity_code = activity.activity_code
-        model.activity_description = activity.activity_description
-        model.wellbeing_activity_type_id = activity.wellbeing_activity_type_id
-        model.start_date = activity.start_date
-        model.end_date = activity.end_date
-        model.national_source_id = activity.national_source_id
-        model.national_funding_value = activity.national_funding_value
-        model.funding_country_id = activity.funding_country_id
-        model.international_source_entity_name = activity.international_source_entity_name
-        model.international_funding_value = activity.international_funding_value
-        model.save()
+        schedule_refresh(ROLLUP_SOURCE, previous_period, (model.year, model.semester))
         return self._to_domain(model)
 
     def delete(self, id: int) -> bool:
-        deleted, _ = WellbeingActivityModel.objects.filter(id=id).delete()
-        return deleted > 0
+        period = self._delete_returning(id, ("year", "semester"))
+        if period is None:
+            return False
+        schedule_refresh(ROLLUP_SOURCE, period)
+        return True
 
     def _to_domain(self, model: WellbeingActivityModel) -> WellbeingActivity:
         return WellbeingActivity(
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wellbeing_activities", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="wellbeingactivitymodel",
+            index=models.Index(
+                fields=["year", "semester", "id"], name="actividades_year_695416_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeingactivitymodel",
+            index=models.Index(
+                fields=["organization_unit_code", "id"], name="actividades_organiz_cebe76_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeingactivitymodel",
+            index=models.Index(
+                fields=["activity_code", "id"], name="actividades_activit_c3a1e8_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import page_payload, parse_page_query, wants_page
 
 from wellbeing_activities.application.use_cases.create_wellbeing_activity import (
     CreateWellbeingActivityUseCase,
@@ -15,6 +16,9 @@ from wellbeing_activities.application.use_cases.get_wellbeing_activity import (
 from wellbeing_activities.application.use_cases.list_wellbeing_activities import (
     ListWellbeingActivitiesUseCase,
 )
+from wellbeing_activities.application.use_cases.list_wellbeing_activities_keyset import (
+    ListWellbeingActivitiesKeysetUseCase,
+)
 from wellbeing_activities.application.use_cases.update_wellbeing_activity import (
     UpdateWellbeingActivityUseCase,
 )
@@ -70,37 +74,60 @@ class WellbeingActivityCreateAPIView(AuditedAPIView):
         )
 
 
+def _activity_to_dict(a) -> dict:
+    return {
+        "id": a.id,
+        "year": a.year,
+        "semester": a.semester,
+        "organization_unit_code": a.organization_unit_code,
+        "activity_code": a.activity_code,
+        "activity_description": a.activity_description,
+        "wellbeing_activity_type_id": a.wellbeing_activity_type_id,
+        "start_date": a.start_date,
+        "end_date": a.end_date,
+        "national_source_id": a.national_source_id,
+        "national_funding_value": a.national_funding_value,
+        "funding_country_id": a.funding_country_id,
+        "international_source_entity_name": a.international_source_entity_name,
+        "international_funding_value": a.international_funding_value,
+    }
+
+
 class WellbeingActivityListAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
     required_module = "wellbeing"
     required_action = "view"
 
     def get(self, request):
+        if wants_page(request.query_params):
+            return self._list_keyset(request)
+
         use_case = ListWellbeingActivitiesUseCase(
             repository=WellbeingActivityRepositoryDjango()
         )
         activities = use_case.execute()
-        data = [
-            {
-                "id": a.id,
-                "year": a.year,
-                "semester": a.semester,
-                "organization_unit_code": a.organization_unit_code,
-                "activity_code": a.activity_code,
-                "activity_description": a.activity_description,
-                "wellbeing_activity_type_id": a.wellbeing_activity_type_id,
-                "start_date": a.start_date,
-                "end_date": a.end_date,
-                "national_source_id": a.national_source_id,
-                "national_funding_value": a.national_funding_value,
-                "funding_country_id": a.funding_country_id,
-                "international_source_entity_name": a.international_source_entity_name,
-                "international_funding_value": a.international_funding_value,
-            }
-            for a in activities
-        ]
+        data = [_activity_to_dict(a) for a in activities]
         return Response(data, status=status.HTTP_200_OK)
 
+    def _list_keyset(self, request):
+        """
+        GET ...?cursor=&limit=100&count=exact|none&year=&semester=
+            &organization_unit_code=&activity_code=
+          -> {"count", "limit", "next_cursor", "results"}
+        next_cursor se envía como ?cursor= para la página siguiente (null = última).
+        Cualquiera de estos parámetros activa este modo; sin ninguno se devuelve la lista.
+        """
+        try:
+            query = parse_page_query(request.query_params)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = ListWellbeingActivitiesKeysetUseCase(
+            repository=WellbeingActivityRepositoryDjango()
+        )
+        page = use_case.execute(query)
+        return Response(page_payload(page, query, _activity_to_dict), status=status.HTTP_200_OK)
+
 
 class WellbeingActivityDetailAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
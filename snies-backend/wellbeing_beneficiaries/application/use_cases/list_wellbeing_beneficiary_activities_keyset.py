@@ -0,0 +1,17 @@
+from common.domain.pagination import Page, PageQuery
+from wellbeing_beneficiaries.domain.entities.wellbeing_beneficiary_activity import (
+    WellbeingBeneficiaryActivity,
+)
+from wellbeing_beneficiaries.domain.ports.wellbeing_beneficiary_activity_repository import (
+    WellbeingBeneficiaryActivityRepository,
+)
+
+
+class ListWellbeingBeneficiaryActivitiesKeysetUseCase:
+    """Listado por cursor: cada página queda acotada por query.limit sea cual sea la tabla."""
+
+    def __init__(self, repository: WellbeingBeneficiaryActivityRepository):
+        self.repository = repository
+
+    def execute(self, query: PageQuery) -> Page[WellbeingBeneficiaryActivity]:
+        return self.repository.list_page(query)
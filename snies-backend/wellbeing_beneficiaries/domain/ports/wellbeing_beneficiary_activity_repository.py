@@ -1,11 +1,12 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
+from common.domain.pagination import PaginatedRepository
 from wellbeing_beneficiaries.domain.entities.wellbeing_beneficiary_activity import (
     WellbeingBeneficiaryActivity,
 )
 
 
-class WellbeingBeneficiaryActivityRepository(ABC):
+class WellbeingBeneficiaryActivityRepository(PaginatedRepository[WellbeingBeneficiaryActivity]):
     @abstractmethod
     def create(
         self, activity: WellbeingBeneficiaryActivity
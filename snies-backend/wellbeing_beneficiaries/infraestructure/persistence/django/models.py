@@ -12,4 +12,10 @@ class WellbeingBeneficiaryActivityModel(models.Model):
 
     class Meta:
         db_table = "actividad_bienestar_beneficiarios"
+        # Filtros del listado paginado + id al final: filtra y avanza por cursor con el índice
+        indexes = [
+            models.Index(fields=["year", "semester", "id"]),
+            models.Index(fields=["organization_unit_code", "id"]),
+            models.Index(fields=["activity_code", "id"]),
+        ]
 
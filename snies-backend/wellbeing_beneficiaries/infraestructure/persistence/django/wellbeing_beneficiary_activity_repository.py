@@ -1,3 +1,7 @@
+from common.domain.pagination import Page, PageQuery
+from common.infraestructure.persistence.django.pagination import keyset_page
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
 from wellbeing_beneficiaries.domain.entities.wellbeing_beneficiary_activity import (
     WellbeingBeneficiaryActivity,
 )
@@ -8,8 +12,14 @@ from wellbeing_beneficiaries.infraestructure.persistence.django.models import (
     WellbeingBeneficiaryActivityModel,
 )
 
+ROLLUP_SOURCE = "wellbeing_beneficiaries"
+
+
+class WellbeingBeneficiaryActivityRepositoryDjango(
+    DjangoRepositoryBase[WellbeingBeneficiaryActivityModel], WellbeingBeneficiaryActivityRepository
+):
+    model = WellbeingBeneficiaryActivityModel
 
-class WellbeingBeneficiaryActivityRepositoryDjango(WellbeingBeneficiaryActivityRepository):
     def create(self, activity: WellbeingBeneficiaryActivity) -> WellbeingBeneficiaryActivity:
         model = WellbeingBeneficiaryActivityModel.objects.create(
             year=activity.year,
@@ -19,10 +29,14 @@ class WellbeingBeneficiaryActivityRepositoryDjango(WellbeingBeneficiaryActivityR
             beneficiary_type_id=activity.beneficiary_type_id,
             beneficiaries_count=activity.beneficiaries_count,
         )
+        schedule_refresh(ROLLUP_SOURCE, (model.year, model.semester))
         return self._to_domain(model)
 
     def list(self) -> list[WellbeingBeneficiaryActivity]:
-        return [self._to_domain(m) for m in WellbeingBeneficiaryActivityModel.objects.all()]
+        return [self._to_domain(m) for m in WellbeingBeneficiaryActivityModel.objects.order_by("id")]
+
+    def list_page(self, query: PageQuery) -> Page[WellbeingBeneficiaryActivity]:
+        return keyset_page(WellbeingBeneficiaryActivityModel.objects.all(), query, self._to_domain)
 
     def get_by_id(self, id: int) -> WellbeingBeneficiaryActivity | None:
         try:
@@ -33,23 +47,29 @@ class WellbeingBeneficiaryActivityRepositoryDjango(WellbeingBeneficiaryActivityR
     def update(
         self, id: int, activity: WellbeingBeneficiaryActivity
     ) -> WellbeingBeneficiaryActivity | None:
-        try:
-            model = WellbeingBeneficiaryActivityModel.objects.get(id=id)
-        except WellbeingBeneficiaryActivityModel.DoesNotExist:
+        model, previous_period = self._update_returning(
+            id,
+            {
+                "year": activity.year,
+                "semester": activity.semester,
+                "organization_unit_code": activity.organization_unit_code,
+                "activity_code": activity.activity_code,
+                "beneficiary_type_id": activity.beneficiary_type_id,
+                "beneficiaries_count": activity.beneficiaries_count,
+            },
+            previous=("year", "semester"),
+        )
+        if model is None:
             return None
-
-        model.year = activity.year
-        model.semester = activity.semester
-        model.organization_unit_code = activity.organization_unit_code
-        model.activity_code = activity.activity_code
-        model.beneficiary_type_id = activity.beneficiary_type_id
-        model.beneficiaries_count = activity.beneficiaries_count
-        model.save()
+        schedule_refresh(ROLLUP_SOURCE, previous_period, (model.year, model.semester))
         return self._to_domain(model)
 
     def delete(self, id: int) -> bool:
-        deleted, _ = WellbeingBeneficiaryActivityModel.objects.filter(id=id).delete()
-        return deleted > 0
+        period = self._delete_returning(id, ("year", "semester"))
+        if period is None:
+            return False
+        schedule_refresh(ROLLUP_SOURCE, period)
+        return True
 
     def _to_domain(self, model: WellbeingBeneficiaryActivityModel) -> WellbeingBeneficiaryActivity:
         return WellbeingBeneficiaryActivity(
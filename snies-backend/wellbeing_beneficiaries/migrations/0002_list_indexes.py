@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wellbeing_beneficiaries", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="wellbeingbeneficiaryactivitymodel",
+            index=models.Index(
+                fields=["year", "semester", "id"], name="actividad_b_year_48a698_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeingbeneficiaryactivitymodel",
+            index=models.Index(
+                fields=["organization_unit_code", "id"], name="actividad_b_organiz_78f4c2_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeingbeneficiaryactivitymodel",
+            index=models.Index(
+                fields=["activity_code", "id"], name="actividad_b_activit_b98e74_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import page_payload, parse_page_query, wants_page
 
 from wellbeing_beneficiaries.application.use_cases.create_wellbeing_beneficiary_activity import (
     CreateWellbeingBeneficiaryActivityUseCase,
@@ -15,6 +16,9 @@ from wellbeing_beneficiaries.application.use_cases.get_wellbeing_beneficiary_act
 from wellbeing_beneficiaries.application.use_cases.list_wellbeing_beneficiary_activities import (
     ListWellbeingBeneficiaryActivitiesUseCase,
 )
+from wellbeing_beneficiaries.application.use_cases.list_wellbeing_beneficiary_activities_keyset import (
+    ListWellbeingBeneficiaryActivitiesKeysetUseCase,
+)
 from wellbeing_beneficiaries.application.use_cases.update_wellbeing_beneficiary_activity import (
     UpdateWellbeingBeneficiaryActivityUseCase,
 )
@@ -62,30 +66,53 @@ class WellbeingBeneficiaryActivityCreateAPIView(AuditedAPIView):
         )
 
 
+def _activity_to_dict(a) -> dict:
+    return {
+        "id": a.id,
+        "year": a.year,
+        "semester": a.semester,
+        "organization_unit_code": a.organization_unit_code,
+        "activity_code": a.activity_code,
+        "beneficiary_type_id": a.beneficiary_type_id,
+        "beneficiaries_count": a.beneficiaries_count,
+    }
+
+
 class WellbeingBeneficiaryActivityListAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
     required_module = "wellbeing"
     required_action = "view"
 
     def get(self, request):
+        if wants_page(request.query_params):
+            return self._list_keyset(request)
+
         use_case = ListWellbeingBeneficiaryActivitiesUseCase(
             repository=WellbeingBeneficiaryActivityRepositoryDjango()
         )
         activities = use_case.execute()
-        data = [
-            {
-                "id": a.id,
-                "year": a.year,
-                "semester": a.semester,
-                "organization_unit_code": a.organization_unit_code,
-                "activity_code": a.activity_code,
-                "beneficiary_type_id": a.beneficiary_type_id,
-                "beneficiaries_count": a.beneficiaries_count,
-            }
-            for a in activities
-        ]
+        data = [_activity_to_dict(a) for a in activities]
         return Response(data, status=status.HTTP_200_OK)
 
+    def _list_keyset(self, request):
+        """
+        GET ...?cursor=&limit=100&count=exact|none&year=&semester=
+            &organization_unit_code=&activity_code=
+          -> {"count", "limit", "next_cursor", "results"}
+        next_cursor se envía como ?cursor= para la página siguiente (null = última).
+        Cualquiera de estos parámetros activa este modo; sin ninguno se devuelve la lista.
+        """
+        try:
+            query = parse_page_query(request.query_params)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = ListWellbeingBeneficiaryActivitiesKeysetUseCase(
+            repository=WellbeingBeneficiaryActivityRepositoryDjango()
+        )
+        page = use_case.execute(query)
+        return Response(page_payload(page, query, _activity_to_dict), status=status.HTTP_200_OK)
+
 
 class WellbeingBeneficiaryActivityDetailAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
@@ -0,0 +1,17 @@
+from common.domain.pagination import Page, PageQuery
+from wellbeing_human_resources.domain.entities.wellbeing_human_resource import (
+    WellbeingHumanResource,
+)
+from wellbeing_human_resources.domain.ports.wellbeing_human_resource_repository import (
+    WellbeingHumanResourceRepository,
+)
+
+
+class ListWellbeingHumanResourcesKeysetUseCase:
+    """Listado por cursor: cada página queda acotada por query.limit sea cual sea la tabla."""
+
+    def __init__(self, repository: WellbeingHumanResourceRepository):
+        self.repository = repository
+
+    def execute(self, query: PageQuery) -> Page[WellbeingHumanResource]:
+        return self.repository.list_page(query)
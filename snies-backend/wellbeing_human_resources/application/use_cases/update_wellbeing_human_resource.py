@@ -14,10 +14,6 @@ class UpdateWellbeingHumanResourceUseCase:
         self.repository = repository
 
     def execute(self, item_id: int, item: WellbeingHumanResource) -> WellbeingHumanResource:
-        existing = self.repository.get_by_id(item_id)
-        if not existing:
-            raise WellbeingHumanResourceNotFoundException("Human resource not found")
-
         item_to_update = WellbeingHumanResource(
             id=item_id,
             year=item.year,
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
+from common.domain.pagination import PaginatedRepository
 from wellbeing_human_resources.domain.entities.wellbeing_human_resource import (
     WellbeingHumanResource,
 )
 
 
-class WellbeingHumanResourceRepository(ABC):
+class WellbeingHumanResourceRepository(PaginatedRepository[WellbeingHumanResource]):
     @abstractmethod
     def create(self, item: WellbeingHumanResource) -> WellbeingHumanResource:
         raise NotImplementedError
@@ -13,6 +13,12 @@ class WellbeingHumanResourceModel(models.Model):
 
     class Meta:
         db_table = "bienestar_recursos_humanos"
+        # Filtros del listado paginado + id al final: filtra y avanza por cursor con el índice
+        indexes = [
+            models.Index(fields=["year", "semester", "id"]),
+            models.Index(fields=["organization_unit_code", "id"]),
+            models.Index(fields=["activity_code", "id"]),
+        ]
         unique_together = (
             "year",
             "semester",
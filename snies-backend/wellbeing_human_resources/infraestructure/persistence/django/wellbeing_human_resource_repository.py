@@ -1,3 +1,7 @@
+from common.domain.pagination import Page, PageQuery
+from common.infraestructure.persistence.django.pagination import keyset_page
+from common.infraestructure.persistence.django.repository import DjangoRepositoryBase
+from stats.infraestructure.persistence.django.rollups import schedule_refresh
 from wellbeing_human_resources.domain.entities.wellbeing_human_resource import (
     WellbeingHumanResource,
 )
@@ -8,8 +12,14 @@ from wellbeing_human_resources.infraestructure.persistence.django.models import
     WellbeingHumanResourceModel,
 )
 
+ROLLUP_SOURCE = "wellbeing_human_resources"
+
+
+class WellbeingHumanResourceRepositoryDjango(
+    DjangoRepositoryBase[WellbeingHumanResourceModel], WellbeingHumanResourceRepository
+):
+    model = WellbeingHumanResourceModel
 
-class WellbeingHumanResourceRepositoryDjango(WellbeingHumanResourceRepository):
     def create(self, item: WellbeingHumanResource) -> WellbeingHumanResource:
         m = WellbeingHumanResourceModel.objects.create(
             year=item.year,
@@ -20,6 +30,7 @@ class WellbeingHumanResourceRepositoryDjango(WellbeingHumanResourceRepository):
             document_number=item.document_number,
             dedication=item.dedication,
         )
+        schedule_refresh(ROLLUP_SOURCE, (m.year, m.semester))
         return self._to_domain(m)
 
     def list(self, year: str | None = None, semester: int | None = None) -> list[WellbeingHumanResource]:
@@ -30,6 +41,9 @@ class WellbeingHumanResourceRepositoryDjango(WellbeingHumanResourceRepository):
             qs = qs.filter(semester=int(semester))
         return [self._to_domain(m) for m in qs]
 
+    def list_page(self, query: PageQuery) -> Page[WellbeingHumanResource]:
+        return keyset_page(WellbeingHumanResourceModel.objects.all(), query, self._to_domain)
+
     def get_by_id(self, item_id: int) -> WellbeingHumanResource | None:
         try:
             m = WellbeingHumanResourceModel.objects.get(id=item_id)
@@ -38,27 +52,30 @@ class WellbeingHumanResourceRepositoryDjango(WellbeingHumanResourceRepository):
             return None
 
     def update(self, item: WellbeingHumanResource) -> WellbeingHumanResource | None:
-        try:
-            m = WellbeingHumanResourceModel.objects.get(id=item.id)
-            m.year = item.year
-            m.semester = item.semester
-            m.activity_code = item.activity_code
-            m.organization_unit_code = item.organization_unit_code
-            m.document_type_id = item.document_type_id
-            m.document_number = item.document_number
-            m.dedication = item.dedication
-            m.save()
-            return self._to_domain(m)
-        except WellbeingHumanResourceModel.DoesNotExist:
+        m, previous_period = self._update_returning(
+            item.id,
+            {
+                "year": item.year,
+                "semester": item.semester,
+                "activity_code": item.activity_code,
+                "organization_unit_code": item.organization_unit_code,
+                "document_type_id": item.document_type_id,
+                "document_number": item.document_number,
+                "dedication": item.dedication,
+            },
+            previous=("year", "semester"),
+        )
+        if m is None:
             return None
+        schedule_refresh(ROLLUP_SOURCE, previous_period, (m.year, m.semester))
+        return self._to_domain(m)
 
     def delete(self, item_id: int) -> bool:
-        try:
-            m = WellbeingHumanResourceModel.objects.get(id=item_id)
-            m.delete()
-            return True
-        except WellbeingHumanResourceModel.DoesNotExist:
+        period = self._delete_returning(item_id, ("year", "semester"))
+        if period is None:
             return False
+        schedule_refresh(ROLLUP_SOURCE, period)
+        return True
 
     def _to_domain(self, m: WellbeingHumanResourceModel) -> WellbeingHumanResource:
         return WellbeingHumanResource(
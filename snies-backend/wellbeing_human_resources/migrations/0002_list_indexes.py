@@ -0,0 +1,31 @@
+# Generated by Django 4.2.15 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wellbeing_human_resources", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="wellbeinghumanresourcemodel",
+            index=models.Index(
+                fields=["year", "semester", "id"], name="bienestar_r_year_59cd05_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeinghumanresourcemodel",
+            index=models.Index(
+                fields=["organization_unit_code", "id"], name="bienestar_r_organiz_06ddb5_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wellbeinghumanresourcemodel",
+            index=models.Index(
+                fields=["activity_code", "id"], name="bienestar_r_activit_804d87_idx"
+            ),
+        ),
+    ]
@@ -2,6 +2,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 from audit.presentation.audited_api_view import AuditedAPIView
+from common.presentation.pagination import page_payload, parse_page_query, wants_page
 
 from wellbeing_human_resources.application.use_cases.create_wellbeing_human_resource import (
     CreateWellbeingHumanResourceUseCase,
@@ -15,6 +16,9 @@ from wellbeing_human_resources.application.use_cases.get_wellbeing_human_resourc
 from wellbeing_human_resources.application.use_cases.list_wellbeing_human_resources import (
     ListWellbeingHumanResourcesUseCase,
 )
+from wellbeing_human_resources.application.use_cases.list_wellbeing_human_resources_keyset import (
+    ListWellbeingHumanResourcesKeysetUseCase,
+)
 from wellbeing_human_resources.application.use_cases.update_wellbeing_human_resource import (
     UpdateWellbeingHumanResourceUseCase,
 )
@@ -59,43 +63,54 @@ class WellbeingHumanResourceCreateAPIView(AuditedAPIView):
         )
 
 
+def _item_to_dict(i) -> dict:
+    return {
+        "id": i.id,
+        "year": i.year,
+        "semester": i.semester,
+        "activity_code": i.activity_code,
+        "organization_unit_code": i.organization_unit_code,
+        "document_type_id": i.document_type_id,
+        "document_number": i.document_number,
+        "dedication": i.dedication,
+    }
+
+
 class WellbeingHumanResourceListAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
     required_module = "wellbeing"
     required_action = "view"
 
     def get(self, request):
-        year = request.query_params.get("year")
-        semester_raw = request.query_params.get("semester")
-        semester = None
-        if semester_raw is not None and semester_raw != "":
-            try:
-                semester = int(semester_raw)
-            except ValueError:
-                return Response(
-                    {"error": "semester must be an integer"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+        if wants_page(request.query_params):
+            return self._list_keyset(request)
 
         use_case = ListWellbeingHumanResourcesUseCase(
             repository=WellbeingHumanResourceRepositoryDjango()
         )
-        items = use_case.execute(year=year, semester=semester)
-        data = [
-            {
-                "id": i.id,
-                "year": i.year,
-                "semester": i.semester,
-                "activity_code": i.activity_code,
-                "organization_unit_code": i.organization_unit_code,
-                "document_type_id": i.document_type_id,
-                "document_number": i.document_number,
-                "dedication": i.dedication,
-            }
-            for i in items
-        ]
+        items = use_case.execute()
+        data = [_item_to_dict(i) for i in items]
         return Response(data, status=status.HTTP_200_OK)
 
+    def _list_keyset(self, request):
+        """
+        GET ...?cursor=&limit=100&count=exact|none&year=&semester=
+            &organization_unit_code=&activity_code=
+          -> {"count", "limit", "next_cursor", "results"}
+        next_cursor se envía como ?cursor= para la página siguiente (null = última).
+        Cualquiera de estos parámetros activa este modo; sin ninguno se devuelve la lista.
+        """
+        try:
+            query = parse_page_query(request.query_params)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = ListWellbeingHumanResourcesKeysetUseCase(
+            repository=WellbeingHumanResourceRepositoryDjango()
+        )
+        page = use_case.execute(query)
+        return Response(page_payload(page, query, _item_to_dict), status=status.HTTP_200_OK)
+
 
 class WellbeingHumanResourceDetailAPIView(AuditedAPIView):
     permission_classes = [IsAuthenticated, HasModulePermission]
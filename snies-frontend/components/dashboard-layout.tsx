@@ -44,22 +44,17 @@ export function DashboardLayout({ children }: DashboardLayoutProps) {
         filter: notifFilter,
         setFilter: setNotifFilter,
         refreshList: refreshNotifList,
-        refreshUnreadCount,
         loadMore,
+        hasMore: canLoadMore,
         markRead,
         markAllRead,
-        data: notifData,
     } = useNotifications({ pageSize: 20 });
 
     React.useEffect(() => {
         if (!notificationsOpen) return;
-        // refrescar al abrir
-        void refreshUnreadCount();
+        // refrescar la lista al abrir (el contador llega por el stream)
         void refreshNotifList({ silent: true, resetPage: true });
-    }, [notificationsOpen, refreshNotifList, refreshUnreadCount]);
-
-    const totalNotifPages = Math.max(1, Math.ceil(((notifData?.count ?? 0) / (notifData?.page_size ?? 20))));
-    const canLoadMore = (notifData?.page ?? 1) < totalNotifPages;
+    }, [notificationsOpen, refreshNotifList]);
 
     const formatTime = (iso: string | undefined) => {
         if (!iso) return "";
@@ -160,7 +155,6 @@ export function DashboardLayout({ children }: DashboardLayoutProps) {
                       onClick={async () => {
                         try {
                           const updated = await markAllRead();
-                          void refreshUnreadCount();
                           void refreshNotifList({ silent: true, resetPage: true });
                           if (updated > 0) {
                             // opcional
@@ -203,9 +197,12 @@ export function DashboardLayout({ children }: DashboardLayoutProps) {
                         <div className="flex items-start justify-between gap-3">
                           <div className={cn("text-sm leading-5 truncate", n.is_read ? "font-medium" : "font-semibold")}>
                             {getNotifTitle(n)}
+                            {(n.occurrences ?? 1) > 1 ? (
+                              <span className="ml-1 text-xs font-normal text-muted-foreground">×{n.occurrences}</span>
+                            ) : null}
                           </div>
                           <div className="text-[11px] text-muted-foreground whitespace-nowrap">
-                            {formatTime(n.created_at)}
+                            {formatTime(n.last_seen_at ?? n.created_at)}
                           </div>
                         </div>
                         {getNotifDesc(n) ? (
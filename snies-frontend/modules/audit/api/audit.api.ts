@@ -3,8 +3,9 @@ import { getToken } from "@/shared/utils/storage";
 import type { PaginatedAuditLogs } from "@/modules/audit/types/audit-log";
 
 export type AuditLogsFilters = {
-  page: number;
+  cursor: string; // "" = primera página; luego next_cursor de la respuesta
   page_size: number;
+  count?: "estimated" | "exact" | "none";
   action?: string;
   module?: string;
   user_email?: string;
@@ -17,8 +18,9 @@ export async function listAuditLogs(filters: AuditLogsFilters): Promise<Paginate
   if (!token) throw new Error("No hay token de autenticación");
 
   const qs = new URLSearchParams();
-  qs.set("page", String(filters.page));
+  qs.set("cursor", filters.cursor);
   qs.set("page_size", String(filters.page_size));
+  if (filters.count) qs.set("count", filters.count);
   if (filters.action) qs.set("action", filters.action);
   if (filters.module) qs.set("module", filters.module);
   if (filters.user_email) qs.set("user_email", filters.user_email);
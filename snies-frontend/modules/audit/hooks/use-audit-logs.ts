@@ -12,7 +12,7 @@ export type AuditUiFilters = {
   to: string;
 };
 
-export function useAuditLogs(initial?: Partial<AuditLogsFilters>) {
+export function useAuditLogs(initial?: Partial<AuditLogsFilters> & { page?: number }) {
   const [page, setPage] = useState(initial?.page ?? 1);
   const [pageSize, setPageSize] = useState(initial?.page_size ?? 50);
   const [filters, setFilters] = useState<AuditUiFilters>({
@@ -26,10 +26,15 @@ export function useAuditLogs(initial?: Partial<AuditLogsFilters>) {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const reqId = useRef(0);
+  // cursors[n] abre la página n + 1; se reinicia cuando cambian filtros o tamaño de página
+  const cursors = useRef<{ key: string; list: string[] }>({ key: "", list: [""] });
+
+  const filtersKey = JSON.stringify([pageSize, filters]);
+  if (cursors.current.key !== filtersKey) cursors.current = { key: filtersKey, list: [""] };
 
   const query: AuditLogsFilters = useMemo(() => {
     const q: AuditLogsFilters = {
-      page,
+      cursor: cursors.current.list[page - 1] ?? "",
       page_size: pageSize,
     };
     if (filters.action.trim() && filters.action !== "all") q.action = filters.action.trim();
@@ -47,6 +52,7 @@ export function useAuditLogs(initial?: Partial<AuditLogsFilters>) {
     try {
       const res = await listAuditLogs(query);
       if (id !== reqId.current) return;
+      if (res.next_cursor) cursors.current.list[page] = res.next_cursor;
       setData(res);
     } catch (e) {
       if (id !== reqId.current) return;
@@ -63,7 +69,7 @@ export function useAuditLogs(initial?: Partial<AuditLogsFilters>) {
     }, 250);
     return () => clearTimeout(t);
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [query.page, query.page_size, query.action, query.module, query.user_email, query.from, query.to]);
+  }, [query.cursor, query.page_size, query.action, query.module, query.user_email, query.from, query.to]);
 
   useEffect(() => {
     // initial load
@@ -79,6 +85,7 @@ export function useAuditLogs(initial?: Partial<AuditLogsFilters>) {
     filters,
     setFilters,
     data,
+    hasNextPage: Boolean(data?.next_cursor),
     loading,
     error,
     refetch: fetchLogs,
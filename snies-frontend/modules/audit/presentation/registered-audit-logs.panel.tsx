@@ -63,7 +63,7 @@ function safeJsonStringify(value: unknown) {
 }
 
 export function RegisteredAuditLogsPanel() {
-  const { page, setPage, pageSize, setPageSize, filters, setFilters, data, loading, error, refetch } = useAuditLogs({
+  const { page, setPage, pageSize, setPageSize, filters, setFilters, data, hasNextPage, loading, error, refetch } = useAuditLogs({
     page: 1,
     page_size: 50,
   });
@@ -73,7 +73,8 @@ export function RegisteredAuditLogsPanel() {
 
   const results = data?.results ?? [];
   const count = data?.count ?? 0;
-  const totalPages = Math.max(1, Math.ceil(count / pageSize));
+  const approx = data?.count_estimated ? "~" : "";
+  const totalPages = Math.max(page, Math.ceil(count / pageSize));
 
   const filtered = useMemo(() => {
     const q = search.trim().toLowerCase();
@@ -119,7 +120,7 @@ export function RegisteredAuditLogsPanel() {
                     <div className="flex flex-wrap items-baseline gap-2">
                       <h1 className="text-xl md:text-2xl font-bold tracking-tight text-foreground">Auditorías</h1>
                       <span className="inline-flex items-center rounded-full border border-border bg-muted/20 px-2.5 py-1 text-xs text-muted-foreground">
-                        {loading ? "—" : `${count.toLocaleString("es-CO")} eventos`}
+                        {loading ? "—" : `${approx}${count.toLocaleString("es-CO")} eventos`}
                       </span>
                     </div>
                     <p className="mt-1 text-sm text-muted-foreground">
@@ -307,7 +308,7 @@ export function RegisteredAuditLogsPanel() {
 
             <div className="flex items-center justify-between pt-2">
               <div className="text-xs text-muted-foreground">
-                Página {page} de {totalPages}
+                Página {page} de {approx}{totalPages}
               </div>
               <div className="flex items-center gap-2">
                 <Button
@@ -324,8 +325,8 @@ export function RegisteredAuditLogsPanel() {
                   variant="outline"
                   size="sm"
                   className="rounded-full gap-2"
-                  onClick={() => setPage(Math.min(totalPages, page + 1))}
-                  disabled={page >= totalPages || loading}
+                  onClick={() => setPage(page + 1)}
+                  disabled={!hasNextPage || loading}
                 >
                   Siguiente
                   <ChevronRight className="h-4 w-4" />
@@ -20,9 +20,10 @@ export type AuditLog = {
 };
 
 export type PaginatedAuditLogs = {
-  count: number;
-  page: number;
+  count: number | null;
+  count_estimated: boolean;
   page_size: number;
+  next_cursor: string | null;
   results: AuditLog[];
 };
 
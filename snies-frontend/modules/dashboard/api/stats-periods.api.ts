@@ -0,0 +1,28 @@
+import { requireApiUrl } from "@/shared/config/api";
+import { getToken } from "@/shared/utils/storage";
+
+export type StatsPeriodsResponse = {
+  years: string[];
+  semesters: number[];
+  periods: { year: string; semester: number; sources: string[] }[];
+};
+
+export async function getStatsPeriods(params?: { source?: string }): Promise<StatsPeriodsResponse> {
+  const token = getToken();
+  if (!token) throw new Error("No hay token de autenticación");
+
+  const qs = new URLSearchParams();
+  if (params?.source) qs.set("source", params.source);
+  const suffix = qs.toString() ? `?${qs.toString()}` : "";
+
+  const res = await fetch(`${requireApiUrl()}/api/stats/periods/${suffix}`, {
+    headers: {
+      Authorization: `Bearer ${token}`,
+    },
+  });
+
+  if (res.status === 401) throw new Error("No autenticado");
+  if (!res.ok) throw new Error("No se pudieron cargar los periodos disponibles");
+
+  return await res.json();
+}
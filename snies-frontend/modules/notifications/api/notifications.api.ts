@@ -1,18 +1,20 @@
 import { requireApiUrl } from "@/shared/config/api";
 import { getToken } from "@/shared/utils/storage";
-import type { PaginatedNotifications } from "@/modules/notifications/types/notification";
+import type { NotificationsPage } from "@/modules/notifications/types/notification";
 
 export async function listNotifications(params: {
-  page: number;
-  page_size: number;
+  cursor?: string | null;
+  limit: number;
   is_read?: boolean;
-}): Promise<PaginatedNotifications> {
+}): Promise<NotificationsPage> {
   const token = getToken();
   if (!token) throw new Error("No hay token de autenticación");
 
   const qs = new URLSearchParams();
-  qs.set("page", String(params.page));
-  qs.set("page_size", String(params.page_size));
+  qs.set("cursor", params.cursor ?? "");
+  qs.set("limit", String(params.limit));
+  // el total no se muestra: se evita el COUNT
+  qs.set("count", "none");
   if (typeof params.is_read === "boolean") qs.set("is_read", String(params.is_read));
 
   const res = await fetch(`${requireApiUrl()}/api/notifications/?${qs.toString()}`, {
@@ -40,6 +42,77 @@ export async function getUnreadCount(): Promise<number> {
   return Number(data?.unread_count ?? 0);
 }
 
+export type NotificationStreamEvent = {
+  event: string;
+  data: Record<string, unknown>;
+};
+
+/** El servidor ya tiene el máximo de streams abiertos (503): hacer polling hasta retryAfterMs. */
+export class NotificationStreamBusyError extends Error {
+  readonly retryAfterMs: number;
+
+  constructor(retryAfterMs: number) {
+    super("Stream de notificaciones ocupado");
+    this.retryAfterMs = retryAfterMs;
+  }
+}
+
+/**
+ * Abre el stream SSE de notificaciones y llama a onEvent por cada evento hasta que el
+ * servidor lo cierra (termina normalmente) o se aborta. Usa fetch en vez de EventSource
+ * porque EventSource no permite enviar el header Authorization.
+ */
+export async function streamNotificationEvents(
+  onEvent: (e: NotificationStreamEvent) => void,
+  signal: AbortSignal,
+): Promise<void> {
+  const token = getToken();
+  if (!token) throw new Error("No hay token de autenticación");
+
+  const res = await fetch(`${requireApiUrl()}/api/notifications/stream/`, {
+    headers: { Authorization: `Bearer ${token}`, Accept: "text/event-stream" },
+    cache: "no-store",
+    signal,
+  });
+
+  if (res.status === 401) throw new Error("No autenticado");
+  if (res.status === 503) {
+    const retryAfter = Number(res.headers.get("Retry-After"));
+    throw new NotificationStreamBusyError((Number.isFinite(retryAfter) && retryAfter > 0 ? retryAfter : 30) * 1000);
+  }
+  if (!res.ok || !res.body) throw new Error("No se pudo abrir el stream de notificaciones");
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += decoder.decode(value, { stream: true });
+
+    let sep = buffer.indexOf("\n\n");
+    while (sep !== -1) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      sep = buffer.indexOf("\n\n");
+
+      let event = "message";
+      const dataLines: string[] = [];
+      for (const line of block.split("\n")) {
+        if (line.startsWith("event:")) event = line.slice(6).trim();
+        else if (line.startsWith("data:")) dataLines.push(line.slice(5).trim());
+        // ": ping" (heartbeat) y "retry:" se ignoran
+      }
+      if (!dataLines.length) continue;
+      try {
+        onEvent({ event, data: JSON.parse(dataLines.join("\n")) });
+      } catch {
+        // evento mal formado: se descarta
+      }
+    }
+  }
+}
+
 export async function markNotificationRead(id: number): Promise<void> {
   const token = getToken();
   if (!token) throw new Error("No hay token de autenticación");
@@ -1,21 +1,35 @@
 "use client";
 
 import { useCallback, useEffect, useMemo, useRef, useState } from "react";
-import type { Notification, PaginatedNotifications } from "@/modules/notifications/types/notification";
-import { getUnreadCount, listNotifications, markAllNotificationsRead, markNotificationRead } from "@/modules/notifications/api/notifications.api";
+import type { Notification, NotificationsPage } from "@/modules/notifications/types/notification";
+import {
+  getUnreadCount,
+  listNotifications,
+  markAllNotificationsRead,
+  markNotificationRead,
+  NotificationStreamBusyError,
+  streamNotificationEvents,
+  type NotificationStreamEvent,
+} from "@/modules/notifications/api/notifications.api";
 
 export type NotificationsFilter = "all" | "unread" | "read";
 
+const STREAM_RETRY_MS = 1000;
+const STREAM_MAX_RETRY_MS = 30000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 export function useNotifications(opts?: { pageSize?: number }) {
   const pageSize = opts?.pageSize ?? 20;
   const [filter, setFilter] = useState<NotificationsFilter>("all");
-  const [page, setPage] = useState(1);
-  const [data, setData] = useState<PaginatedNotifications | null>(null);
+  const [data, setData] = useState<NotificationsPage | null>(null);
   const [loadingList, setLoadingList] = useState(true);
   const [loadingCount, setLoadingCount] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [unreadCount, setUnreadCount] = useState(0);
   const reqId = useRef(0);
+  // ids marcados como leídos desde esta pestaña: su evento "read" ya está descontado
+  const locallyRead = useRef(new Set<number>());
 
   const isReadParam = useMemo(() => {
     if (filter === "unread") return false;
@@ -35,15 +49,14 @@ export function useNotifications(opts?: { pageSize?: number }) {
     }
   }, []);
 
+  // Siempre vuelve a la primera página (resetPage se mantiene por compatibilidad)
   const refreshList = useCallback(async (params?: { silent?: boolean; resetPage?: boolean }) => {
     const id = ++reqId.current;
     try {
-      if (params?.resetPage) setPage(1);
       if (!params?.silent) setLoadingList(true);
       setError(null);
 
-      const pageToLoad = params?.resetPage ? 1 : page;
-      const res = await listNotifications({ page: pageToLoad, page_size: pageSize, is_read: isReadParam });
+      const res = await listNotifications({ limit: pageSize, is_read: isReadParam });
       if (id !== reqId.current) return;
       setData(res);
     } catch (e) {
@@ -53,25 +66,20 @@ export function useNotifications(opts?: { pageSize?: number }) {
     } finally {
       if (id === reqId.current) setLoadingList(false);
     }
-  }, [isReadParam, page, pageSize]);
+  }, [isReadParam, pageSize]);
 
   const loadMore = useCallback(async () => {
-    if (!data) return;
-    const nextPage = data.page + 1;
-    const totalPages = Math.max(1, Math.ceil((data.count ?? 0) / (data.page_size ?? pageSize)));
-    if (nextPage > totalPages) return;
+    if (!data?.next_cursor) return;
 
     const id = ++reqId.current;
     try {
       setLoadingList(true);
-      const res = await listNotifications({ page: nextPage, page_size: pageSize, is_read: isReadParam });
+      const res = await listNotifications({ cursor: data.next_cursor, limit: pageSize, is_read: isReadParam });
       if (id !== reqId.current) return;
       setData({
         ...res,
         results: [...(data.results ?? []), ...(res.results ?? [])],
-        page: nextPage,
       });
-      setPage(nextPage);
     } catch (e) {
       if (id !== reqId.current) return;
       setError(e instanceof Error ? e.message : "Error");
@@ -81,7 +89,13 @@ export function useNotifications(opts?: { pageSize?: number }) {
   }, [data, isReadParam, pageSize]);
 
   const markRead = useCallback(async (id: number) => {
-    await markNotificationRead(id);
+    locallyRead.current.add(id);
+    try {
+      await markNotificationRead(id);
+    } catch (e) {
+      locallyRead.current.delete(id);
+      throw e;
+    }
     setData((prev) => {
       if (!prev) return prev;
       return {
@@ -102,23 +116,101 @@ export function useNotifications(opts?: { pageSize?: number }) {
     return updated;
   }, []);
 
+  const handleStreamEvent = useCallback(
+    ({ event, data }: NotificationStreamEvent) => {
+      if (event === "unread_count") {
+        setUnreadCount(Number(data.unread_count ?? 0));
+        setLoadingCount(false);
+      } else if (event === "notification") {
+        setUnreadCount((c) => c + Number(data.unread_delta ?? 1));
+        const n = data.notification as Notification | undefined;
+        // Mensajes muy largos llegan sin el cuerpo: se verán al recargar la lista
+        if (!n || filter === "read") return;
+        setData((prev) => {
+          if (!prev) return prev;
+          // Una notificación agrupada vuelve con el mismo id: se reemplaza y sube al inicio
+          const rest = prev.results.filter((x) => x.id !== n.id);
+          const added = rest.length === prev.results.length ? 1 : 0;
+          const count = prev.count === null ? null : prev.count + added;
+          return { ...prev, count, results: [n, ...rest] };
+        });
+      } else if (event === "read") {
+        const id = Number(data.id);
+        if (!locallyRead.current.delete(id)) {
+          setUnreadCount((c) => Math.max(0, c + Number(data.unread_delta ?? -1)));
+        }
+        setData((prev) => {
+          if (!prev) return prev;
+          return {
+            ...prev,
+            results: prev.results.map((n) => (n.id === id ? { ...n, is_read: true } : n)),
+          };
+        });
+      } else if (event === "read_all") {
+        locallyRead.current.clear();
+        setUnreadCount(0);
+        setData((prev) => {
+          if (!prev) return prev;
+          return { ...prev, results: prev.results.map((n) => ({ ...n, is_read: true })) };
+        });
+      } else if (event === "resync") {
+        void refreshUnreadCount();
+        void refreshList({ silent: true });
+      }
+    },
+    [filter, refreshList, refreshUnreadCount],
+  );
+
+  const streamHandler = useRef(handleStreamEvent);
+  useEffect(() => {
+    streamHandler.current = handleStreamEvent;
+  }, [handleStreamEvent]);
+
   // Initial load
   useEffect(() => {
-    refreshUnreadCount();
     refreshList();
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, []);
 
-  // When filter changes: reset to page 1 and refetch
+  // Contador en vivo por SSE (reemplaza el polling de unread-count). Cada conexión
+  // empieza con el contador actual; el servidor la cierra periódicamente y se reabre.
+  // Si el servidor responde 503 (tope de streams) se vuelve al polling mientras tanto.
+  useEffect(() => {
+    const controller = new AbortController();
+    let failures = 0;
+
+    (async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await streamNotificationEvents((e) => streamHandler.current(e), controller.signal);
+          failures = 0;
+        } catch (e) {
+          if (controller.signal.aborted) return;
+          if (e instanceof NotificationStreamBusyError) {
+            // servidor al tope de streams: polling del contador hasta volver a intentar
+            void refreshUnreadCount();
+            await sleep(e.retryAfterMs);
+            continue;
+          }
+          failures += 1;
+          // sin stream (proxy, token): al menos mantener el contador al día
+          if (failures === 1) void refreshUnreadCount();
+        }
+        await sleep(Math.min(STREAM_MAX_RETRY_MS, STREAM_RETRY_MS * 2 ** failures));
+      }
+    })();
+
+    return () => controller.abort();
+  }, [refreshUnreadCount]);
+
+  // When filter changes: back to the first page
   useEffect(() => {
-    setPage(1);
-    refreshList({ resetPage: true, silent: true });
+    refreshList({ silent: true });
   }, [filter, refreshList]);
 
   return {
     filter,
     setFilter,
-    page,
     pageSize,
     data,
     notifications: (data?.results ?? []) as Notification[],
@@ -127,6 +219,7 @@ export function useNotifications(opts?: { pageSize?: number }) {
     error,
     unreadCount,
     hasUnread: unreadCount > 0,
+    hasMore: Boolean(data?.next_cursor),
     refreshUnreadCount,
     refreshList,
     loadMore,
@@ -7,13 +7,17 @@ export type Notification = {
   message?: string | null;
   type?: NotificationType | null;
   is_read: boolean;
+  // notificaciones agrupadas: cuántas se fusionaron y cuándo llegó la última
+  occurrences?: number;
+  last_seen_at?: string | null;
   data?: unknown;
 };
 
-export type PaginatedNotifications = {
-  count: number;
-  page: number;
-  page_size: number;
+// Listado por cursor: next_cursor se envía como ?cursor= para la página siguiente (null = última)
+export type NotificationsPage = {
+  count: number | null;
+  limit: number;
+  next_cursor: string | null;
   results: Notification[];
 };
 
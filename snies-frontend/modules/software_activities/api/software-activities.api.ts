@@ -2,7 +2,10 @@ import { requireApiUrl } from "@/shared/config/api";
 import { getToken } from "@/shared/utils/storage";
 import type {
   CreateSoftwareActivityInput,
+  ImportJobErrorsPage,
   ImportSoftwareActivitiesResult,
+  SoftwareActivitiesExportJob,
+  SoftwareActivitiesImportJob,
   SoftwareActivity,
 } from "@/modules/software_activities/types/software-activity";
 
@@ -78,11 +81,75 @@ export async function importSoftwareActivitiesExcel(file: File): Promise<ImportS
   return await res.json();
 }
 
+export async function submitSoftwareActivitiesImportJob(
+  file: File
+): Promise<SoftwareActivitiesImportJob> {
+  const fd = new FormData();
+  fd.set("file", file);
+
+  const res = await fetch(`${requireApiUrl()}/api/software_activities/import/jobs/`, {
+    method: "POST",
+    headers: authHeaders(),
+    body: fd,
+  });
+
+  if (!res.ok) {
+    let msg = "No se pudo encolar la importación";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.json();
+}
+
+export async function getSoftwareActivitiesImportJob(
+  jobId: number
+): Promise<SoftwareActivitiesImportJob> {
+  const res = await fetch(`${requireApiUrl()}/api/software_activities/import/jobs/${jobId}/`, {
+    method: "GET",
+    headers: authHeaders(),
+  });
+  if (!res.ok) {
+    let msg = "No se pudo consultar la importación";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.json();
+}
+
+export async function listImportJobErrors(
+  jobId: number,
+  params?: { limit?: number; offset?: number }
+): Promise<ImportJobErrorsPage> {
+  const limit = params?.limit ?? 100;
+  const offset = params?.offset ?? 0;
+  const res = await fetch(
+    `${requireApiUrl()}/api/software_activities/import/jobs/${jobId}/errors/?limit=${limit}&offset=${offset}`,
+    { method: "GET", headers: authHeaders() }
+  );
+  if (!res.ok) {
+    let msg = "No se pudieron cargar los errores de la importación";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.json();
+}
+
 export async function exportSoftwareActivitiesExcel(): Promise<Blob> {
   const res = await fetch(`${requireApiUrl()}/api/software_activities/export/`, {
     method: "GET",
     headers: authHeaders(),
   });
+  // 202: no hay un Excel vigente y se está generando (seguir con getSoftwareActivitiesExportJob)
+  if (res.status === 202) throw new Error("El Excel se está generando, intenta de nuevo en unos segundos");
   if (!res.ok) {
     let msg = "No se pudo exportar el Excel";
     try {
@@ -94,3 +161,53 @@ export async function exportSoftwareActivitiesExcel(): Promise<Blob> {
   return await res.blob();
 }
 
+
+export async function requestSoftwareActivitiesExportJob(): Promise<SoftwareActivitiesExportJob> {
+  const res = await fetch(`${requireApiUrl()}/api/software_activities/export/jobs/`, {
+    method: "POST",
+    headers: authHeaders(),
+  });
+  if (!res.ok) {
+    let msg = "No se pudo solicitar la exportación";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.json();
+}
+
+export async function getSoftwareActivitiesExportJob(
+  jobId: number
+): Promise<SoftwareActivitiesExportJob> {
+  const res = await fetch(`${requireApiUrl()}/api/software_activities/export/jobs/${jobId}/`, {
+    method: "GET",
+    headers: authHeaders(),
+  });
+  if (!res.ok) {
+    let msg = "No se pudo consultar la exportación";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.json();
+}
+
+export async function downloadSoftwareActivitiesExport(jobId: number): Promise<Blob> {
+  const res = await fetch(
+    `${requireApiUrl()}/api/software_activities/export/jobs/${jobId}/download/`,
+    { method: "GET", headers: authHeaders() }
+  );
+  if (!res.ok) {
+    let msg = "No se pudo descargar el Excel";
+    try {
+      const err = await res.json();
+      msg = err.detail || err.message || msg;
+    } catch {}
+    throw new Error(msg);
+  }
+  return await res.blob();
+}
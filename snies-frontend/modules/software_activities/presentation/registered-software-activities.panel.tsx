@@ -21,11 +21,24 @@ import { EmptyState } from "@/components/empty-state";
 
 import {
   createSoftwareActivity,
-  importSoftwareActivitiesExcel,
+  downloadSoftwareActivitiesExport,
+  getSoftwareActivitiesExportJob,
+  getSoftwareActivitiesImportJob,
+  listImportJobErrors,
   listSoftwareActivities,
-  exportSoftwareActivitiesExcel,
+  requestSoftwareActivitiesExportJob,
+  submitSoftwareActivitiesImportJob,
 } from "@/modules/software_activities/api/software-activities.api";
-import type { CreateSoftwareActivityInput, SoftwareActivity } from "@/modules/software_activities/types/software-activity";
+import type {
+  CreateSoftwareActivityInput,
+  ImportJobRowError,
+  SoftwareActivitiesImportJob,
+  SoftwareActivity,
+} from "@/modules/software_activities/types/software-activity";
+
+const JOB_POLL_MS = 1500;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
 import { SoftwareActivityForm } from "@/modules/software_activities/presentation/components/software-activity-form";
 import { SoftwareActivityDetail } from "@/modules/software_activities/presentation/components/software-activity-detail";
 
@@ -44,9 +57,19 @@ export function RegisteredSoftwareActivitiesPanel() {
 
   const [importing, setImporting] = useState(false);
   const [importFile, setImportFile] = useState<File | null>(null);
+  const [importJob, setImportJob] = useState<SoftwareActivitiesImportJob | null>(null);
+  const [importErrors, setImportErrors] = useState<ImportJobRowError[]>([]);
   const [exporting, setExporting] = useState(false);
 
   const reqId = useRef(0);
+  const mounted = useRef(true);
+
+  useEffect(() => {
+    mounted.current = true;
+    return () => {
+      mounted.current = false;
+    };
+  }, []);
 
   const load = async () => {
     const r = ++reqId.current;
@@ -106,27 +129,61 @@ export function RegisteredSoftwareActivitiesPanel() {
       return;
     }
     setImporting(true);
+    setImportErrors([]);
     try {
-      const res = await importSoftwareActivitiesExcel(importFile);
+      // El servidor encola el archivo (202) y un worker lo procesa; se consulta el avance
+      let job = await submitSoftwareActivitiesImportJob(importFile);
+      setImportJob(job);
+      while (job.status === "pending" || job.status === "running") {
+        await sleep(JOB_POLL_MS);
+        if (!mounted.current) return;
+        job = await getSoftwareActivitiesImportJob(job.id);
+        setImportJob(job);
+      }
+      if (job.errors_count > 0) {
+        const page = await listImportJobErrors(job.id, { limit: 50 });
+        setImportErrors(page.results);
+      }
+      if (job.status === "failed") {
+        throw new Error(job.error || "La importación falló");
+      }
+      if (job.duplicate_file) {
+        toast.info("Archivo ya importado", {
+          description: "Este archivo ya se había cargado; no se realizaron cambios.",
+        });
+        setImportFile(null);
+        return;
+      }
       toast.success("Importación completa", {
-        description: `Creadas: ${res.created} · Filas vacías omitidas: ${res.skipped_empty_rows}`,
+        description: `Creadas: ${job.rows_inserted} · Actualizadas: ${job.rows_updated} · Sin cambios: ${job.rows_unchanged} · Errores: ${job.errors_count}`,
       });
       setImportFile(null);
-      setTab("activities");
+      if (job.errors_count === 0) setTab("activities");
       await load();
     } catch (e) {
       toast.error("No se pudo importar", {
         description: e instanceof Error ? e.message : "Error",
       });
     } finally {
-      setImporting(false);
+      if (mounted.current) setImporting(false);
     }
   };
 
   const handleExport = async () => {
     setExporting(true);
     try {
-      const blob = await exportSoftwareActivitiesExcel();
+      // El servidor reutiliza el último archivo si los datos no cambiaron; si no, un
+      // worker lo genera y se consulta el estado hasta que esté listo
+      let job = await requestSoftwareActivitiesExportJob();
+      while (job.status === "pending" || job.status === "running") {
+        await sleep(JOB_POLL_MS);
+        if (!mounted.current) return;
+        job = await getSoftwareActivitiesExportJob(job.id);
+      }
+      if (!job.ready) {
+        throw new Error(job.error || "La exportación falló");
+      }
+      const blob = await downloadSoftwareActivitiesExport(job.id);
       const url = URL.createObjectURL(blob);
       const a = document.createElement("a");
       a.href = url;
@@ -141,7 +198,7 @@ export function RegisteredSoftwareActivitiesPanel() {
         description: e instanceof Error ? e.message : "Error",
       });
     } finally {
-      setExporting(false);
+      if (mounted.current) setExporting(false);
     }
   };
 
@@ -363,6 +420,46 @@ export function RegisteredSoftwareActivitiesPanel() {
                       ) : null}
                     </div>
 
+                    {importJob ? (
+                      <div className="rounded-2xl border border-border bg-muted/10 p-4 space-y-2">
+                        <div className="flex items-center justify-between text-sm">
+                          <span className="font-semibold">{importJob.file_name}</span>
+                          <span className="text-xs text-muted-foreground">
+                            {importJob.status === "pending"
+                              ? "En cola"
+                              : importJob.status === "running"
+                                ? "Procesando"
+                                : importJob.status === "succeeded"
+                                  ? "Completada"
+                                  : "Fallida"}
+                          </span>
+                        </div>
+                        <div className="h-2 w-full overflow-hidden rounded-full bg-muted">
+                          <div
+                            className="h-full bg-primary transition-all"
+                            style={{
+                              width: `${importJob.status === "succeeded" ? 100 : importJob.progress ?? 0}%`,
+                            }}
+                          />
+                        </div>
+                        <div className="text-xs text-muted-foreground">
+                          Filas leídas: {importJob.rows_parsed}
+                          {importJob.rows_total ? ` de ${importJob.rows_total}` : ""} · Creadas:{" "}
+                          {importJob.rows_inserted} · Actualizadas: {importJob.rows_updated} · Errores:{" "}
+                          {importJob.errors_count}
+                        </div>
+                        {importErrors.length > 0 ? (
+                          <ul className="max-h-48 overflow-y-auto text-xs text-destructive space-y-1">
+                            {importErrors.map((err) => (
+                              <li key={`${err.row}-${err.message}`}>
+                                Fila {err.row}: {err.message}
+                              </li>
+                            ))}
+                          </ul>
+                        ) : null}
+                      </div>
+                    ) : null}
+
                     <div className="flex items-center justify-end gap-2">
                       <Button
                         variant="outline"
@@ -84,6 +84,55 @@ export type CreateSoftwareActivityInput = {
 
 export type ImportSoftwareActivitiesResult = {
   created: number;
+  updated: number;
+  unchanged: number;
   skipped_empty_rows: number;
+  duplicate_file: boolean;
 };
 
+
+export type ImportJobStatus = "pending" | "running" | "succeeded" | "failed";
+
+export type SoftwareActivitiesImportJob = {
+  id: number;
+  status: ImportJobStatus;
+  file_name: string;
+  rows_total: number | null;
+  rows_parsed: number;
+  rows_inserted: number;
+  rows_skipped: number;
+  rows_updated: number;
+  rows_unchanged: number;
+  errors_count: number;
+  duplicate_file: boolean;
+  progress: number | null;
+  error: string | null;
+  created_at: string | null;
+  started_at: string | null;
+  finished_at: string | null;
+};
+
+export type SoftwareActivitiesExportJob = {
+  id: number;
+  status: ImportJobStatus;
+  ready: boolean;
+  file_name: string;
+  size: number | null;
+  download_url: string | null;
+  error: string | null;
+  created_at: string | null;
+  started_at: string | null;
+  finished_at: string | null;
+};
+
+export type ImportJobRowError = {
+  row: number;
+  message: string;
+};
+
+export type ImportJobErrorsPage = {
+  count: number;
+  limit: number;
+  offset: number;
+  results: ImportJobRowError[];
+};
@@ -37,18 +37,6 @@ export class WellbeingActivityApi extends BaseApi implements WellbeingActivityRe
         return await res.json();
     }
     async list(): Promise<WellbeingActivity[]> {
-        const token = this.getToken();
-        const res = await fetch(`${requireApiUrl()}/api/wellbeing_activities/list/`, {
-            headers: {
-                Authorization: `Bearer ${token}`,
-            },
-        });
-        if (res.status === 401)
-            throw new Error("No autenticado");
-        if (res.status === 403)
-            throw new Error("No autorizado");
-        if (!res.ok)
-            throw new Error("No se pudieron cargar actividades de bienestar");
-        return await res.json();
+        return this.listAllPages<WellbeingActivity>("/api/wellbeing_activities/list/", "No se pudieron cargar actividades de bienestar");
     }
 }
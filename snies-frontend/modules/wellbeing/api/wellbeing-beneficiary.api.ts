@@ -49,19 +49,7 @@ export class WellbeingBenefeciaryApi extends BaseApi implements WellbeingBenefec
         return data as WellbeingBenefeciary;
     }
     async list(): Promise<WellbeingBenefeciary[]> {
-        const token = this.getToken();
-        const res = await fetch(`${requireApiUrl()}/api/wellbeing_beneficiaries/list/`, {
-            headers: {
-                Authorization: `Bearer ${token}`,
-            },
-        });
-        if (res.status === 401)
-            throw new Error("No autenticado");
-        if (res.status === 403)
-            throw new Error("No autorizado");
-        if (!res.ok)
-            throw new Error("No se pudieron cargar beneficiarios");
-        return await res.json();
+        return this.listAllPages<WellbeingBenefeciary>("/api/wellbeing_beneficiaries/list/", "No se pudieron cargar beneficiarios");
     }
     async update(id: string, input: Partial<CreateWellbeingBeneficiaryInput>): Promise<WellbeingBenefeciary> {
         const token = this.getToken();
@@ -42,21 +42,14 @@ export class WellbeingHumanResourceApi extends BaseApi implements WellbeingHuman
   }
 
   async list(params?: { year?: string; semester?: number }): Promise<WellbeingHumanResource[]> {
-    const token = this.getToken();
-    const qs = new URLSearchParams();
-    if (params?.year) qs.set("year", params.year);
-    if (typeof params?.semester === "number") qs.set("semester", String(params.semester));
-    const suffix = qs.toString() ? `?${qs.toString()}` : "";
-
-    const res = await fetch(`${requireApiUrl()}/api/wellbeing_human_resources/list/${suffix}`, {
-      headers: { Authorization: `Bearer ${token}` },
-    });
-
-    if (res.status === 401) throw new Error("No autenticado");
-    if (res.status === 403) throw new Error("No autorizado");
-    if (!res.ok) throw new Error("No se pudieron cargar recursos humanos");
-
-    return await res.json();
+    const filters: Record<string, string> = {};
+    if (params?.year) filters.year = params.year;
+    if (typeof params?.semester === "number") filters.semester = String(params.semester);
+    return this.listAllPages<WellbeingHumanResource>(
+      "/api/wellbeing_human_resources/list/",
+      "No se pudieron cargar recursos humanos",
+      filters,
+    );
   }
 }
 
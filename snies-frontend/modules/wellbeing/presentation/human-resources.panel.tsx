@@ -12,6 +12,7 @@ import { Plus, Search, Users2 } from "lucide-react";
 import { toast } from "sonner";
 import { ApiValidationError, formatValidationDetails } from "@/shared/api/api-errors";
 import { WellbeingHumanResourceApi } from "@/modules/wellbeing/api/wellbeing-human-resource.api";
+import { getStatsPeriods } from "@/modules/dashboard/api/stats-periods.api";
 import { useWellbeingHumanResources } from "@/modules/wellbeing/hooks/use-cases/use-wellbeing-human-resources";
 import { WellbeingHumanResourceForm } from "@/modules/wellbeing/presentation/components/wellbeing-human-resource-form";
 import type { CreateWellbeingHumanResourceInput } from "@/modules/wellbeing/hooks/types/create-human-resource-input";
@@ -20,7 +21,17 @@ const repository = new WellbeingHumanResourceApi();
 
 export function RegisteredWellbeingHumanResourcesPanel() {
   const currentYear = String(new Date().getFullYear());
-  const yearOptions = useMemo(() => Array.from({ length: 7 }, (_, i) => String(Number(currentYear) - i)), [currentYear]);
+  const [periodYears, setPeriodYears] = useState<string[]>([]);
+  const yearOptions = useMemo(
+    () => (periodYears.length ? [...periodYears].reverse() : Array.from({ length: 7 }, (_, i) => String(Number(currentYear) - i))),
+    [periodYears, currentYear]
+  );
+
+  useEffect(() => {
+    getStatsPeriods({ source: "wellbeing_human_resources" })
+      .then((r) => setPeriodYears(r.years))
+      .catch(() => setPeriodYears([]));
+  }, []);
 
   const [search, setSearch] = useState("");
   const [year, setYear] = useState<string>("all");
@@ -1,3 +1,15 @@
+import { requireApiUrl } from "@/shared/config/api";
+
+export type CursorPage<T> = {
+    count: number | null;
+    limit: number;
+    next_cursor: string | null;
+    results: T[];
+};
+
+// Tamaño máximo de página que acepta el backend en los listados por cursor
+const CURSOR_PAGE_LIMIT = 500;
+
 export abstract class BaseApi {
     protected getToken(): string {
         const token = localStorage.getItem("access_token");
@@ -5,4 +17,27 @@ export abstract class BaseApi {
             throw new Error("No hay token de autenticación");
         return token;
     }
+
+    // Recorre un listado por cursor página a página: cada respuesta queda acotada
+    protected async listAllPages<T>(path: string, errorMessage: string, params?: Record<string, string>): Promise<T[]> {
+        const token = this.getToken();
+        const items: T[] = [];
+        let cursor = "";
+        do {
+            const qs = new URLSearchParams({ ...params, cursor, limit: String(CURSOR_PAGE_LIMIT), count: "none" });
+            const res = await fetch(`${requireApiUrl()}${path}?${qs.toString()}`, {
+                headers: { Authorization: `Bearer ${token}` },
+            });
+            if (res.status === 401)
+                throw new Error("No autenticado");
+            if (res.status === 403)
+                throw new Error("No autorizado");
+            if (!res.ok)
+                throw new Error(errorMessage);
+            const page = (await res.json()) as CursorPage<T>;
+            items.push(...page.results);
+            cursor = page.next_cursor ?? "";
+        } while (cursor);
+        return items;
+    }
 }